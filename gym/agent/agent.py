@@ -4,7 +4,7 @@ import logging
 
 from gym.common.core import WorkerCore
 from gym.common.protobuf.gym_grpc import AgentBase
-from gym.common.protobuf.gym_pb2 import Instruction, Info
+from gym.common.protobuf.gym_pb2 import Instruction, Info, Health
 
 
 logger = logging.getLogger(__name__)
@@ -28,8 +28,17 @@ class Agent(AgentBase):
         reply = await self.core.info(request)
         await stream.send_message(reply)
 
+    async def Ready(self, stream):
+        request: Health = await stream.recv_message()
+        reply = await self.core.health(request)
+        await stream.send_message(reply)
+
     async def CallInstruction(self, stream):
         request: Instruction = await stream.recv_message()       
         reply = await self.core.instruction(request)
         await stream.send_message(reply)
 
+    async def StreamInstruction(self, stream):
+        request: Instruction = await stream.recv_message()
+        async for evaluation in self.core.stream_instruction(request):
+            await stream.send_message(evaluation)
@@ -1,7 +1,9 @@
+import time
 import logging
 from datetime import datetime
 
 from gym.common.tool import Tool
+from gym.common.readiness import backoff
 
 
 logger = logging.getLogger(__name__)
@@ -20,6 +22,22 @@ class Prober(Tool):
         Tool.__init__(self, id, name, parameters, metrics)
         self._type = "prober"
 
+    READY_TIMEOUT = 10
+
+    def unreachable(self, results):
+        """Checks if the results of a probe show its target
+        was not ready yet (e.g., a server not listening).
+        Must be extended by probers whose target is started by another
+        prober at the same time (e.g., iperf client and server).
+
+        Arguments:
+            results {dict} -- The output of the probe process
+
+        Returns:
+            bool -- If the probe must be retried
+        """
+        return False
+
     def probe(self, settings):
         opts = settings.get("opts")
         timeout = settings.get("timeout", None)
@@ -27,5 +45,19 @@ class Prober(Tool):
         cmd = [self._command, *opts]
         self._call = " ".join(cmd)
 
-        results = self._processor.start_process(self._call, timeout)
+        deadline = time.monotonic() + Prober.READY_TIMEOUT
+        delays = backoff()
+
+        results = self._processor.start_process(self._call, timeout, self._stop)
+
+        while self.unreachable(results) and time.monotonic() < deadline:
+            delay = next(delays)
+            logger.info(f"Probe target not ready - retrying in {delay}s")
+            if self._stop:
+                if self._stop.wait(delay):
+                    break
+            else:
+                time.sleep(delay)
+            results = self._processor.start_process(self._call, timeout, self._stop)
+
         return results
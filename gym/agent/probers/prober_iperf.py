@@ -1,5 +1,4 @@
 import logging
-import time
 from gym.common.defs import PROBER_IPERF
 from gym.agent.probers.prober import Prober
 
@@ -28,12 +27,12 @@ class ProberIperf(Prober):
             metrics=ProberIperf.METRICS,
         )
         self._command = "iperf"
+        self._client = False
 
     def options(self, options):
         opts = []
         timeout = None
-        if "-c" in options:
-            time.sleep(0.5)  # FIX
+        self._client = "-c" in options
 
         for k, v in options.items():
             # if k == "-s":
@@ -49,6 +48,13 @@ class ProberIperf(Prober):
         settings = {"opts": opts, "timeout": timeout}
         return settings
 
+    def unreachable(self, results):
+        if not self._client:
+            return False
+
+        output = f"{results.get('out', '')} {results.get('err', '')}"
+        return "connect failed" in output
+
     def parser(self, results):
         metrics, error = [], ""
 
@@ -1,5 +1,4 @@
 import logging
-import time
 import json
 from gym.common.defs import PROBER_IPERF3
 from gym.agent.probers.prober import Prober
@@ -46,7 +45,6 @@ class ProberIperf3(Prober):
 
         if server:
             opts.extend(["-c", server])
-            time.sleep(1)
 
         if not client or client == "false" or client == "False":
             opts.extend(["-s"])
@@ -79,6 +77,13 @@ class ProberIperf3(Prober):
         settings = {"opts": opts, "timeout": timeout}
         return settings
 
+    def unreachable(self, results):
+        if self._server:
+            return False
+
+        output = f"{results.get('out', '')} {results.get('err', '')}"
+        return "unable to connect to server" in output
+
     def parser(self, results):
         metrics, error = [], ""
 
@@ -7,8 +7,8 @@ from google.protobuf import json_format
 from grpclib.client import Channel
 from grpclib.exceptions import GRPCError
 
-from gym.common.protobuf.gym_grpc import PlayerStub
-from gym.common.protobuf.gym_pb2 import Info, Layout
+from gym.common.protobuf.gym_grpc import PlayerStub, InfraStub
+from gym.common.protobuf.gym_pb2 import Info, Layout, Health
 
 
 logger = logging.getLogger(__name__)
@@ -56,6 +56,32 @@ class GymInterface:
         finally:
             return reply, error
 
+    async def ready(self, component):
+        """Probes the readiness of a gym component
+        using the Ready gRPC service call
+
+        Arguments:
+            component {tuple} -- (string, string) The name of
+            the component (player or infra) and its address (ip:port)
+
+        Returns:
+            bool -- If the component replied it is ready
+        """
+        stubs = {
+            "player": PlayerStub,
+            "infra": InfraStub,
+        }
+
+        name, address = component
+        ip, port = address.split(":")
+        channel = Channel(ip, port)
+        stub = stubs.get(name)(channel)
+
+        reply, error = await self.call_stub(stub.Ready, Health())
+
+        channel.close()
+        return reply.get("ready", False)
+
 
 class GymPlayerInterface(GymInterface):
     def __init__(self):
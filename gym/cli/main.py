@@ -10,6 +10,7 @@ from prompt_toolkit.styles import Style
 from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
 
 from gym.common.vnfbr import VNFBR
+from gym.common.readiness import wait_ready
 from gym.cli.interfaces import GymPlayerInterface
 from gym.cli.output import print_cli, format_text
 
@@ -218,6 +219,24 @@ class CLIRunner:
         )
         self.proxy.start(self._infra_info)
 
+    async def components_ready(self):
+        """Waits for the components started by
+        begin_components to reply they are ready
+
+        Returns:
+            bool -- If all the components are ready
+        """
+        components = [
+            (info.get("name"), info.get("address"))
+            for info in [self._player_info, self._infra_info]
+        ]
+        not_ready = await wait_ready(self.gymplayer_interface.ready, components)
+
+        for name, address in not_ready:
+            print_cli(f"gym-{name} not ready at {address}", style="warning")
+
+        return not not_ready
+
     def end_components(self):
         logger.info(f"End components")
         self.proxy.stop(self._player_info)
@@ -263,7 +282,7 @@ class CLIRunner:
         logger.info(f"begin triggered")
 
         self.begin_components()
-        await asyncio.sleep(3)
+        await self.components_ready()
 
         print_cli(f"Beginning", style="attention")
 
@@ -98,6 +98,9 @@ class Config:
                     "address": _address,
                     "contacts": _contacts,
                     "debug": self.cfg.debug,
+                    "concurrency": self.cfg.concurrency,
+                    "retention": self.cfg.retention,
+                    "capacity": self.cfg.capacity,
                 }
                 # print(f"App cfg args OK: id {_id} - address {_address}")
                 return info
@@ -147,6 +150,30 @@ class Config:
             help="Define the app logging mode (default: False)",
         )
 
+        self.parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Define the amount of vnf-bd instances a player "
+            "runs concurrently (default: 1)",
+        )
+
+        self.parser.add_argument(
+            "--retention",
+            type=float,
+            default=None,
+            help="Define the seconds of samples a monitor keeps "
+            "for each listener source (default: 300)",
+        )
+
+        self.parser.add_argument(
+            "--capacity",
+            type=int,
+            default=None,
+            help="Define the maximum amount of samples a monitor keeps "
+            "for each listener source (default: 6000)",
+        )
+
         self.cfg, _ = self.parser.parse_known_args(argv)
         info = self.check()
 
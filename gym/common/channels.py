@@ -0,0 +1,155 @@
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+from grpclib.client import Channel
+from grpclib.exceptions import GRPCError
+
+from gym.common.protobuf.gym_pb2 import Health
+
+
+logger = logging.getLogger(__name__)
+
+
+class Channels:
+    """Pool of gRPC channels indexed by address (host:port).
+    A channel (i.e., its HTTP/2 connection) is reused by all the calls
+    to the same address, e.g., across all the trials of a task and
+    all the tests of a VNF-BR.
+    Channels not used for idle seconds are evicted, and channels
+    not used for probe seconds are health checked (i.e., with a Ready
+    call) before being reused, being replaced by a new one if the
+    peer can not be reached. Channels that failed to connect are
+    discarded, so the next call opens a new one; a discarded channel
+    is closed only when the calls still using it finish.
+    """
+
+    PROBE_TIMEOUT = 5
+
+    def __init__(self, idle=300, probe=30):
+        self._idle = idle
+        self._probe = probe
+        self._channels = {}
+
+    def _address(self, host, port):
+        return f"{host}:{port}"
+
+    def _evict(self):
+        """Closes and removes the channels that are not
+        being used and were idle for more than self._idle seconds
+        """
+        now = time.monotonic()
+
+        idle_addresses = [
+            address
+            for address, entry in self._channels.items()
+            if entry.get("users") == 0 and now - entry.get("used") > self._idle
+        ]
+
+        for address in idle_addresses:
+            logger.debug(f"Evicting idle channel to {address}")
+            entry = self._channels.pop(address)
+            entry.get("channel").close()
+
+    def _open(self, host, port):
+        address = self._address(host, port)
+        logger.debug(f"Opening channel to {address}")
+        entry = {"channel": Channel(host, port), "users": 0, "used": time.monotonic()}
+        self._channels[address] = entry
+        return entry
+
+    async def _healthy(self, entry, stub):
+        """Probes a channel with a Ready call, i.e., a
+        GRPCError reply still means the peer was reached
+
+        Arguments:
+            entry {dict} -- The entry of the channel in the pool
+            stub {callable} -- Builds the stub of the peer from a channel
+
+        Returns:
+            bool -- If the peer was reached through the channel
+        """
+        try:
+            await asyncio.wait_for(
+                stub(entry.get("channel")).Ready(Health()), Channels.PROBE_TIMEOUT
+            )
+        except GRPCError:
+            return True
+        except (OSError, asyncio.TimeoutError) as e:
+            logger.debug(f"Channel probe failed - exception {repr(e)}")
+            return False
+
+        return True
+
+    @asynccontextmanager
+    async def connect(self, host, port, stub=None):
+        """Provides the pooled channel to host:port,
+        creating it if it does not exist yet, or if it was idle
+        for more than self._probe seconds and its probe failed
+
+        Arguments:
+            host {string} -- IP address of the peer
+            port {string} -- Port of the peer
+
+        Keyword Arguments:
+            stub {callable} -- Builds the stub of the peer from a channel,
+            used to probe idle channels, not probed if None (default: {None})
+
+        Yields:
+            Channel -- A grpclib channel to host:port
+        """
+        self._evict()
+
+        address = self._address(host, port)
+        entry = self._channels.get(address)
+
+        if not entry:
+            entry = self._open(host, port)
+
+        elif stub and entry.get("users") == 0:
+            if time.monotonic() - entry.get("used") > self._probe:
+                entry["users"] += 1
+                healthy = await self._healthy(entry, stub)
+                entry["users"] -= 1
+
+                if not healthy:
+                    self.discard(host, port)
+                    entry = self._channels.get(address) or self._open(host, port)
+
+        entry["users"] += 1
+
+        try:
+            yield entry.get("channel")
+        finally:
+            entry["users"] -= 1
+            entry["used"] = time.monotonic()
+
+            if entry.get("stale") and entry.get("users") == 0:
+                entry.get("channel").close()
+
+    def discard(self, host, port):
+        """Removes the channel to host:port from the pool,
+        used when a call could not reach the address (i.e., the
+        channel is not healthy), closing it if no other call uses it
+
+        Arguments:
+            host {string} -- IP address of the peer
+            port {string} -- Port of the peer
+        """
+        address = self._address(host, port)
+        entry = self._channels.pop(address, None)
+
+        if entry:
+            logger.debug(f"Discarding channel to {address}")
+            entry["stale"] = True
+
+            if entry.get("users") == 0:
+                entry.get("channel").close()
+
+    def close(self):
+        """Closes all the channels in the pool"""
+        for entry in self._channels.values():
+            entry.get("channel").close()
+
+        self._channels = {}
@@ -1,14 +1,21 @@
 import json
+import random
+import functools
+import itertools
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from grpclib.client import Channel
+from grpclib.const import Status as GRPCStatus
 from grpclib.exceptions import GRPCError
 
 from google.protobuf import json_format
 
 from gym.common.status import Status
+from gym.common.channels import Channels
+from gym.common.diff import Diff
+from gym.common.readiness import backoff, wait_ready
+from gym.common.scheduler import Scheduler
 from gym.common.tools import Tools
 
 from gym.common.protobuf.gym_grpc import (
@@ -25,7 +32,9 @@ from gym.common.protobuf.gym_pb2 import (
     Instruction,
     Action,
     Snapshot,
+    Evaluation,
     Info,
+    Health,
     Deploy,
 )
 
@@ -38,9 +47,36 @@ logger = logging.getLogger(__name__)
 
 
 class Core:
+    GREET_CONCURRENCY = 16
+    GREET_TIMEOUT = 10
+    GREET_RETRIES = 3
+
     def __init__(self, info):
         self.status = Status(info)
-        asyncio.create_task(self.greet(info, startup=True))
+        self.channels = Channels()
+        self.ready = asyncio.Event()
+        asyncio.create_task(self.startup(info))
+
+    async def prepare(self, info):
+        """Prepares the component before it can be greeted
+        and greet its contacts (e.g., load tools).
+        Must be extended by child classes if needed.
+
+        Arguments:
+            info {dict} -- Set of information of the component
+        """
+        pass
+
+    async def startup(self, info):
+        """Prepares the component, sets it as ready
+        and then greets its contacts
+
+        Arguments:
+            info {dict} -- Set of information of the component
+        """
+        await self.prepare(info)
+        self.ready.set()
+        await self.greet(info, startup=True)
 
     async def _reach(self, stub, contacts=[]):
         """Reaches a stub using the Greet gRPC service call
@@ -68,6 +104,8 @@ class Core:
             for contact in contacts:
                 info.contacts.append(contact)
 
+        info_reply = {}
+
         try:
             reply = await stub.Greet(info)
             info_reply = json_format.MessageToDict(
@@ -77,15 +115,12 @@ class Core:
         except GRPCError as e:
             logger.info(f"Error in reaching: Greet Info")
             logger.debug(f"Exception in Greet: {e}")
-            info_reply = {}
 
         except OSError as e:
             logger.info(f"Could not reach channel for Greet Info")
             logger.debug(f"Exception: {e}")
-            info_reply = {}
 
-        finally:
-            return info_reply
+        return info_reply
 
     async def _contact(self, role, host, port, contacts=[]):
         """Establishes the contact with a remote peer having
@@ -100,6 +135,9 @@ class Core:
         Keyword Arguments:
             contacts {list} -- List of contacts the peer being contact
             must also greet and retrieve info (default: {[]})
+
+        Returns:
+            bool -- If the peer was contacted and added to the peers
         """
         stubs = {
             "agent": AgentStub,
@@ -108,28 +146,73 @@ class Core:
             "player": PlayerStub,
         }
 
-        channel = Channel(host, port)
         stub_class = stubs.get(role, None)
 
         if stub_class:
             logger.info(f"Contacting {role} at {host}:{port}")
-            stub = stub_class(channel)
-            info = await self._reach(stub, contacts)
+
+            async with self.channels.connect(host, port, stub_class) as channel:
+                stub = stub_class(channel)
+                info = await self._reach(stub, contacts)
 
             if info:
                 self.status.add_peer(info)
-            else:
-                logger.info(f"Could not contact {host}:{port}")
+                return True
+
+            logger.info(f"Could not contact {host}:{port}")
+            self.channels.discard(host, port)
         else:
             logger.info(f"Could not contact role {role} - " f"no stub/client available")
 
-        channel.close()
+        return False
+
+    async def _greet_contact(self, contact, contacts=[]):
+        """Greets a contact with a deadline of GREET_TIMEOUT
+        seconds per attempt, retrying up to GREET_RETRIES attempts
+        with jittered exponential backoff between them
+
+        Arguments:
+            contact {string} -- A contact in the format role/host:port
+
+        Keyword Arguments:
+            contacts {list} -- List of contacts the peer being contact
+            must also greet and retrieve info (default: {[]})
+
+        Returns:
+            bool -- If the contact was greeted
+        """
+        role, address = contact.split("/")
+        host, port = address.split(":")
+        delays = backoff()
+
+        # A contact asked to greet other contacts replies only after
+        # its own greetings (and their retries) finish
+        timeout = Core.GREET_TIMEOUT
+        if contacts:
+            timeout = Core.GREET_TIMEOUT * (Core.GREET_RETRIES + 1)
+
+        for attempt in range(1, Core.GREET_RETRIES + 1):
+            try:
+                greeted = await asyncio.wait_for(
+                    self._contact(role, host, port, contacts), timeout
+                )
+            except asyncio.TimeoutError:
+                logger.info(f"Greeting {contact} timed out - attempt {attempt}")
+                self.channels.discard(host, port)
+                greeted = False
+
+            if greeted or attempt == Core.GREET_RETRIES:
+                break
+
+            await asyncio.sleep(random.uniform(0, next(delays)))
+
+        return greeted
 
     async def greet(self, info, startup=False):
         """Establishes peering with a contact (another gym component)
         that has the provided fields defined by the info param
-        At startup waits a bit so agent/monitor can load its tools
-        before greetings.
+        At startup it is called only after the component is ready
+        (i.e., agent/monitor loaded its tools).
 
         Arguments:
             info {dict} -- Set of information that enables a contact
@@ -139,27 +222,43 @@ class Core:
             startup {bool} -- A flag that signs if the App is
             in startup mode. This function can be called to reach
             contacts in run-time too. (default: {False})
-        """
-        if startup:
-            await asyncio.sleep(0.5)
 
+        Returns:
+            dict -- The lists of contacts greeted and failed
+        """
         contacts = info.get("contacts")
         allowed_contacts = self.status.allows(contacts)
+        summary = {"greeted": [], "failed": []}
 
         if allowed_contacts:
             logger.info(f"Greeting contacts: {allowed_contacts}")
 
-            for contact in allowed_contacts:
-                role, address = contact.split("/")
-                host, port = address.split(":")
-                contacts_peers = info.get("peers")
-                await self._contact(role, host, port, contacts_peers)
+            contacts_peers = info.get("peers")
+            semaphore = asyncio.Semaphore(Core.GREET_CONCURRENCY)
+
+            async def greet_contact(contact):
+                async with semaphore:
+                    return await self._greet_contact(contact, contacts_peers)
+
+            greetings = await asyncio.gather(
+                *[greet_contact(contact) for contact in allowed_contacts]
+            )
+
+            for contact, greeted in zip(allowed_contacts, greetings):
+                summary["greeted" if greeted else "failed"].append(contact)
+
+            logger.info(
+                f"Greetings: {len(summary['greeted'])} greeted, "
+                f"{len(summary['failed'])} failed {summary['failed']}"
+            )
         else:
             logger.info(f"No greetings, contacts empty: {allowed_contacts}")
 
         if startup:
             logger.info(f"Ready!")
 
+        return summary
+
     async def info(self, message):
         """This function is called every time a gym component
         receives an Info gRPC service call. So it adds the peer to its
@@ -176,12 +275,15 @@ class Core:
         Returns:
             Info -- An Info type of gRPC message containing the profile
             information of this peer to be sent to the other peer.
+        The reply waits until this peer is ready, so its profile
+        contains all its artifacts (e.g., tools info).
         """
         logger.info("Received Info")
         logger.debug(f"{json_format.MessageToJson(message)}")
         info = json_format.MessageToDict(message, preserving_proto_field_name=True)
 
         await self.greet(info)
+        await self.ready.wait()
 
         self.status.add_peer(info)
         reply = Info()
@@ -193,6 +295,62 @@ class Core:
 
         return reply
 
+    async def health(self, message):
+        """This function is called every time a gym component
+        receives a Ready gRPC service call. It replies right away
+        (i.e., it does not wait for the component to be ready),
+        so peers can probe its readiness instead of waiting fixed delays.
+
+        Arguments:
+            message {Health} -- A Health type of gRPC message
+
+        Returns:
+            Health -- A Health type of gRPC message containing the
+            uuid and role of this peer, and if it is ready
+        """
+        reply = Health(
+            uuid=self.status.uuid, role=self.status.role, ready=self.ready.is_set(),
+        )
+        return reply
+
+    async def probe(self, contact):
+        """Probes the readiness of a contact using
+        the Ready gRPC service call
+
+        Arguments:
+            contact {string} -- A contact in the format role/host:port
+
+        Returns:
+            bool -- If the contact replied it is ready
+        """
+        stubs = {
+            "agent": AgentStub,
+            "monitor": MonitorStub,
+            "manager": ManagerStub,
+            "player": PlayerStub,
+        }
+
+        role, address = contact.split("/")
+        host, port = address.split(":")
+        stub_class = stubs.get(role, None)
+        ready = False
+
+        if stub_class:
+            try:
+                async with self.channels.connect(host, port) as channel:
+                    stub = stub_class(channel)
+                    reply = await stub.Ready(Health())
+                    ready = reply.ready
+
+            except GRPCError as e:
+                logger.debug(f"Exception in Ready: {e}")
+
+            except OSError as e:
+                logger.debug(f"Could not reach {contact} for Ready: {e}")
+                self.channels.discard(host, port)
+
+        return ready
+
 
 class WorkerCore(Core):
     """It is the base class of Agent and Monitor.
@@ -205,11 +363,19 @@ class WorkerCore(Core):
         with each other exchanging Info messages)
     """
 
-    def __init__(self, info):
-        self.tools = Tools()
-        asyncio.create_task(self.load_tools(info))
+    def __init__(self, info, tools=None):
+        self.tools = tools or Tools()
         Core.__init__(self, info)
 
+    async def prepare(self, info):
+        """Loads the tools before the worker is ready
+
+        Arguments:
+            info {dict} -- Contains the role and the folder
+            of the tools of the Agent/Monitor
+        """
+        await self.load_tools(info)
+
     def _build_cfg(self, info):
         """Build the dict config that enables
         the tools (probers or listeners) to be loaded
@@ -330,6 +496,24 @@ class WorkerCore(Core):
         snapshot = json_format.ParseDict(snap, snapshot)
         return snapshot
 
+    def deadline(self, message):
+        """Gets the start deadline of an Instruction, i.e.,
+        the wall-clock instant when all its actions must start
+
+        Arguments:
+            message {Instruction} -- A Instruction gRPC message
+
+        Returns:
+            float -- Epoch time (seconds) of the start deadline,
+            or None if the instruction does not contain it
+        """
+        deadline = None
+
+        if message.HasField("start"):
+            deadline = message.start.ToMicroseconds() / 1e6
+
+        return deadline
+
     async def instruction(self, message):
         """This function is called when a Instruction
         gRPC service call is made to an Agent/Monitor.
@@ -350,18 +534,70 @@ class WorkerCore(Core):
         )
 
         actions = instruction.get("actions")
-        results = await self.tools.handle(actions)
+        deadline = self.deadline(message)
+        results = await self.tools.handle(actions, deadline)
         snapshot = self.snapshot(instruction, results)
 
         logger.info(f"Replying Snapshot")
         logger.debug(f"{json_format.MessageToJson(snapshot)}")
         return snapshot
 
+    def evaluation(self, result):
+        """Builds an Evaluation (gRPC message) based on
+        a single result of a tool running an action
+
+        Arguments:
+            result {dict} -- Output of a tool running an action
+            (i.e., a single repetition of it)
+
+        Returns:
+            Evaluation -- A gRPC Evaluation message, containing
+            the error of parsing the result if it was not possible
+        """
+        evaluation = Evaluation(id=result.get("id"))
+
+        try:
+            evaluation = json_format.ParseDict(result, Evaluation())
+        except json_format.ParseError as e:
+            logger.info(f"Could not parse evaluation {result.get('id')}")
+            evaluation.error = repr(e)
+
+        return evaluation
+
+    async def stream_instruction(self, message):
+        """This function is called when a StreamInstruction
+        gRPC service call is made to an Agent/Monitor.
+        It executes the Instruction actions using the tools
+        available, yielding the evaluations of each action as soon
+        as they are obtained.
+
+        Arguments:
+            message {Instruction} -- A Instruction gRPC message
+
+        Yields:
+            Evaluation -- A Evaluation gRPC message
+        """
+        logger.info("Received Instruction (stream)")
+        logger.debug(f"{json_format.MessageToJson(message)}")
+
+        instruction = json_format.MessageToDict(
+            message, preserving_proto_field_name=True
+        )
+
+        actions = instruction.get("actions")
+        deadline = self.deadline(message)
+
+        async for result in self.tools.stream(actions, deadline):
+            evaluation = self.evaluation(result)
+            logger.info(f"Streaming Evaluation {evaluation.id}")
+            yield evaluation
+
 
 class ManagerCore(Core):
     def __init__(self, info):
         Core.__init__(self, info)
         self.instructions_ids = 1001
+        self.start_lead = 1.0
 
     def actions(self, instruction, req_tools):
         """Build the set of actions inside a intruction
@@ -528,6 +764,30 @@ class ManagerCore(Core):
 
         return instructions, all_instructions_ok
 
+    def _stub(self, role, channel):
+        """Builds the stub of an agent/monitor peer
+
+        Arguments:
+            role {string} -- The role of the peer being called
+            (i.e., agent or monitor)
+            channel {Channel} -- The channel to the peer
+
+        Raises:
+            Exception: If there is no stub/client available for role
+
+        Returns:
+            AgentStub/MonitorStub -- The stub of the peer
+        """
+        if role == "agent":
+            stub = AgentStub(channel)
+        elif role == "monitor":
+            stub = MonitorStub(channel)
+        else:
+            logger.info(f"Could not contact role {role} - no stub/client available")
+            raise (Exception(f"No stub/client available for {role}"))
+
+        return stub
+
     async def call_peer(self, role, address, instruction):
         """Performs the call of a instruction in a agent/monitor
         peer.
@@ -547,51 +807,95 @@ class ManagerCore(Core):
         reply = Snapshot(id=instruction.id)
 
         host, port = address.split(":")
-        channel = Channel(host, port)
 
-        if role == "agent":
-            stub = AgentStub(channel)
-        elif role == "monitor":
-            stub = MonitorStub(channel)
-        else:
-            stub = None
-            logger.info(f"Could not contact role {role} - no stub/client available")
-            raise (Exception(f"No stub/client available for {role}"))
+        async with self.channels.connect(
+            host, port, functools.partial(self._stub, role)
+        ) as channel:
+            stub = self._stub(role, channel)
+
+            try:
+                reply = await stub.CallInstruction(instruction)
+
+            except GRPCError as e:
+                logger.info(f"Error in instruction call at {address}")
+                logger.debug(f"Exception: {repr(e)}")
+                raise (e)
+
+            except OSError as e:
+                logger.info(f"Could not open channel for instruction call at {address}")
+                logger.debug(f"Exception: {repr(e)}")
+                self.channels.discard(host, port)
+                raise (e)
+
+        return reply
+
+    async def stream_peer(self, role, address, instruction, snapshot):
+        """Performs the streaming call of a instruction in a agent/monitor
+        peer, folding each Evaluation received into the snapshot as soon
+        as it arrives. If the peer does not implement the streaming call,
+        it falls back to the (unary) instruction call.
+
+        Arguments:
+            role {string} -- The role of the peer being called
+            (i.e., agent or monitor)
+            address {string} -- The address (ip:port) of the peer
+            being called
+            instruction {Instruction} -- A gRPC message of type Instruction
+            snapshot {Snapshot} -- A gRPC message of type Snapshot where
+            the evaluations are added into
+        """
+        host, port = address.split(":")
 
         try:
-            reply = await stub.CallInstruction(instruction)
+            async with self.channels.connect(
+                host, port, functools.partial(self._stub, role)
+            ) as channel:
+                stub = self._stub(role, channel)
+
+                async with stub.StreamInstruction.open() as stream:
+                    await stream.send_message(instruction, end=True)
+                    evaluation = await stream.recv_message()
+
+                    while evaluation is not None:
+                        logger.debug(
+                            f"Evaluation {evaluation.id} received from {address}"
+                        )
+                        snapshot.evaluations[evaluation.id].CopyFrom(evaluation)
+                        evaluation = await stream.recv_message()
 
         except GRPCError as e:
-            logger.info(f"Error in instruction call at {address}")
-            logger.debug(f"Exception: {repr(e)}")
-            raise (e)
+            if e.status is not GRPCStatus.UNIMPLEMENTED:
+                logger.info(f"Error in instruction stream at {address}")
+                logger.debug(f"Exception: {repr(e)}")
+                raise (e)
+
+            logger.info(f"No instruction stream at {address} - calling instruction")
+            reply = await self.call_peer(role, address, instruction)
+            snapshot.MergeFrom(reply)
 
         except OSError as e:
-            logger.info(f"Could not open channel for instruction call at {address}")
+            logger.info(f"Could not open channel for instruction stream at {address}")
             logger.debug(f"Exception: {repr(e)}")
+            self.channels.discard(host, port)
             raise (e)
 
-        channel.close()
-        return reply
-
-    async def call_instructions(self, instructions, peers):
+    async def call_instructions(self, instructions, peers, report):
         """Schedule and calls all the instructions in the proper
-        set of peers.
-        Not necessarily returns all the snapshots obtained from the
-        execution of instructions. As a Instruction might trigger an
-        exception, only returns the set of snapshots correctly obtained
+        set of peers, folding the evaluations streamed by them into
+        the snapshots of the report as they are received.
+        As a Instruction might trigger an exception, the snapshot of
+        such instruction contains the error.
 
         Arguments:
             instructions {dict} -- Set of instructions (indexed by the peer uuid
             where it must be called) to be executed on remote peers
             peers {dict} -- Set of peers where instructions must be executed
+            report {Report} -- A gRPC message of type Report
 
         Returns:
-            list -- Set of snapshots obtained from the execution of
-            instructions
+            bool -- If all the instructions were executed successfully
         """
         logger.info(f"Calling instructions")
-        snapshots = []
         coros = []
 
         for uuid, instruction in instructions.items():
@@ -602,69 +906,70 @@ class ManagerCore(Core):
                 f"Scheduled instruction call on: {role} uuid {uuid} at {address}"
             )
 
-            aw = self.call_peer(role, address, instruction)
+            snapshot = report.snapshots[instruction.id]
+            snapshot.id = instruction.id
+            snapshot.trial = instruction.trial
+            snapshot.origin.id = uuid
+            snapshot.origin.role = role
+
+            aw = self.stream_peer(role, address, instruction, snapshot)
             coros.append(aw)
 
         logger.info(f"Calling all instructions")
-        snaps = await asyncio.gather(*coros, return_exceptions=True)
-        peer_uuids = list(instructions.keys())
+        outputs = await asyncio.gather(*coros, return_exceptions=True)
+        acks = []
 
         logger.info(f"Validating snapshots")
-        for snap in snaps:
-            snap_index = snaps.index(snap)
-            uuid = peer_uuids[snap_index]
+        for uuid, output in zip(instructions.keys(), outputs):
+            instruction = instructions[uuid]
+            snapshot = report.snapshots[instruction.id]
 
-            if isinstance(snap, Exception):
-                instruction = instructions[uuid]
+            if isinstance(output, Exception):
                 logger.info(f"Snapshot fail from uuid {uuid}")
-                logger.debug(f"Exception: {repr(snap)}")
+                logger.debug(f"Exception: {repr(output)}")
                 logger.debug(f"Instruction: {instruction}")
-
-                snapshot_err = Snapshot(
-                    id=instruction.id, trial=instruction.trial, error=repr(snap)
-                )
-                snapshots.append(snapshot_err)
+                snapshot.error = repr(output)
+                acks.append(False)
             else:
                 logger.info(f"Snapshot ok from uuid {uuid}")
-                snapshots.append(snap)
+                acks.append(True)
+
+            if not snapshot.HasField("timestamp"):
+                snapshot.timestamp.FromDatetime(datetime.now())
 
-        return snapshots
+        return all(acks)
 
-    async def trial(self, trial, instructions, peers):
+    async def trial(self, trial, instructions, peers, report):
         """Run a single trial - Calls all the instructions
-        needed for a trial in the particular peers
+        needed for a trial in the particular peers.
+        All the instructions carry the same start deadline
+        (self.start_lead seconds from now), so probers and listeners
+        in all peers start their actions at the same instant
 
         Arguments:
             trial {int} -- Number of the trial being execute
             instructions {dict} -- Set of instructions to be called
             peers {dict} -- Set of peers that instructions will be called
             indexed by uuid
+            report {Report} -- A gRPC message of type Report
+            where the snapshots of the trial are added into
 
         Returns:
-            tuple -- (list, bool) A list of Snapshots obtained from
-            running the instructions, and a bool indicating if all
-            the snapshots were obtained from the instructions called
+            bool -- If all the snapshots were obtained from the
+            instructions called
         """
-
-        instruction_ids = []
+        start = datetime.utcnow() + timedelta(seconds=self.start_lead)
 
         for intruction in instructions.values():
             intruction.id = self.instructions_ids
             intruction.trial = trial
-            instruction_ids.append(self.instructions_ids)
+            intruction.start.FromDatetime(start)
             self.instructions_ids += 1
 
-        trial_snapshots = await self.call_instructions(instructions, peers)
-
-        snap_ids = [snap.id for snap in trial_snapshots]
-        snaps_ack = [
-            True if inst_id in snap_ids else False for inst_id in instruction_ids
-        ]
-        snaps_status = all(snaps_ack)
+        snaps_status = await self.call_instructions(instructions, peers, report)
+        return snaps_status
 
-        return trial_snapshots, snaps_status
-
-    async def trials(self, trials, instructions, peers):
+    async def trials(self, trials, instructions, peers, report):
         """Runs all the trials needed for a set of instructions
         in the selected peers
 
@@ -674,42 +979,20 @@ class ManagerCore(Core):
             sent for each peer, indexed by the peer uuid
             peers {dict} -- Set of peers identities indexed
             by uuid, to which the instructions are sent
-
-        Returns:
-            list -- Set of snapshots obtained from running
-            each trial, and its instructions
+            report {Report} -- A gRPC message of type Report
+            where the snapshots of all trials are added into
         """
-        snapshots = []
-
         for trial in range(1, trials + 1):
             logger.info(f"Trial: {trial} of total {trials}")
 
-            trial_snapshots, snaps_status = await self.trial(trial, instructions, peers)
+            snaps_status = await self.trial(trial, instructions, peers, report)
 
             if snaps_status:
                 logger.info(f"All instructions successfull in trial {trial}")
             else:
                 logger.info(f"Failed instructions in trial {trial}")
 
-            snapshots.extend(trial_snapshots)
-
         logger.info(f"Finished trials: {trials}")
-        return snapshots
-
-    def report(self, report, snapshots):
-        """Adds a set of snapshots into a report
-
-        Arguments:
-            report {Report} -- A gRPC message of type Report
-            snapshots {list} -- A set of gRPC messages of type
-            Snapshot
-        """
-        logger.info(f"Building report {report.id} in test {report.test}")
-
-        for snap in snapshots:
-            logger.info(f"Parsing snapshot id {snap.id} into report")
-            report_snap = report.snapshots.get_or_create(snap.id)
-            report_snap.CopyFrom(snap)
 
     async def task(self, task):
         """Function called when a task gRPC service call
@@ -744,8 +1027,7 @@ class ManagerCore(Core):
             logger.info(f"Executing trials for task {task.id} - trials {trials}")
             peers = {**agents_peers, **monitors_peers}
             instructions = {**agents_instructions, **monitors_instructions}
-            snapshots = await self.trials(trials, instructions, peers)
-            self.report(report, snapshots)
+            await self.trials(trials, instructions, peers, report)
         else:
             logger.info(
                 f"Test not executed - instructions not ok for agents {ai_ok} and/or monitors {mi_ok}"
@@ -763,6 +1045,10 @@ class ManagerCore(Core):
 class PlayerCore(Core):
     def __init__(self, info):
         Core.__init__(self, info)
+        self.concurrency = info.get("concurrency") or 1
+        self.diff = Diff()
+        self.deployments = {}
+        self.deploy_ids = itertools.count(1)
 
     async def updateGreetings(self, info_str, vnfbd):
         """Calls the greet method from the base Core class
@@ -787,8 +1073,14 @@ class PlayerCore(Core):
             contacts = []
 
         logger.debug(f"Contacts: {contacts}")
+        vnfbd.set_peers(contacts)
 
         if contacts:
+            not_ready = await wait_ready(self.probe, contacts)
+
+            if not_ready:
+                logger.info(f"Contacts not ready for greetings: {not_ready}")
+
             greet_info = {
                 "contacts": contacts,
                 "peers": contacts,
@@ -798,14 +1090,14 @@ class PlayerCore(Core):
             logger.info(f"No contacts for greetings in scenario deployed")
             logger.debug(f"{info}")
 
-    async def call_scenario(self, command, test, vnfbd):
+    async def call_scenario(self, command, deploy_id, vnfbd):
         """Calls a scenario deployment in the gym-infra component
 
         Arguments:
             command {string} -- Defines if the scenario being
             called must be in mode start or stop
-            test {int} -- The number of the test case that identifies
-            that scenario deployment
+            deploy_id {int} -- The id that identifies that scenario
+            deployment (unique for each vnfbd instance)
             vnfbd {VNFBD} -- A VNFBD object instance from which
             the scenario will be extracted to be deployed
 
@@ -813,7 +1105,7 @@ class PlayerCore(Core):
             bool -- If the scenario was deployed correctly/successfuly
             or not
         """
-        logger.info(f"Calling test {test} scenario - {command}")
+        logger.info(f"Calling deploy {deploy_id} scenario - {command}")
 
         environment = vnfbd.environment()
         env_orchestrator = environment.get("orchestrator")
@@ -822,7 +1114,7 @@ class PlayerCore(Core):
         host, port = address.split(":")
 
         deploy_dict = {
-            "id": test,
+            "id": deploy_id,
             "workflow": command,
             "scenario": vnfbd.scenario(),
             "environment": environment,
@@ -830,9 +1122,9 @@ class PlayerCore(Core):
         deploy = json_format.ParseDict(deploy_dict, Deploy())
 
         try:
-            channel = Channel(host, port)
-            stub = InfraStub(channel)
-            built = await stub.Run(deploy)
+            async with self.channels.connect(host, port, InfraStub) as channel:
+                stub = InfraStub(channel)
+                built = await stub.Run(deploy)
 
         except GRPCError as e:
             logger.info(f"Error in scenario deployment")
@@ -842,10 +1134,11 @@ class PlayerCore(Core):
         except OSError as e:
             logger.info(f"Error in channel for scenario deployment")
             logger.debug(f"{e}")
+            self.channels.discard(host, port)
             ack = False
 
         else:
-            if built.error:
+            if built.error or built.ack != "True":
                 ack = False
                 logger.info(f"Scenario deployed error: {built.error}")
             else:
@@ -855,8 +1148,6 @@ class PlayerCore(Core):
                 info = built.info
                 info = info.decode("utf-8")
                 await self.updateGreetings(info, vnfbd)
-        finally:
-            channel.close()
 
         return ack
 
@@ -884,13 +1175,13 @@ class PlayerCore(Core):
         peer = peers.get(uuid)
         address = peer.get("address")
         host, port = address.split(":")
-        channel = Channel(host, port)
 
         report_msg = Report(id=task.id, test=task.test)
 
         try:
-            stub = ManagerStub(channel)
-            report_msg = await stub.CallTask(task)
+            async with self.channels.connect(host, port, ManagerStub) as channel:
+                stub = ManagerStub(channel)
+                report_msg = await stub.CallTask(task)
 
         except GRPCError as e:
             logger.info(f"Error in task call")
@@ -900,6 +1191,7 @@ class PlayerCore(Core):
         except OSError as e:
             logger.info(f"Error in channel for task call")
             logger.debug(f"{repr(e)}")
+            self.channels.discard(host, port)
             report_msg = Report(id=task.id, test=task.test, error=repr(e))
 
         else:
@@ -908,7 +1200,6 @@ class PlayerCore(Core):
         finally:
             logger.debug(f"{json_format.MessageToJson(report_msg)}")
             report = json_format.MessageToDict(report_msg)
-            channel.close()
 
         return report
 
@@ -933,6 +1224,19 @@ class PlayerCore(Core):
         uuid, task_template = None, None
         managers_peers = self.status.get_peers("role", "manager")
 
+        deployed_managers = [
+            contact.split("/")[1]
+            for contact in vnfbd.peers()
+            if contact.startswith("manager/")
+        ]
+
+        if deployed_managers:
+            managers_peers = {
+                manager_uuid: manager
+                for manager_uuid, manager in managers_peers.items()
+                if manager.get("address") in deployed_managers
+            }
+
         for manager_uuid, manager in managers_peers.items():
             apparatus = manager.get("apparatus")
             vnfbd_task_template = vnfbd.build_task(apparatus)
@@ -985,9 +1289,79 @@ class PlayerCore(Core):
 
         return report
 
-    async def scenario(self, test, vnfbd_instance, previous_deployment, action):
+    async def deploy(self, test, vnfbd_instance, address, deploy_id):
+        """Deploys the scenario of a vnfbd instance in an infra that
+        hosts a single scenario at a time, reusing the scenario deployed
+        in that infra (e.g., by the previous test or vnfbd instance)
+        if it is equal, or updating it with the deltas if they differ
+
+        Arguments:
+            test {int} -- The number of the test
+            vnfbd_instance {VNFBD} -- A VNFBD object instance
+            address {string} -- The address of the infra
+            deploy_id {int} -- The deploy id of the vnfbd instance
+
+        Returns:
+            bool -- If the vnfbd instance scenario is deployed or not
+        """
+        deployment = self.deployments.get(address)
+
+        if deployment:
+            delta = self.diff.compare(
+                deployment.get("scenario"), vnfbd_instance.scenario()
+            )
+
+            if self.diff.empty(delta):
+                logger.info(f"Reusing deployed scenario for test {test}")
+                vnfbd_instance.set_peers(deployment.get("peers"))
+                return True
+
+            ok = await self.call_scenario("update", deploy_id, vnfbd_instance)
+            logger.info(f"Updated test {test} deployment scenario: {ok}")
+
+            if not ok:
+                previous_id = deployment.get("id")
+                previous_vnfbd = deployment.get("vnfbd")
+                await self.call_scenario("stop", previous_id, previous_vnfbd)
+                ok = await self.call_scenario("start", deploy_id, vnfbd_instance)
+                logger.info(f"Started test {test} deployment scenario: {ok}")
+
+        else:
+            ok = await self.call_scenario("start", deploy_id, vnfbd_instance)
+            logger.info(f"Started test {test} deployment scenario: {ok}")
+
+        if ok:
+            self.deployments[address] = {
+                "id": deploy_id,
+                "test": test,
+                "vnfbd": vnfbd_instance,
+                "scenario": vnfbd_instance.scenario(),
+                "peers": vnfbd_instance.peers(),
+            }
+        else:
+            self.deployments.pop(address, None)
+
+        return ok
+
+    async def teardown(self):
+        """Stops all the scenarios kept deployed
+        for reuse (i.e., after all the vnfbd instances ran)
+        """
+        for address, deployment in self.deployments.items():
+            deploy_id = deployment.get("id")
+            ok = await self.call_scenario("stop", deploy_id, deployment.get("vnfbd"))
+            logger.info(f"Stopped deployment scenario in infra {address}: {ok}")
+
+        self.deployments = {}
+
+    async def scenario(
+        self, test, vnfbd_instance, previous_deployment, action, deploy_id
+    ):
         """Handles the deployment of a scenario for a specific instance
-        of a vnfbd, in a particular test case
+        of a vnfbd, in a particular test case.
+        As an infra hosts a single scenario at a time, the scenario
+        is kept deployed after the tests of the instance, so
+        the next tests/instances reuse or update it (see deploy())
 
         Arguments:
             test {int} -- The number of the test
@@ -996,26 +1370,40 @@ class PlayerCore(Core):
             or not
             action {string} -- The action (start or stop) to be taken for
             a given scenario
+            deploy_id {int} -- The deploy id of the vnfbd instance
 
         Returns:
             bool -- If the needed vnfbd scenario action was confirmed or not
         """
+        address = self.infra(vnfbd_instance)
+        reuse = vnfbd_instance.deploy()
+
+        if action == "start" and reuse:
+            vnfbd_deployed = await self.deploy(
+                test, vnfbd_instance, address, deploy_id
+            )
 
-        if action == "start":
+        elif action == "start":
             if previous_deployment:
-                ok = await self.call_scenario("stop", test, vnfbd_instance)
+                ok = await self.call_scenario("stop", deploy_id, vnfbd_instance)
                 logger.info(f"Stopped previous test {test} deployment scenario: {ok}")
 
             if vnfbd_instance.deploy():
-                vnfbd_deployed = await self.call_scenario("start", test, vnfbd_instance)
+                vnfbd_deployed = await self.call_scenario(
+                    "start", deploy_id, vnfbd_instance
+                )
                 logger.info(
                     f"Started test {test} deployment scenario: {vnfbd_deployed}"
                 )
             else:
                 vnfbd_deployed = True
 
+        elif action == "stop" and reuse:
+            logger.info(f"Keeping test {test} deployment scenario for reuse")
+            vnfbd_deployed = True
+
         elif action == "stop":
-            ok = await self.call_scenario("stop", test, vnfbd_instance)
+            ok = await self.call_scenario("stop", deploy_id, vnfbd_instance)
             logger.info(f"Stopped test {test} deployment scenario: {ok}")
             vnfbd_deployed = ok
 
@@ -1043,6 +1431,7 @@ class PlayerCore(Core):
 
         tests = vnfbd_instance.tests()
         trials = vnfbd_instance.trials()
+        deploy_id = next(self.deploy_ids)
         reports_ok = {}
         reports = []
         vnfbd_deployed = False
@@ -1056,7 +1445,7 @@ class PlayerCore(Core):
             reports_ok[test] = False
 
             vnfbd_deployed = await self.scenario(
-                test, vnfbd_instance, vnfbd_deployed, action="start"
+                test, vnfbd_instance, vnfbd_deployed, "start", deploy_id
             )
             if vnfbd_deployed:
 
@@ -1072,7 +1461,7 @@ class PlayerCore(Core):
                 logger.info(f"Deployment of vnf-bd instance failed in test {test}")
 
         vnfbd_not_deployed = await self.scenario(
-            test, vnfbd_instance, vnfbd_deployed, action="stop"
+            test, vnfbd_instance, vnfbd_deployed, "stop", deploy_id
         )
         logger.info(f"Stopped deployment of vnfbd scenario: {vnfbd_not_deployed}")
 
@@ -1130,13 +1519,67 @@ class PlayerCore(Core):
         vnfpp.load_reports(reports)
         return vnfpp
 
-    async def vnfbr(self, vnfbr):
+    def infra(self, vnfbd):
+        """Identifies the infra where a vnfbd instance scenario
+        is deployed, i.e., its orchestrator address
+
+        Arguments:
+            vnfbd {VNFBD} -- A VNFBD object instance
+
+        Returns:
+            string -- The infra address
+        """
+        environment = vnfbd.environment()
+        env_orchestrator = environment.get("orchestrator", {})
+        env_params = env_orchestrator.get("parameters", {})
+
+        address = env_params.get("address", {}).get("value", "")
+        return address
 
+    def jobs(self, vnfbr):
+        """Lists lazily the vnfbd instances of a vnfbr,
+        each one along with the infra it occupies.
+        An infra hosts a single scenario at a time (capacity 1),
+        so only instances of different infras run concurrently
+
+        Arguments:
+            vnfbr {VNFBR} -- A VNFBR object instance
+
+        Yields:
+            tuple -- (VNFBD, string, int) A VNFBD object instance,
+            the address and the capacity of its infra
+        """
         for vnfbd in vnfbr.instances():
+            address = self.infra(vnfbd)
+            yield vnfbd, address, 1
+
+    async def vnfbr(self, vnfbr):
+        """Executes the vnfbd instances of a vnfbr concurrently
+        (up to self.concurrency instances), admitting each instance
+        only when its infra is not hosting another scenario.
+        The output of each instance is added to the vnfbr
+        as soon as the instance is finished
+
+        Arguments:
+            vnfbr {VNFBR} -- A VNFBR object instance
+        """
+
+        async def instance(vnfbd):
             reports = await self.vnfbd(vnfbd)
             vnfpp = self.vnfpp(reports)
             vnfbr.add_output(vnfbd, vnfpp)
 
+        logger.info(f"Running vnf-bd instances - concurrency {self.concurrency}")
+
+        scheduler = Scheduler(self.concurrency)
+        outcomes = await scheduler.run(self.jobs(vnfbr), instance)
+
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.info(f"Error in vnf-bd instance execution: {repr(outcome)}")
+
+        await self.teardown()
+
     async def layout(self, message):
         """Called when a Player receives a gRPC service call
         of Layout type. It means it must run the VNF-BD inside
@@ -0,0 +1,168 @@
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+class Diff:
+    """Compares two vnf-bd scenarios (e.g., the one deployed
+    and the one to be deployed next), so a deployment can be reused
+    when they are equal, or updated with only their deltas.
+    Nodes and links are compared by id, and each node/link modified
+    is detailed by the paths of its changed fields
+    (e.g., resources/cpu/vcpus).
+    """
+
+    SECTIONS = ["nodes", "links"]
+
+    def flatten(self, data, prefix=""):
+        """Flattens a (nested) dict into its leaves
+
+        Arguments:
+            data {dict} -- A (nested) dict
+
+        Keyword Arguments:
+            prefix {string} -- Path of the dict in its parent (default: {""})
+
+        Returns:
+            dict -- The leaf values indexed by their path
+        """
+        leaves = {}
+
+        for key, value in data.items():
+            path = f"{prefix}/{key}" if prefix else str(key)
+
+            if isinstance(value, dict) and value:
+                leaves.update(self.flatten(value, path))
+            else:
+                leaves[path] = value
+
+        return leaves
+
+    def changes(self, previous, current):
+        """Lists the paths of the leaves that differ
+        between previous and current
+
+        Arguments:
+            previous {dict} -- A (nested) dict
+            current {dict} -- A (nested) dict
+
+        Returns:
+            list -- Paths of the leaves added, removed or modified
+        """
+        previous_leaves = self.flatten(previous)
+        current_leaves = self.flatten(current)
+
+        paths = set(previous_leaves) | set(current_leaves)
+        changed = [
+            path
+            for path in sorted(paths)
+            if previous_leaves.get(path) != current_leaves.get(path)
+        ]
+        return changed
+
+    def section(self, previous, current):
+        """Compares a section of the scenarios (nodes or links)
+
+        Arguments:
+            previous {dict} -- Elements of the previous scenario by id
+            current {dict} -- Elements of the current scenario by id
+
+        Returns:
+            dict -- The ids of the added and removed elements, and
+            the paths of the fields changed of each modified element
+        """
+        added = [element_id for element_id in current if element_id not in previous]
+        removed = [element_id for element_id in previous if element_id not in current]
+        modified = {}
+
+        for element_id, element in current.items():
+            if element_id in previous:
+                changed = self.changes(previous.get(element_id), element)
+
+                if changed:
+                    modified[element_id] = changed
+
+        delta = {
+            "added": added,
+            "removed": removed,
+            "modified": modified,
+        }
+        return delta
+
+    def compare(self, previous, current):
+        """Compares two scenarios
+
+        Arguments:
+            previous {dict} -- A vnf-bd scenario
+            current {dict} -- A vnf-bd scenario
+
+        Returns:
+            dict -- The delta of each section (nodes and links), and
+            the paths of the other fields of the scenarios that changed
+            (e.g., policies)
+        """
+        previous = previous if previous else {}
+        current = current if current else {}
+        delta = {}
+
+        for section in Diff.SECTIONS:
+            delta[section] = self.section(
+                previous.get(section, {}), current.get(section, {})
+            )
+
+        previous_others = {
+            k: v for k, v in previous.items() if k not in Diff.SECTIONS
+        }
+        current_others = {k: v for k, v in current.items() if k not in Diff.SECTIONS}
+        delta["others"] = self.changes(previous_others, current_others)
+
+        logger.debug(f"Scenarios delta: {delta}")
+        return delta
+
+    def empty(self, delta):
+        """Checks if the scenarios compared are equal
+
+        Arguments:
+            delta {dict} -- The output of compare()
+
+        Returns:
+            bool -- If there is no change in the delta
+        """
+        sections_empty = all(
+            not any(delta.get(section).values()) for section in Diff.SECTIONS
+        )
+        others_empty = not delta.get("others")
+        return sections_empty and others_empty
+
+    def nodes_only(self, delta, fields):
+        """Checks if the scenarios compared differ only in fields
+        of the nodes they have in common, and if all those fields are
+        within the provided ones (i.e., the changes that can be applied
+        to the deployed nodes)
+
+        Arguments:
+            delta {dict} -- The output of compare()
+            fields {list} -- Paths of the fields of a node
+            (e.g., resources/cpu) whose changes can be applied
+
+        Returns:
+            bool -- If only the provided fields of existing nodes changed
+        """
+        nodes = delta.get("nodes")
+        links = delta.get("links")
+
+        if nodes.get("added") or nodes.get("removed"):
+            return False
+
+        if any(links.values()) or delta.get("others"):
+            return False
+
+        for changed in nodes.get("modified").values():
+            for path in changed:
+                if not any(
+                    path == field or path.startswith(field + "/") for field in fields
+                ):
+                    return False
+
+        return True
@@ -24,6 +24,12 @@ class PlayerBase(abc.ABC):
     ) -> None:
         pass
 
+    @abc.abstractmethod
+    async def Ready(
+        self, stream: "grpclib.server.Stream[gym_pb2.Health, gym_pb2.Health]"
+    ) -> None:
+        pass
+
     @abc.abstractmethod
     async def CallLayout(
         self, stream: "grpclib.server.Stream[gym_pb2.Layout, gym_pb2.Result]"
@@ -38,6 +44,12 @@ class PlayerBase(abc.ABC):
                 gym_pb2.Info,
                 gym_pb2.Info,
             ),
+            "/gym.Player/Ready": grpclib.const.Handler(
+                self.Ready,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                gym_pb2.Health,
+                gym_pb2.Health,
+            ),
             "/gym.Player/CallLayout": grpclib.const.Handler(
                 self.CallLayout,
                 grpclib.const.Cardinality.UNARY_UNARY,
@@ -55,6 +67,12 @@ class PlayerStub:
             gym_pb2.Info,
             gym_pb2.Info,
         )
+        self.Ready = grpclib.client.UnaryUnaryMethod(
+            channel,
+            "/gym.Player/Ready",
+            gym_pb2.Health,
+            gym_pb2.Health,
+        )
         self.CallLayout = grpclib.client.UnaryUnaryMethod(
             channel,
             "/gym.Player/CallLayout",
@@ -70,6 +88,12 @@ class ManagerBase(abc.ABC):
     ) -> None:
         pass
 
+    @abc.abstractmethod
+    async def Ready(
+        self, stream: "grpclib.server.Stream[gym_pb2.Health, gym_pb2.Health]"
+    ) -> None:
+        pass
+
     @abc.abstractmethod
     async def CallTask(
         self, stream: "grpclib.server.Stream[gym_pb2.Task, gym_pb2.Report]"
@@ -84,6 +108,12 @@ class ManagerBase(abc.ABC):
                 gym_pb2.Info,
                 gym_pb2.Info,
             ),
+            "/gym.Manager/Ready": grpclib.const.Handler(
+                self.Ready,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                gym_pb2.Health,
+                gym_pb2.Health,
+            ),
             "/gym.Manager/CallTask": grpclib.const.Handler(
                 self.CallTask,
                 grpclib.const.Cardinality.UNARY_UNARY,
@@ -101,6 +131,12 @@ class ManagerStub:
             gym_pb2.Info,
             gym_pb2.Info,
         )
+        self.Ready = grpclib.client.UnaryUnaryMethod(
+            channel,
+            "/gym.Manager/Ready",
+            gym_pb2.Health,
+            gym_pb2.Health,
+        )
         self.CallTask = grpclib.client.UnaryUnaryMethod(
             channel,
             "/gym.Manager/CallTask",
@@ -116,12 +152,24 @@ class AgentBase(abc.ABC):
     ) -> None:
         pass
 
+    @abc.abstractmethod
+    async def Ready(
+        self, stream: "grpclib.server.Stream[gym_pb2.Health, gym_pb2.Health]"
+    ) -> None:
+        pass
+
     @abc.abstractmethod
     async def CallInstruction(
         self, stream: "grpclib.server.Stream[gym_pb2.Instruction, gym_pb2.Snapshot]"
     ) -> None:
         pass
 
+    @abc.abstractmethod
+    async def StreamInstruction(
+        self, stream: "grpclib.server.Stream[gym_pb2.Instruction, gym_pb2.Evaluation]"
+    ) -> None:
+        pass
+
     def __mapping__(self) -> typing.Dict[str, grpclib.const.Handler]:
         return {
             "/gym.Agent/Greet": grpclib.const.Handler(
@@ -130,12 +178,24 @@ class AgentBase(abc.ABC):
                 gym_pb2.Info,
                 gym_pb2.Info,
             ),
+            "/gym.Agent/Ready": grpclib.const.Handler(
+                self.Ready,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                gym_pb2.Health,
+                gym_pb2.Health,
+            ),
             "/gym.Agent/CallInstruction": grpclib.const.Handler(
                 self.CallInstruction,
                 grpclib.const.Cardinality.UNARY_UNARY,
                 gym_pb2.Instruction,
                 gym_pb2.Snapshot,
             ),
+            "/gym.Agent/StreamInstruction": grpclib.const.Handler(
+                self.StreamInstruction,
+                grpclib.const.Cardinality.UNARY_STREAM,
+                gym_pb2.Instruction,
+                gym_pb2.Evaluation,
+            ),
         }
 
 
@@ -147,12 +207,24 @@ class AgentStub:
             gym_pb2.Info,
             gym_pb2.Info,
         )
+        self.Ready = grpclib.client.UnaryUnaryMethod(
+            channel,
+            "/gym.Agent/Ready",
+            gym_pb2.Health,
+            gym_pb2.Health,
+        )
         self.CallInstruction = grpclib.client.UnaryUnaryMethod(
             channel,
             "/gym.Agent/CallInstruction",
             gym_pb2.Instruction,
             gym_pb2.Snapshot,
         )
+        self.StreamInstruction = grpclib.client.UnaryStreamMethod(
+            channel,
+            "/gym.Agent/StreamInstruction",
+            gym_pb2.Instruction,
+            gym_pb2.Evaluation,
+        )
 
 
 class MonitorBase(abc.ABC):
@@ -162,12 +234,24 @@ class MonitorBase(abc.ABC):
     ) -> None:
         pass
 
+    @abc.abstractmethod
+    async def Ready(
+        self, stream: "grpclib.server.Stream[gym_pb2.Health, gym_pb2.Health]"
+    ) -> None:
+        pass
+
     @abc.abstractmethod
     async def CallInstruction(
         self, stream: "grpclib.server.Stream[gym_pb2.Instruction, gym_pb2.Snapshot]"
     ) -> None:
         pass
 
+    @abc.abstractmethod
+    async def StreamInstruction(
+        self, stream: "grpclib.server.Stream[gym_pb2.Instruction, gym_pb2.Evaluation]"
+    ) -> None:
+        pass
+
     def __mapping__(self) -> typing.Dict[str, grpclib.const.Handler]:
         return {
             "/gym.Monitor/Greet": grpclib.const.Handler(
@@ -176,12 +260,24 @@ class MonitorBase(abc.ABC):
                 gym_pb2.Info,
                 gym_pb2.Info,
             ),
+            "/gym.Monitor/Ready": grpclib.const.Handler(
+                self.Ready,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                gym_pb2.Health,
+                gym_pb2.Health,
+            ),
             "/gym.Monitor/CallInstruction": grpclib.const.Handler(
                 self.CallInstruction,
                 grpclib.const.Cardinality.UNARY_UNARY,
                 gym_pb2.Instruction,
                 gym_pb2.Snapshot,
             ),
+            "/gym.Monitor/StreamInstruction": grpclib.const.Handler(
+                self.StreamInstruction,
+                grpclib.const.Cardinality.UNARY_STREAM,
+                gym_pb2.Instruction,
+                gym_pb2.Evaluation,
+            ),
         }
 
 
@@ -193,12 +289,24 @@ class MonitorStub:
             gym_pb2.Info,
             gym_pb2.Info,
         )
+        self.Ready = grpclib.client.UnaryUnaryMethod(
+            channel,
+            "/gym.Monitor/Ready",
+            gym_pb2.Health,
+            gym_pb2.Health,
+        )
         self.CallInstruction = grpclib.client.UnaryUnaryMethod(
             channel,
             "/gym.Monitor/CallInstruction",
             gym_pb2.Instruction,
             gym_pb2.Snapshot,
         )
+        self.StreamInstruction = grpclib.client.UnaryStreamMethod(
+            channel,
+            "/gym.Monitor/StreamInstruction",
+            gym_pb2.Instruction,
+            gym_pb2.Evaluation,
+        )
 
 
 class InfraBase(abc.ABC):
@@ -208,6 +316,12 @@ class InfraBase(abc.ABC):
     ) -> None:
         pass
 
+    @abc.abstractmethod
+    async def Ready(
+        self, stream: "grpclib.server.Stream[gym_pb2.Health, gym_pb2.Health]"
+    ) -> None:
+        pass
+
     def __mapping__(self) -> typing.Dict[str, grpclib.const.Handler]:
         return {
             "/gym.Infra/Run": grpclib.const.Handler(
@@ -216,6 +330,12 @@ class InfraBase(abc.ABC):
                 gym_pb2.Deploy,
                 gym_pb2.Built,
             ),
+            "/gym.Infra/Ready": grpclib.const.Handler(
+                self.Ready,
+                grpclib.const.Cardinality.UNARY_UNARY,
+                gym_pb2.Health,
+                gym_pb2.Health,
+            ),
         }
 
 
@@ -227,6 +347,12 @@ class InfraStub:
             gym_pb2.Deploy,
             gym_pb2.Built,
         )
+        self.Ready = grpclib.client.UnaryUnaryMethod(
+            channel,
+            "/gym.Infra/Ready",
+            gym_pb2.Health,
+            gym_pb2.Health,
+        )
 
 
 class CLIBase(abc.ABC):
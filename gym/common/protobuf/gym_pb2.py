@@ -23,7 +23,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   syntax='proto3',
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n\tgym.proto\x12\x03gym\x1a\x1cgoogle/protobuf/struct.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x0cvnf_br.proto\x1a\x0cvnf_bd.proto\"`\n\tApparatus\x12\x19\n\x06\x61gents\x18\x01 \x03(\x0b\x32\t.gym.Info\x12\x1b\n\x08monitors\x18\x02 \x03(\x0b\x32\t.gym.Info\x12\x1b\n\x08managers\x18\x03 \x03(\x0b\x32\t.gym.Info\"E\n\tArtifacts\x12\x1a\n\x07probers\x18\x06 \x03(\x0b\x32\t.gym.Tool\x12\x1c\n\tlisteners\x18\x07 \x03(\x0b\x32\t.gym.Tool\"\xc5\x05\n\x04Info\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x0c\n\x04role\x18\x02 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\x12*\n\x0b\x65nvironment\x18\x04 \x01(\x0b\x32\x15.gym.Info.Environment\x12-\n\ttimestamp\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12!\n\tartifacts\x18\x06 \x01(\x0b\x32\x0e.gym.Artifacts\x12!\n\tapparatus\x18\x07 \x01(\x0b\x32\x0e.gym.Apparatus\x12\x10\n\x08\x63ontacts\x18\x08 \x03(\t\x1a\xdc\x03\n\x0b\x45nvironment\x12\x0e\n\x06system\x18\x01 \x01(\t\x12\x0c\n\x04host\x18\x02 \x01(\t\x12\x0f\n\x07release\x18\x03 \x01(\t\x12\x0f\n\x07version\x18\x04 \x01(\t\x12\x11\n\tprocessor\x18\x05 \x01(\t\x12+\n\x03\x63pu\x18\x06 \x03(\x0b\x32\x1e.gym.Info.Environment.CpuEntry\x12\x31\n\x06memory\x18\x07 \x03(\x0b\x32!.gym.Info.Environment.MemoryEntry\x12-\n\x04\x64isk\x18\x08 \x03(\x0b\x32\x1f.gym.Info.Environment.DiskEntry\x12\x33\n\x07network\x18\t \x03(\x0b\x32\".gym.Info.Environment.NetworkEntry\x1a*\n\x08\x43puEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a-\n\x0bMemoryEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\x1a+\n\tDiskEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\x1a.\n\x0cNetworkEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"X\n\x05Sched\x12\x0c\n\x04\x66rom\x18\x01 \x01(\r\x12\r\n\x05until\x18\x02 \x01(\r\x12\x10\n\x08\x64uration\x18\x03 \x01(\r\x12\x10\n\x08interval\x18\x04 \x01(\r\x12\x0e\n\x06repeat\x18\x05 \x01(\r\"\xa1\x01\n\x06\x41\x63tion\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08instance\x18\x02 \x01(\x05\x12\x0c\n\x04name\x18\x03 \x01(\t\x12#\n\x04\x61rgs\x18\x04 \x03(\x0b\x32\x15.gym.Action.ArgsEntry\x12\x19\n\x05sched\x18\x05 \x01(\x0b\x32\n.gym.Sched\x1a+\n\tArgsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"F\n\x0bInstruction\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05trial\x18\x02 \x01(\x05\x12\x1c\n\x07\x61\x63tions\x18\x03 \x03(\x0b\x32\x0b.gym.Action\"\xc3\x04\n\nEvaluation\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08instance\x18\x02 \x01(\x05\x12\x0e\n\x06repeat\x18\x03 \x01(\x05\x12&\n\x06source\x18\x04 \x01(\x0b\x32\x16.gym.Evaluation.Source\x12-\n\x07metrics\x18\x05 \x03(\x0b\x32\x1c.gym.Evaluation.MetricsEntry\x12,\n\ttimestamp\x18\x06 \x01(\x0b\x32\x19.gym.Evaluation.Timestamp\x12\r\n\x05\x65rror\x18\x07 \x01(\t\x1aO\n\x06Source\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x0f\n\x07version\x18\x04 \x01(\t\x12\x0c\n\x04\x63\x61ll\x18\x05 \x01(\t\x1ax\n\x06Metric\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x0c\n\x04unit\x18\x03 \x01(\t\x12\x10\n\x06scalar\x18\x04 \x01(\x01H\x00\x12)\n\x06series\x18\x05 \x01(\x0b\x32\x17.google.protobuf.StructH\x00\x42\x07\n\x05value\x1a`\n\tTimestamp\x12)\n\x05start\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12(\n\x04stop\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a\x46\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.gym.Evaluation.Metric:\x02\x38\x01\"\xb5\x02\n\x08Snapshot\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05trial\x18\x02 \x01(\x05\x12$\n\x06origin\x18\x03 \x01(\x0b\x32\x14.gym.Snapshot.Origin\x12\x33\n\x0b\x65valuations\x18\x04 \x03(\x0b\x32\x1e.gym.Snapshot.EvaluationsEntry\x12-\n\ttimestamp\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\r\n\x05\x65rror\x18\x06 \x01(\t\x1a\x30\n\x06Origin\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04role\x18\x02 \x01(\t\x12\x0c\n\x04host\x18\x03 \x01(\t\x1a\x43\n\x10\x45valuationsEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\x1e\n\x05value\x18\x02 \x01(\x0b\x32\x0f.gym.Evaluation:\x02\x38\x01\"\x88\x02\n\x04Tool\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12-\n\nparameters\x18\x03 \x03(\x0b\x32\x19.gym.Tool.ParametersEntry\x12\'\n\x07metrics\x18\x04 \x03(\x0b\x32\x16.gym.Tool.MetricsEntry\x12\x19\n\x05sched\x18\x05 \x01(\x0b\x32\n.gym.Sched\x12\x10\n\x08instance\x18\x06 \x01(\x05\x1a\x31\n\x0fParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a.\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xe0\x01\n\x04Task\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0e\n\x06trials\x18\x02 \x01(\x05\x12\x0c\n\x04test\x18\x03 \x01(\x05\x12\x1f\n\x06\x61gents\x18\x04 \x03(\x0b\x32\x0f.gym.Task.Agent\x12#\n\x08monitors\x18\x05 \x03(\x0b\x32\x11.gym.Task.Monitor\x1a\x31\n\x05\x41gent\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1a\n\x07probers\x18\x02 \x03(\x0b\x32\t.gym.Tool\x1a\x35\n\x07Monitor\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1c\n\tlisteners\x18\x03 \x03(\x0b\x32\t.gym.Tool\"\xd0\x01\n\x06Report\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04test\x18\x02 \x01(\x05\x12-\n\tsnapshots\x18\x03 \x03(\x0b\x32\x1a.gym.Report.SnapshotsEntry\x12-\n\ttimestamp\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\r\n\x05\x65rror\x18\x05 \x01(\t\x1a?\n\x0eSnapshotsEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\x1c\n\x05value\x18\x02 \x01(\x0b\x32\r.gym.Snapshot:\x02\x38\x01\"=\n\x06Layout\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x19\n\x05vnfbr\x18\x02 \x01(\x0b\x32\n.gym.VnfBr\x12\x0c\n\x04\x66\x65\x61t\x18\x03 \x01(\t\"^\n\x06Result\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x19\n\x05vnfbr\x18\x02 \x01(\x0b\x32\n.gym.VnfBr\x12-\n\ttimestamp\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"n\n\x06\x44\x65ploy\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08workflow\x18\x02 \x01(\t\x12\x1f\n\x08scenario\x18\x03 \x01(\x0b\x32\r.gym.Scenario\x12%\n\x0b\x65nvironment\x18\x04 \x01(\x0b\x32\x10.gym.Environment\"=\n\x05\x42uilt\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0b\n\x03\x61\x63k\x18\x02 \x01(\t\x12\r\n\x05\x65rror\x18\x03 \x01(\t\x12\x0c\n\x04info\x18\x04 \x01(\x0c\"\x98\x03\n\x05Stats\x12\x13\n\x0b\x65nvironment\x18\x01 \x01(\t\x12\x0e\n\x06source\x18\x02 \x01(\t\x12,\n\x0cmeasurements\x18\x03 \x03(\x0b\x32\x16.gym.Stats.Measurement\x1a\xbb\x02\n\x0bMeasurement\x12\x0c\n\x04name\x18\x01 \x01(\t\x12.\n\x04tags\x18\x02 \x03(\x0b\x32 .gym.Stats.Measurement.TagsEntry\x12\x32\n\x06\x66ields\x18\x03 \x03(\x0b\x32\".gym.Stats.Measurement.FieldsEntry\x1a@\n\x05\x46ield\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x0c\n\x04unit\x18\x03 \x01(\t\x12\r\n\x05value\x18\x04 \x01(\t\x1a+\n\tTagsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1aK\n\x0b\x46ieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12+\n\x05value\x18\x02 \x01(\x0b\x32\x1c.gym.Stats.Measurement.Field:\x02\x38\x01\"\x8d\x01\n\x05State\x12\x0e\n\x06source\x18\x01 \x01(\t\x12$\n\x08messages\x18\x02 \x03(\x0b\x32\x12.gym.State.Content\x12&\n\x02ts\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a&\n\x07\x43ontent\x12\x0c\n\x04info\x18\x01 \x01(\t\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"`\n\x06Status\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0c\n\x04info\x18\x03 \x01(\x0c\x12-\n\ttimestamp\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp2O\n\x06Player\x12\x1d\n\x05Greet\x12\t.gym.Info\x1a\t.gym.Info\x12&\n\nCallLayout\x12\x0b.gym.Layout\x1a\x0b.gym.Result2L\n\x07Manager\x12\x1d\n\x05Greet\x12\t.gym.Info\x1a\t.gym.Info\x12\"\n\x08\x43\x61llTask\x12\t.gym.Task\x1a\x0b.gym.Report2Z\n\x05\x41gent\x12\x1d\n\x05Greet\x12\t.gym.Info\x1a\t.gym.Info\x12\x32\n\x0f\x43\x61llInstruction\x12\x10.gym.Instruction\x1a\r.gym.Snapshot2\\\n\x07Monitor\x12\x1d\n\x05Greet\x12\t.gym.Info\x1a\t.gym.Info\x12\x32\n\x0f\x43\x61llInstruction\x12\x10.gym.Instruction\x1a\r.gym.Snapshot2\'\n\x05Infra\x12\x1e\n\x03Run\x12\x0b.gym.Deploy\x1a\n.gym.Built2L\n\x03\x43LI\x12!\n\x06Inform\x12\n.gym.State\x1a\x0b.gym.Status\x12\"\n\x07\x43ollect\x12\n.gym.Stats\x1a\x0b.gym.Statusb\x06proto3'
+  serialized_pb=b'\n\tgym.proto\x12\x03gym\x1a\x1cgoogle/protobuf/struct.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x0cvnf_br.proto\x1a\x0cvnf_bd.proto\"`\n\tApparatus\x12\x19\n\x06\x61gents\x18\x01 \x03(\x0b\x32\t.gym.Info\x12\x1b\n\x08monitors\x18\x02 \x03(\x0b\x32\t.gym.Info\x12\x1b\n\x08managers\x18\x03 \x03(\x0b\x32\t.gym.Info\"E\n\tArtifacts\x12\x1a\n\x07probers\x18\x06 \x03(\x0b\x32\t.gym.Tool\x12\x1c\n\tlisteners\x18\x07 \x03(\x0b\x32\t.gym.Tool\"3\n\x06Health\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x0c\n\x04role\x18\x02 \x01(\t\x12\r\n\x05ready\x18\x03 \x01(\x08\"\xc5\x05\n\x04Info\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x0c\n\x04role\x18\x02 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\x12*\n\x0b\x65nvironment\x18\x04 \x01(\x0b\x32\x15.gym.Info.Environment\x12-\n\ttimestamp\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12!\n\tartifacts\x18\x06 \x01(\x0b\x32\x0e.gym.Artifacts\x12!\n\tapparatus\x18\x07 \x01(\x0b\x32\x0e.gym.Apparatus\x12\x10\n\x08\x63ontacts\x18\x08 \x03(\t\x1a\xdc\x03\n\x0b\x45nvironment\x12\x0e\n\x06system\x18\x01 \x01(\t\x12\x0c\n\x04host\x18\x02 \x01(\t\x12\x0f\n\x07release\x18\x03 \x01(\t\x12\x0f\n\x07version\x18\x04 \x01(\t\x12\x11\n\tprocessor\x18\x05 \x01(\t\x12+\n\x03\x63pu\x18\x06 \x03(\x0b\x32\x1e.gym.Info.Environment.CpuEntry\x12\x31\n\x06memory\x18\x07 \x03(\x0b\x32!.gym.Info.Environment.MemoryEntry\x12-\n\x04\x64isk\x18\x08 \x03(\x0b\x32\x1f.gym.Info.Environment.DiskEntry\x12\x33\n\x07network\x18\t \x03(\x0b\x32\".gym.Info.Environment.NetworkEntry\x1a*\n\x08\x43puEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a-\n\x0bMemoryEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\x1a+\n\tDiskEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\x1a.\n\x0cNetworkEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"X\n\x05Sched\x12\x0c\n\x04\x66rom\x18\x01 \x01(\r\x12\r\n\x05until\x18\x02 \x01(\r\x12\x10\n\x08\x64uration\x18\x03 \x01(\r\x12\x10\n\x08interval\x18\x04 \x01(\r\x12\x0e\n\x06repeat\x18\x05 \x01(\r\"\xa1\x01\n\x06\x41\x63tion\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08instance\x18\x02 \x01(\x05\x12\x0c\n\x04name\x18\x03 \x01(\t\x12#\n\x04\x61rgs\x18\x04 \x03(\x0b\x32\x15.gym.Action.ArgsEntry\x12\x19\n\x05sched\x18\x05 \x01(\x0b\x32\n.gym.Sched\x1a+\n\tArgsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"q\n\x0bInstruction\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05trial\x18\x02 \x01(\x05\x12\x1c\n\x07\x61\x63tions\x18\x03 \x03(\x0b\x32\x0b.gym.Action\x12)\n\x05start\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x97\x05\n\nEvaluation\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08instance\x18\x02 \x01(\x05\x12\x0e\n\x06repeat\x18\x03 \x01(\x05\x12&\n\x06source\x18\x04 \x01(\x0b\x32\x16.gym.Evaluation.Source\x12-\n\x07metrics\x18\x05 \x03(\x0b\x32\x1c.gym.Evaluation.MetricsEntry\x12,\n\ttimestamp\x18\x06 \x01(\x0b\x32\x19.gym.Evaluation.Timestamp\x12\r\n\x05\x65rror\x18\x07 \x01(\t\x1aO\n\x06Source\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x0f\n\x07version\x18\x04 \x01(\t\x12\x0c\n\x04\x63\x61ll\x18\x05 \x01(\t\x1a&\n\x06Series\x12\x0c\n\x04keys\x18\x01 \x03(\x01\x12\x0e\n\x06values\x18\x02 \x03(\x01\x1a\xa3\x01\n\x06Metric\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x0c\n\x04unit\x18\x03 \x01(\t\x12\x10\n\x06scalar\x18\x04 \x01(\x01H\x00\x12)\n\x06series\x18\x05 \x01(\x0b\x32\x17.google.protobuf.StructH\x00\x12)\n\x07\x63olumns\x18\x06 \x01(\x0b\x32\x16.gym.Evaluation.SeriesH\x00\x42\x07\n\x05value\x1a`\n\tTimestamp\x12)\n\x05start\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12(\n\x04stop\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a\x46\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12%\n\x05value\x18\x02 \x01(\x0b\x32\x16.gym.Evaluation.Metric:\x02\x38\x01\"\xb5\x02\n\x08Snapshot\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05trial\x18\x02 \x01(\x05\x12$\n\x06origin\x18\x03 \x01(\x0b\x32\x14.gym.Snapshot.Origin\x12\x33\n\x0b\x65valuations\x18\x04 \x03(\x0b\x32\x1e.gym.Snapshot.EvaluationsEntry\x12-\n\ttimestamp\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\r\n\x05\x65rror\x18\x06 \x01(\t\x1a\x30\n\x06Origin\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04role\x18\x02 \x01(\t\x12\x0c\n\x04host\x18\x03 \x01(\t\x1a\x43\n\x10\x45valuationsEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\x1e\n\x05value\x18\x02 \x01(\x0b\x32\x0f.gym.Evaluation:\x02\x38\x01\"\x88\x02\n\x04Tool\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12-\n\nparameters\x18\x03 \x03(\x0b\x32\x19.gym.Tool.ParametersEntry\x12\'\n\x07metrics\x18\x04 \x03(\x0b\x32\x16.gym.Tool.MetricsEntry\x12\x19\n\x05sched\x18\x05 \x01(\x0b\x32\n.gym.Sched\x12\x10\n\x08instance\x18\x06 \x01(\x05\x1a\x31\n\x0fParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a.\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xe0\x01\n\x04Task\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0e\n\x06trials\x18\x02 \x01(\x05\x12\x0c\n\x04test\x18\x03 \x01(\x05\x12\x1f\n\x06\x61gents\x18\x04 \x03(\x0b\x32\x0f.gym.Task.Agent\x12#\n\x08monitors\x18\x05 \x03(\x0b\x32\x11.gym.Task.Monitor\x1a\x31\n\x05\x41gent\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1a\n\x07probers\x18\x02 \x03(\x0b\x32\t.gym.Tool\x1a\x35\n\x07Monitor\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1c\n\tlisteners\x18\x03 \x03(\x0b\x32\t.gym.Tool\"\xd0\x01\n\x06Report\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04test\x18\x02 \x01(\x05\x12-\n\tsnapshots\x18\x03 \x03(\x0b\x32\x1a.gym.Report.SnapshotsEntry\x12-\n\ttimestamp\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\r\n\x05\x65rror\x18\x05 \x01(\t\x1a?\n\x0eSnapshotsEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12\x1c\n\x05value\x18\x02 \x01(\x0b\x32\r.gym.Snapshot:\x02\x38\x01\"=\n\x06Layout\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x19\n\x05vnfbr\x18\x02 \x01(\x0b\x32\n.gym.VnfBr\x12\x0c\n\x04\x66\x65\x61t\x18\x03 \x01(\t\"^\n\x06Result\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x19\n\x05vnfbr\x18\x02 \x01(\x0b\x32\n.gym.VnfBr\x12-\n\ttimestamp\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"n\n\x06\x44\x65ploy\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x10\n\x08workflow\x18\x02 \x01(\t\x12\x1f\n\x08scenario\x18\x03 \x01(\x0b\x32\r.gym.Scenario\x12%\n\x0b\x65nvironment\x18\x04 \x01(\x0b\x32\x10.gym.Environment\"=\n\x05\x42uilt\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0b\n\x03\x61\x63k\x18\x02 \x01(\t\x12\r\n\x05\x65rror\x18\x03 \x01(\t\x12\x0c\n\x04info\x18\x04 \x01(\x0c\"\x98\x03\n\x05Stats\x12\x13\n\x0b\x65nvironment\x18\x01 \x01(\t\x12\x0e\n\x06source\x18\x02 \x01(\t\x12,\n\x0cmeasurements\x18\x03 \x03(\x0b\x32\x16.gym.Stats.Measurement\x1a\xbb\x02\n\x0bMeasurement\x12\x0c\n\x04name\x18\x01 \x01(\t\x12.\n\x04tags\x18\x02 \x03(\x0b\x32 .gym.Stats.Measurement.TagsEntry\x12\x32\n\x06\x66ields\x18\x03 \x03(\x0b\x32\".gym.Stats.Measurement.FieldsEntry\x1a@\n\x05\x46ield\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x0c\n\x04unit\x18\x03 \x01(\t\x12\r\n\x05value\x18\x04 \x01(\t\x1a+\n\tTagsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1aK\n\x0b\x46ieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12+\n\x05value\x18\x02 \x01(\x0b\x32\x1c.gym.Stats.Measurement.Field:\x02\x38\x01\"\x8d\x01\n\x05State\x12\x0e\n\x06source\x18\x01 \x01(\t\x12$\n\x08messages\x18\x02 \x03(\x0b\x32\x12.gym.State.Content\x12&\n\x02ts\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a&\n\x07\x43ontent\x12\x0c\n\x04info\x18\x01 \x01(\t\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"`\n\x06Status\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x0c\n\x04info\x18\x03 \x01(\x0c\x12-\n\ttimestamp\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp2r\n\x06Player\x12\x1d\n\x05Greet\x12\t.gym.Info\x1a\t.gym.Info\x12!\n\x05Ready\x12\x0b.gym.Health\x1a\x0b.gym.Health\x12&\n\nCallLayout\x12\x0b.gym.Layout\x1a\x0b.gym.Result2o\n\x07Manager\x12\x1d\n\x05Greet\x12\t.gym.Info\x1a\t.gym.Info\x12!\n\x05Ready\x12\x0b.gym.Health\x1a\x0b.gym.Health\x12\"\n\x08\x43\x61llTask\x12\t.gym.Task\x1a\x0b.gym.Report2\xb7\x01\n\x05\x41gent\x12\x1d\n\x05Greet\x12\t.gym.Info\x1a\t.gym.Info\x12!\n\x05Ready\x12\x0b.gym.Health\x1a\x0b.gym.Health\x12\x32\n\x0f\x43\x61llInstruction\x12\x10.gym.Instruction\x1a\r.gym.Snapshot\x12\x38\n\x11StreamInstruction\x12\x10.gym.Instruction\x1a\x0f.gym.Evaluation0\x01\x32\xb9\x01\n\x07Monitor\x12\x1d\n\x05Greet\x12\t.gym.Info\x1a\t.gym.Info\x12!\n\x05Ready\x12\x0b.gym.Health\x1a\x0b.gym.Health\x12\x32\n\x0f\x43\x61llInstruction\x12\x10.gym.Instruction\x1a\r.gym.Snapshot\x12\x38\n\x11StreamInstruction\x12\x10.gym.Instruction\x1a\x0f.gym.Evaluation0\x01\x32J\n\x05Infra\x12\x1e\n\x03Run\x12\x0b.gym.Deploy\x1a\n.gym.Built\x12!\n\x05Ready\x12\x0b.gym.Health\x1a\x0b.gym.Health2L\n\x03\x43LI\x12!\n\x06Inform\x12\n.gym.State\x1a\x0b.gym.Status\x12\"\n\x07\x43ollect\x12\n.gym.Stats\x1a\x0b.gym.Statusb\x06proto3'
   ,
   dependencies=[google_dot_protobuf_dot_struct__pb2.DESCRIPTOR,google_dot_protobuf_dot_timestamp__pb2.DESCRIPTOR,vnf__br__pb2.DESCRIPTOR,vnf__bd__pb2.DESCRIPTOR,])
 
@@ -115,6 +115,52 @@ _ARTIFACTS = _descriptor.Descriptor(
 )
 
 
+_HEALTH = _descriptor.Descriptor(
+  name='Health',
+  full_name='gym.Health',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='uuid', full_name='gym.Health.uuid', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='role', full_name='gym.Health.role', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='ready', full_name='gym.Health.ready', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=278,
+  serialized_end=329,
+)
+
+
 _INFO_ENVIRONMENT_CPUENTRY = _descriptor.Descriptor(
   name='CpuEntry',
   full_name='gym.Info.Environment.CpuEntry',
@@ -149,8 +195,8 @@ _INFO_ENVIRONMENT_CPUENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=806,
-  serialized_end=848,
+  serialized_start=859,
+  serialized_end=901,
 )
 
 _INFO_ENVIRONMENT_MEMORYENTRY = _descriptor.Descriptor(
@@ -187,8 +233,8 @@ _INFO_ENVIRONMENT_MEMORYENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=850,
-  serialized_end=895,
+  serialized_start=903,
+  serialized_end=948,
 )
 
 _INFO_ENVIRONMENT_DISKENTRY = _descriptor.Descriptor(
@@ -225,8 +271,8 @@ _INFO_ENVIRONMENT_DISKENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=897,
-  serialized_end=940,
+  serialized_start=950,
+  serialized_end=993,
 )
 
 _INFO_ENVIRONMENT_NETWORKENTRY = _descriptor.Descriptor(
@@ -263,8 +309,8 @@ _INFO_ENVIRONMENT_NETWORKENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=942,
-  serialized_end=988,
+  serialized_start=995,
+  serialized_end=1041,
 )
 
 _INFO_ENVIRONMENT = _descriptor.Descriptor(
@@ -350,8 +396,8 @@ _INFO_ENVIRONMENT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=512,
-  serialized_end=988,
+  serialized_start=565,
+  serialized_end=1041,
 )
 
 _INFO = _descriptor.Descriptor(
@@ -430,8 +476,8 @@ _INFO = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=279,
-  serialized_end=988,
+  serialized_start=332,
+  serialized_end=1041,
 )
 
 
@@ -490,8 +536,8 @@ _SCHED = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=990,
-  serialized_end=1078,
+  serialized_start=1043,
+  serialized_end=1131,
 )
 
 
@@ -529,8 +575,8 @@ _ACTION_ARGSENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1199,
-  serialized_end=1242,
+  serialized_start=1252,
+  serialized_end=1295,
 )
 
 _ACTION = _descriptor.Descriptor(
@@ -588,8 +634,8 @@ _ACTION = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1081,
-  serialized_end=1242,
+  serialized_start=1134,
+  serialized_end=1295,
 )
 
 
@@ -622,6 +668,13 @@ _INSTRUCTION = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='start', full_name='gym.Instruction.start', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -634,8 +687,8 @@ _INSTRUCTION = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1244,
-  serialized_end=1314,
+  serialized_start=1297,
+  serialized_end=1410,
 )
 
 
@@ -694,8 +747,46 @@ _EVALUATION_SOURCE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1525,
-  serialized_end=1604,
+  serialized_start=1621,
+  serialized_end=1700,
+)
+
+_EVALUATION_SERIES = _descriptor.Descriptor(
+  name='Series',
+  full_name='gym.Evaluation.Series',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='keys', full_name='gym.Evaluation.Series.keys', index=0,
+      number=1, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='values', full_name='gym.Evaluation.Series.values', index=1,
+      number=2, type=1, cpp_type=5, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1702,
+  serialized_end=1740,
 )
 
 _EVALUATION_METRIC = _descriptor.Descriptor(
@@ -741,6 +832,13 @@ _EVALUATION_METRIC = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='columns', full_name='gym.Evaluation.Metric.columns', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -758,8 +856,8 @@ _EVALUATION_METRIC = _descriptor.Descriptor(
       create_key=_descriptor._internal_create_key,
     fields=[]),
   ],
-  serialized_start=1606,
-  serialized_end=1726,
+  serialized_start=1743,
+  serialized_end=1906,
 )
 
 _EVALUATION_TIMESTAMP = _descriptor.Descriptor(
@@ -796,8 +894,8 @@ _EVALUATION_TIMESTAMP = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1728,
-  serialized_end=1824,
+  serialized_start=1908,
+  serialized_end=2004,
 )
 
 _EVALUATION_METRICSENTRY = _descriptor.Descriptor(
@@ -834,8 +932,8 @@ _EVALUATION_METRICSENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1826,
-  serialized_end=1896,
+  serialized_start=2006,
+  serialized_end=2076,
 )
 
 _EVALUATION = _descriptor.Descriptor(
@@ -898,7 +996,7 @@ _EVALUATION = _descriptor.Descriptor(
   ],
   extensions=[
   ],
-  nested_types=[_EVALUATION_SOURCE, _EVALUATION_METRIC, _EVALUATION_TIMESTAMP, _EVALUATION_METRICSENTRY, ],
+  nested_types=[_EVALUATION_SOURCE, _EVALUATION_SERIES, _EVALUATION_METRIC, _EVALUATION_TIMESTAMP, _EVALUATION_METRICSENTRY, ],
   enum_types=[
   ],
   serialized_options=None,
@@ -907,8 +1005,8 @@ _EVALUATION = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1317,
-  serialized_end=1896,
+  serialized_start=1413,
+  serialized_end=2076,
 )
 
 
@@ -953,8 +1051,8 @@ _SNAPSHOT_ORIGIN = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2091,
-  serialized_end=2139,
+  serialized_start=2271,
+  serialized_end=2319,
 )
 
 _SNAPSHOT_EVALUATIONSENTRY = _descriptor.Descriptor(
@@ -991,8 +1089,8 @@ _SNAPSHOT_EVALUATIONSENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2141,
-  serialized_end=2208,
+  serialized_start=2321,
+  serialized_end=2388,
 )
 
 _SNAPSHOT = _descriptor.Descriptor(
@@ -1057,8 +1155,8 @@ _SNAPSHOT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1899,
-  serialized_end=2208,
+  serialized_start=2079,
+  serialized_end=2388,
 )
 
 
@@ -1096,8 +1194,8 @@ _TOOL_PARAMETERSENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2378,
-  serialized_end=2427,
+  serialized_start=2558,
+  serialized_end=2607,
 )
 
 _TOOL_METRICSENTRY = _descriptor.Descriptor(
@@ -1134,8 +1232,8 @@ _TOOL_METRICSENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2429,
-  serialized_end=2475,
+  serialized_start=2609,
+  serialized_end=2655,
 )
 
 _TOOL = _descriptor.Descriptor(
@@ -1200,8 +1298,8 @@ _TOOL = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2211,
-  serialized_end=2475,
+  serialized_start=2391,
+  serialized_end=2655,
 )
 
 
@@ -1239,8 +1337,8 @@ _TASK_AGENT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2598,
-  serialized_end=2647,
+  serialized_start=2778,
+  serialized_end=2827,
 )
 
 _TASK_MONITOR = _descriptor.Descriptor(
@@ -1277,8 +1375,8 @@ _TASK_MONITOR = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2649,
-  serialized_end=2702,
+  serialized_start=2829,
+  serialized_end=2882,
 )
 
 _TASK = _descriptor.Descriptor(
@@ -1336,8 +1434,8 @@ _TASK = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2478,
-  serialized_end=2702,
+  serialized_start=2658,
+  serialized_end=2882,
 )
 
 
@@ -1375,8 +1473,8 @@ _REPORT_SNAPSHOTSENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2850,
-  serialized_end=2913,
+  serialized_start=3030,
+  serialized_end=3093,
 )
 
 _REPORT = _descriptor.Descriptor(
@@ -1434,8 +1532,8 @@ _REPORT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2705,
-  serialized_end=2913,
+  serialized_start=2885,
+  serialized_end=3093,
 )
 
 
@@ -1480,8 +1578,8 @@ _LAYOUT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2915,
-  serialized_end=2976,
+  serialized_start=3095,
+  serialized_end=3156,
 )
 
 
@@ -1526,8 +1624,8 @@ _RESULT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2978,
-  serialized_end=3072,
+  serialized_start=3158,
+  serialized_end=3252,
 )
 
 
@@ -1579,8 +1677,8 @@ _DEPLOY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3074,
-  serialized_end=3184,
+  serialized_start=3254,
+  serialized_end=3364,
 )
 
 
@@ -1632,8 +1730,8 @@ _BUILT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3186,
-  serialized_end=3247,
+  serialized_start=3366,
+  serialized_end=3427,
 )
 
 
@@ -1685,8 +1783,8 @@ _STATS_MEASUREMENT_FIELD = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3472,
-  serialized_end=3536,
+  serialized_start=3652,
+  serialized_end=3716,
 )
 
 _STATS_MEASUREMENT_TAGSENTRY = _descriptor.Descriptor(
@@ -1723,8 +1821,8 @@ _STATS_MEASUREMENT_TAGSENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3538,
-  serialized_end=3581,
+  serialized_start=3718,
+  serialized_end=3761,
 )
 
 _STATS_MEASUREMENT_FIELDSENTRY = _descriptor.Descriptor(
@@ -1761,8 +1859,8 @@ _STATS_MEASUREMENT_FIELDSENTRY = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3583,
-  serialized_end=3658,
+  serialized_start=3763,
+  serialized_end=3838,
 )
 
 _STATS_MEASUREMENT = _descriptor.Descriptor(
@@ -1806,8 +1904,8 @@ _STATS_MEASUREMENT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3343,
-  serialized_end=3658,
+  serialized_start=3523,
+  serialized_end=3838,
 )
 
 _STATS = _descriptor.Descriptor(
@@ -1851,8 +1949,8 @@ _STATS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3250,
-  serialized_end=3658,
+  serialized_start=3430,
+  serialized_end=3838,
 )
 
 
@@ -1890,8 +1988,8 @@ _STATE_CONTENT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3764,
-  serialized_end=3802,
+  serialized_start=3944,
+  serialized_end=3982,
 )
 
 _STATE = _descriptor.Descriptor(
@@ -1935,8 +2033,8 @@ _STATE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3661,
-  serialized_end=3802,
+  serialized_start=3841,
+  serialized_end=3982,
 )
 
 
@@ -1988,8 +2086,8 @@ _STATUS = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=3804,
-  serialized_end=3900,
+  serialized_start=3984,
+  serialized_end=4080,
 )
 
 _APPARATUS.fields_by_name['agents'].message_type = _INFO
@@ -2014,8 +2112,11 @@ _ACTION_ARGSENTRY.containing_type = _ACTION
 _ACTION.fields_by_name['args'].message_type = _ACTION_ARGSENTRY
 _ACTION.fields_by_name['sched'].message_type = _SCHED
 _INSTRUCTION.fields_by_name['actions'].message_type = _ACTION
+_INSTRUCTION.fields_by_name['start'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
 _EVALUATION_SOURCE.containing_type = _EVALUATION
+_EVALUATION_SERIES.containing_type = _EVALUATION
 _EVALUATION_METRIC.fields_by_name['series'].message_type = google_dot_protobuf_dot_struct__pb2._STRUCT
+_EVALUATION_METRIC.fields_by_name['columns'].message_type = _EVALUATION_SERIES
 _EVALUATION_METRIC.containing_type = _EVALUATION
 _EVALUATION_METRIC.oneofs_by_name['value'].fields.append(
   _EVALUATION_METRIC.fields_by_name['scalar'])
@@ -2023,6 +2124,9 @@ _EVALUATION_METRIC.fields_by_name['scalar'].containing_oneof = _EVALUATION_METRI
 _EVALUATION_METRIC.oneofs_by_name['value'].fields.append(
   _EVALUATION_METRIC.fields_by_name['series'])
 _EVALUATION_METRIC.fields_by_name['series'].containing_oneof = _EVALUATION_METRIC.oneofs_by_name['value']
+_EVALUATION_METRIC.oneofs_by_name['value'].fields.append(
+  _EVALUATION_METRIC.fields_by_name['columns'])
+_EVALUATION_METRIC.fields_by_name['columns'].containing_oneof = _EVALUATION_METRIC.oneofs_by_name['value']
 _EVALUATION_TIMESTAMP.fields_by_name['start'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
 _EVALUATION_TIMESTAMP.fields_by_name['stop'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
 _EVALUATION_TIMESTAMP.containing_type = _EVALUATION
@@ -2071,6 +2175,7 @@ _STATE.fields_by_name['ts'].message_type = google_dot_protobuf_dot_timestamp__pb
 _STATUS.fields_by_name['timestamp'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
 DESCRIPTOR.message_types_by_name['Apparatus'] = _APPARATUS
 DESCRIPTOR.message_types_by_name['Artifacts'] = _ARTIFACTS
+DESCRIPTOR.message_types_by_name['Health'] = _HEALTH
 DESCRIPTOR.message_types_by_name['Info'] = _INFO
 DESCRIPTOR.message_types_by_name['Sched'] = _SCHED
 DESCRIPTOR.message_types_by_name['Action'] = _ACTION
@@ -2103,6 +2208,13 @@ Artifacts = _reflection.GeneratedProtocolMessageType('Artifacts', (_message.Mess
   })
 _sym_db.RegisterMessage(Artifacts)
 
+Health = _reflection.GeneratedProtocolMessageType('Health', (_message.Message,), {
+  'DESCRIPTOR' : _HEALTH,
+  '__module__' : 'gym_pb2'
+  # @@protoc_insertion_point(class_scope:gym.Health)
+  })
+_sym_db.RegisterMessage(Health)
+
 Info = _reflection.GeneratedProtocolMessageType('Info', (_message.Message,), {
 
   'Environment' : _reflection.GeneratedProtocolMessageType('Environment', (_message.Message,), {
@@ -2188,6 +2300,13 @@ Evaluation = _reflection.GeneratedProtocolMessageType('Evaluation', (_message.Me
     })
   ,
 
+  'Series' : _reflection.GeneratedProtocolMessageType('Series', (_message.Message,), {
+    'DESCRIPTOR' : _EVALUATION_SERIES,
+    '__module__' : 'gym_pb2'
+    # @@protoc_insertion_point(class_scope:gym.Evaluation.Series)
+    })
+  ,
+
   'Metric' : _reflection.GeneratedProtocolMessageType('Metric', (_message.Message,), {
     'DESCRIPTOR' : _EVALUATION_METRIC,
     '__module__' : 'gym_pb2'
@@ -2214,6 +2333,7 @@ Evaluation = _reflection.GeneratedProtocolMessageType('Evaluation', (_message.Me
   })
 _sym_db.RegisterMessage(Evaluation)
 _sym_db.RegisterMessage(Evaluation.Source)
+_sym_db.RegisterMessage(Evaluation.Series)
 _sym_db.RegisterMessage(Evaluation.Metric)
 _sym_db.RegisterMessage(Evaluation.Timestamp)
 _sym_db.RegisterMessage(Evaluation.MetricsEntry)
@@ -2412,8 +2532,8 @@ _PLAYER = _descriptor.ServiceDescriptor(
   index=0,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=3902,
-  serialized_end=3981,
+  serialized_start=4082,
+  serialized_end=4196,
   methods=[
   _descriptor.MethodDescriptor(
     name='Greet',
@@ -2425,10 +2545,20 @@ _PLAYER = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='Ready',
+    full_name='gym.Player.Ready',
+    index=1,
+    containing_service=None,
+    input_type=_HEALTH,
+    output_type=_HEALTH,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='CallLayout',
     full_name='gym.Player.CallLayout',
-    index=1,
+    index=2,
     containing_service=None,
     input_type=_LAYOUT,
     output_type=_RESULT,
@@ -2448,8 +2578,8 @@ _MANAGER = _descriptor.ServiceDescriptor(
   index=1,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=3983,
-  serialized_end=4059,
+  serialized_start=4198,
+  serialized_end=4309,
   methods=[
   _descriptor.MethodDescriptor(
     name='Greet',
@@ -2461,10 +2591,20 @@ _MANAGER = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='Ready',
+    full_name='gym.Manager.Ready',
+    index=1,
+    containing_service=None,
+    input_type=_HEALTH,
+    output_type=_HEALTH,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='CallTask',
     full_name='gym.Manager.CallTask',
-    index=1,
+    index=2,
     containing_service=None,
     input_type=_TASK,
     output_type=_REPORT,
@@ -2484,8 +2624,8 @@ _AGENT = _descriptor.ServiceDescriptor(
   index=2,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=4061,
-  serialized_end=4151,
+  serialized_start=4312,
+  serialized_end=4495,
   methods=[
   _descriptor.MethodDescriptor(
     name='Greet',
@@ -2497,16 +2637,36 @@ _AGENT = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='Ready',
+    full_name='gym.Agent.Ready',
+    index=1,
+    containing_service=None,
+    input_type=_HEALTH,
+    output_type=_HEALTH,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='CallInstruction',
     full_name='gym.Agent.CallInstruction',
-    index=1,
+    index=2,
     containing_service=None,
     input_type=_INSTRUCTION,
     output_type=_SNAPSHOT,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='StreamInstruction',
+    full_name='gym.Agent.StreamInstruction',
+    index=3,
+    containing_service=None,
+    input_type=_INSTRUCTION,
+    output_type=_EVALUATION,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_AGENT)
 
@@ -2520,8 +2680,8 @@ _MONITOR = _descriptor.ServiceDescriptor(
   index=3,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=4153,
-  serialized_end=4245,
+  serialized_start=4498,
+  serialized_end=4683,
   methods=[
   _descriptor.MethodDescriptor(
     name='Greet',
@@ -2533,16 +2693,36 @@ _MONITOR = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='Ready',
+    full_name='gym.Monitor.Ready',
+    index=1,
+    containing_service=None,
+    input_type=_HEALTH,
+    output_type=_HEALTH,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
   _descriptor.MethodDescriptor(
     name='CallInstruction',
     full_name='gym.Monitor.CallInstruction',
-    index=1,
+    index=2,
     containing_service=None,
     input_type=_INSTRUCTION,
     output_type=_SNAPSHOT,
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='StreamInstruction',
+    full_name='gym.Monitor.StreamInstruction',
+    index=3,
+    containing_service=None,
+    input_type=_INSTRUCTION,
+    output_type=_EVALUATION,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_MONITOR)
 
@@ -2556,8 +2736,8 @@ _INFRA = _descriptor.ServiceDescriptor(
   index=4,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=4247,
-  serialized_end=4286,
+  serialized_start=4685,
+  serialized_end=4759,
   methods=[
   _descriptor.MethodDescriptor(
     name='Run',
@@ -2569,6 +2749,16 @@ _INFRA = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='Ready',
+    full_name='gym.Infra.Ready',
+    index=1,
+    containing_service=None,
+    input_type=_HEALTH,
+    output_type=_HEALTH,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_INFRA)
 
@@ -2582,8 +2772,8 @@ _CLI = _descriptor.ServiceDescriptor(
   index=5,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=4288,
-  serialized_end=4364,
+  serialized_start=4761,
+  serialized_end=4837,
   methods=[
   _descriptor.MethodDescriptor(
     name='Inform',
@@ -0,0 +1,119 @@
+import time
+import socket
+import asyncio
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+BACKOFF_INITIAL = 0.1
+BACKOFF_MAXIMUM = 2.0
+READY_TIMEOUT = 60
+
+
+def backoff(initial=BACKOFF_INITIAL, maximum=BACKOFF_MAXIMUM, factor=2):
+    """Generates the delays between the probes of something
+    not ready yet, doubling them up to a maximum
+
+    Keyword Arguments:
+        initial {float} -- First delay in seconds (default: {BACKOFF_INITIAL})
+        maximum {float} -- Maximum delay in seconds (default: {BACKOFF_MAXIMUM})
+        factor {int} -- Multiplier of each delay (default: {2})
+
+    Yields:
+        float -- The next delay in seconds
+    """
+    delay = initial
+
+    while True:
+        yield delay
+        delay = min(delay * factor, maximum)
+
+
+def port_open(host, port, timeout=1.0):
+    """Checks if host:port accepts TCP connections
+
+    Arguments:
+        host {string} -- IP address of the host
+        port {string} -- Port of the host
+
+    Keyword Arguments:
+        timeout {float} -- Timeout of the connection (default: {1.0})
+
+    Returns:
+        bool -- If the connection was established
+    """
+    try:
+        with socket.create_connection((host, int(port)), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def wait_ports(addresses, timeout=READY_TIMEOUT):
+    """Probes the addresses until all of them accept
+    TCP connections, backing off between rounds of probes
+
+    Arguments:
+        addresses {list} -- Addresses as (host, port) tuples
+
+    Keyword Arguments:
+        timeout {float} -- Maximum time in seconds to wait (default: {READY_TIMEOUT})
+
+    Returns:
+        list -- The addresses not ready when the timeout expired
+    """
+    deadline = time.monotonic() + timeout
+    delays = backoff()
+    pending = list(addresses)
+
+    while pending:
+        pending = [address for address in pending if not port_open(*address)]
+        remaining = deadline - time.monotonic()
+
+        if not pending or remaining <= 0:
+            break
+
+        time.sleep(min(next(delays), remaining))
+
+    if pending:
+        logger.info(f"Addresses not ready after {timeout}s: {pending}")
+
+    return pending
+
+
+async def wait_ready(probe, items, timeout=READY_TIMEOUT):
+    """Probes the items concurrently until all of them
+    are ready, backing off between rounds of probes
+
+    Arguments:
+        probe {function} -- A coroutine function that receives an item
+        and returns if it is ready
+        items {list} -- The items to be probed (e.g., contacts)
+
+    Keyword Arguments:
+        timeout {float} -- Maximum time in seconds to wait (default: {READY_TIMEOUT})
+
+    Returns:
+        list -- The items not ready when the timeout expired
+    """
+    loop = asyncio.get_event_loop()
+    deadline = loop.time() + timeout
+    delays = backoff()
+    pending = list(items)
+
+    while pending:
+        ready = await asyncio.gather(*[probe(item) for item in pending])
+        pending = [item for item, ok in zip(pending, ready) if not ok]
+        remaining = deadline - loop.time()
+
+        if not pending or remaining <= 0:
+            break
+
+        await asyncio.sleep(min(next(delays), remaining))
+
+    if pending:
+        logger.info(f"Not ready after {timeout}s: {pending}")
+
+    return pending
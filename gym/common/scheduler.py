@@ -0,0 +1,94 @@
+import asyncio
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+class Scheduler:
+    """Runs jobs (e.g., vnf-bd instances) concurrently,
+    limited by a total concurrency and by the capacity of the
+    resource each job occupies (e.g., the infra where a vnf-bd
+    instance scenario is deployed).
+    Jobs are admitted as soon as there is a free slot in total and
+    in their resource, so a job waiting for a busy resource does not
+    block the admission of jobs of other resources.
+    """
+
+    def __init__(self, concurrency=1):
+        self._concurrency = max(1, concurrency)
+        self._running = 0
+        self._usage = {}
+        self._changed = None
+
+    def _available(self, resource, capacity):
+        total_ok = self._running < self._concurrency
+        resource_ok = self._usage.get(resource, 0) < max(1, capacity)
+        return total_ok and resource_ok
+
+    async def admit(self, resource, capacity):
+        """Waits till there is a free slot to run a job
+        in the resource and occupies it
+
+        Arguments:
+            resource {string} -- The resource the job occupies
+            capacity {int} -- The amount of jobs the resource
+            can run concurrently
+        """
+        async with self._changed:
+            await self._changed.wait_for(
+                lambda: self._available(resource, capacity)
+            )
+            self._running += 1
+            self._usage[resource] = self._usage.get(resource, 0) + 1
+
+    async def release(self, resource):
+        """Frees the slot occupied by a job in the resource
+
+        Arguments:
+            resource {string} -- The resource the job occupied
+        """
+        async with self._changed:
+            self._running -= 1
+            self._usage[resource] -= 1
+            self._changed.notify_all()
+
+    async def _job(self, call, item, resource, capacity):
+        await self.admit(resource, capacity)
+
+        try:
+            logger.debug(f"Running job in resource {resource}")
+            await call(item)
+        finally:
+            await self.release(resource)
+
+    async def run(self, jobs, call):
+        """Runs call for each job item, admitting them
+        concurrently according to the resource each one occupies.
+        Jobs are consumed lazily (e.g., from a generator), so at most
+        twice the concurrency of jobs are pending at any time
+
+        Arguments:
+            jobs {iterable} -- Tuples of (item, resource, capacity),
+            the item to be called, the resource it occupies and the
+            capacity of that resource
+            call {coroutine function} -- Called with each item,
+            once it is admitted to run
+
+        Returns:
+            list -- The outcome of each call, i.e., its output or
+            the exception it raised, in the order of jobs
+        """
+        self._changed = asyncio.Condition()
+        window = asyncio.Semaphore(2 * self._concurrency)
+        runs = []
+
+        for item, resource, capacity in jobs:
+            await window.acquire()
+
+            run = asyncio.create_task(self._job(call, item, resource, capacity))
+            run.add_done_callback(lambda _: window.release())
+            runs.append(run)
+
+        outcomes = await asyncio.gather(*runs, return_exceptions=True)
+        return outcomes
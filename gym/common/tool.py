@@ -1,3 +1,5 @@
+import os
+import signal
 import logging
 import json
 import argparse
@@ -10,10 +12,12 @@ logger = logging.getLogger(__name__)
 
 
 class Processor:
+    STOP_POLL = 0.1
+
     def __init__(self):
         self._process = None
 
-    def start_process(self, args, timeout=None):
+    def start_process(self, args, timeout=None, stop=None):
         """Run a process using the provided args
         if stop is true it waits the timeout specified
         before stopping the process, otherwise waits till
@@ -25,6 +29,8 @@ class Processor:
         Keyword Arguments:
             timeout {int} -- The time in seconds to wait before
             stopping the process.
+            stop {threading.Event} -- Kills the process when set, e.g.,
+            when an in-process tool call is cancelled (default: {None})
 
         Returns:
             dict -- (int, string, string) The return code of the 
@@ -35,9 +41,12 @@ class Processor:
         logger.info(f"Running local process {args} - timeout {timeout}")
 
         try:
-            result = subprocess.run(
-                args, check=False, shell=True, capture_output=True, timeout=timeout,
-            )
+            if stop is None:
+                result = subprocess.run(
+                    args, check=False, shell=True, capture_output=True, timeout=timeout,
+                )
+            else:
+                result = self._run(args, timeout, stop)
             logger.info(f"Process {result}")
 
             code = result.returncode
@@ -56,6 +65,41 @@ class Processor:
             logger.info(f"Process status {results}")
             return results
 
+    def _run(self, args, timeout, stop):
+        """Same as subprocess.run, but the process (and the
+        processes it spawned) is also killed if stop is set while it runs
+
+        Raises:
+            subprocess.TimeoutExpired: If the process is killed
+            by the timeout or by stop
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        with subprocess.Popen(
+            args,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+        ) as process:
+            while True:
+                wait = Processor.STOP_POLL
+                if deadline is not None:
+                    wait = min(wait, max(deadline - time.monotonic(), 0))
+
+                try:
+                    stdout, stderr = process.communicate(timeout=wait)
+                except subprocess.TimeoutExpired:
+                    expired = deadline is not None and time.monotonic() >= deadline
+                    if stop.is_set() or expired:
+                        os.killpg(process.pid, signal.SIGKILL)
+                        process.communicate()
+                        raise subprocess.TimeoutExpired(args, timeout)
+                else:
+                    break
+
+        return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+
 
 class Parser:
     def __init__(self):
@@ -114,6 +158,7 @@ class Tool:
         self._type = None
         self._tstart = None
         self._tstop = None
+        self._stop = None
         self._default = Tool.DEFAULT_PARAMS
         self._argparser = Parser()
         self._processor = Processor()
@@ -371,18 +416,25 @@ class Tool:
 
         return args
 
-    def main(self):
-        """Implements the whole lifecycle of a tool:
-        Parse the provided args
-        Run the tool according to the parse args
-        Returns a json with the output of the tool ran based on provided args
+    def call(self, args, stop=None):
+        """Runs the tool according to already parsed args,
+        i.e., the same lifecycle of main() but without
+        parsing sys argv, so a tool can be called in-process
+
+        Arguments:
+            args {dict} -- The args of the tool call indexed
+            by parameter name (e.g., {"target": "127.0.0.1"})
+
+        Keyword Arguments:
+            stop {threading.Event} -- When set, the tool must stop
+            its processes/sampling and return (default: {None})
 
         Returns:
-            string -- A JSON of the tool output from 
-            its execution based on the provided arguments (sys argv)
+            dict -- The output of the tool executed, either its
+            info (default call) or its formated output metrics
         """
-        args = self.args()
         options, default = self.serialize(args)
+        self._stop = stop
 
         if default:
             output = self.run_default(default)
@@ -392,5 +444,20 @@ class Tool:
             formated = self.format(results)
             output = self.output(formated)
 
+        return output
+
+    def main(self):
+        """Implements the whole lifecycle of a tool:
+        Parse the provided args
+        Run the tool according to the parse args
+        Returns a json with the output of the tool ran based on provided args
+
+        Returns:
+            string -- A JSON of the tool output from
+            its execution based on the provided arguments (sys argv)
+        """
+        args = self.args()
+        output = self.call(args)
+
         json_output = json.dumps(output, sort_keys=True, indent=4)
         return json_output
@@ -1,13 +1,25 @@
 import os
+import ast
 import json
+import time
+import hashlib
+import inspect
 import logging
 import asyncio
+import threading
+import importlib.util
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from gym import __version__
 
 
 logger = logging.getLogger(__name__)
 
 
+GYM_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
 class Loader:
     def __init__(self):
         self._files = []
@@ -78,7 +90,397 @@ class Loader:
             return self._files
 
 
+class Runtime:
+    """Keeps the tool classes (probers/listeners) imported
+    in the agent/monitor process, so actions run as calls to
+    Tool.call() in a pool of worker threads instead of spawning
+    a python interpreter for each of them.
+    Tools that can not be imported (e.g., out-of-tree tools not
+    built on top of gym.common.tool.Tool) are not registered,
+    so they keep being called as subprocesses.
+    """
+
+    def __init__(self, workers=32):
+        self._classes = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="tool"
+        )
+
+    def _import(self, filepath):
+        """Imports the module in filepath and looks for the
+        tool class defined in it
+
+        Arguments:
+            filepath {string} -- Path to the tool file
+
+        Returns:
+            class -- The Tool subclass defined in filepath,
+            or None if it could not be imported/found
+        """
+        from gym.common.tool import Tool
+
+        tool_cls = None
+        name = os.path.splitext(os.path.basename(filepath))[0]
+
+        try:
+            spec = importlib.util.spec_from_file_location(name, filepath)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+        except Exception as e:
+            logger.debug(f"Could not import tool {filepath} - exception {repr(e)}")
+
+        else:
+            for obj in vars(module).values():
+                if (
+                    inspect.isclass(obj)
+                    and issubclass(obj, Tool)
+                    and obj.__module__ == module.__name__
+                ):
+                    tool_cls = obj
+                    break
+
+        return tool_cls
+
+    def register(self, filepath):
+        """Imports and registers the tool in filepath,
+        retrieving its info in-process
+
+        Arguments:
+            filepath {string} -- Path to the tool file
+
+        Returns:
+            dict -- The tool info (same as calling the tool
+            with --info) or empty if the tool was not registered
+        """
+        info = {}
+        tool_cls = self._import(filepath)
+
+        if tool_cls:
+            try:
+                info = tool_cls().info()
+            except Exception as e:
+                logger.debug(f"Could not get info from {filepath} - exception {e}")
+            else:
+                with self._lock:
+                    self._classes[filepath] = tool_cls
+                logger.debug(f"Tool {tool_cls.__name__} registered from {filepath}")
+
+        return info
+
+    async def discover(self, filepaths):
+        """Registers concurrently (in the worker threads pool)
+        all the tools in filepaths
+
+        Arguments:
+            filepaths {list} -- Paths to the tools files
+
+        Returns:
+            dict -- The info of each tool (empty if not registered)
+            indexed by its file path
+        """
+        loop = asyncio.get_event_loop()
+        aws = [
+            loop.run_in_executor(self._executor, self.register, filepath)
+            for filepath in filepaths
+        ]
+        infos = await asyncio.gather(*aws)
+        return dict(zip(filepaths, infos))
+
+    def declare(self, filepath):
+        """Declares a tool as resident without importing it,
+        i.e., when its info was obtained from the tools catalog.
+        The tool class is imported only in its first call.
+
+        Arguments:
+            filepath {string} -- Path to the tool file
+        """
+        self._classes.setdefault(filepath, None)
+
+    def has(self, filepath):
+        return filepath in self._classes
+
+    def _class(self, filepath):
+        """Gets the class of a resident tool, importing it
+        if it was only declared
+
+        Arguments:
+            filepath {string} -- Path to the tool file
+
+        Returns:
+            class -- The tool class
+
+        Raises:
+            ImportError: If the declared tool could not be imported
+        """
+        with self._lock:
+            tool_cls = self._classes.get(filepath)
+
+            if not tool_cls:
+                tool_cls = self._import(filepath)
+
+                if not tool_cls:
+                    raise ImportError(f"Could not import tool {filepath}")
+
+                self._classes[filepath] = tool_cls
+
+        return tool_cls
+
+    def _execute(self, filepath, args, stop=None):
+        """Runs a new instance of the registered tool
+        (so no state is shared among calls) with the provided args.
+        The output is normalised through json, so it has the
+        same format as the stdout of a tool called as a subprocess
+
+        Arguments:
+            filepath {string} -- Path to the registered tool
+            args {dict} -- Args of the tool call
+
+        Keyword Arguments:
+            stop {threading.Event} -- Stops the tool call when set
+            (default: {None})
+
+        Returns:
+            dict -- The output of the tool call
+        """
+        tool_cls = self._class(filepath)
+        tool = tool_cls()
+        output = tool.call(args, stop=stop)
+        output_json = json.dumps(output, default=str)
+        return json.loads(output_json)
+
+    async def call(self, filepath, args):
+        """Executes the tool call in the worker threads pool.
+        If the call is cancelled (e.g., it overran its duration)
+        the tool is stopped, so its worker thread is released
+
+        Arguments:
+            filepath {string} -- Path to the registered tool
+            args {dict} -- Args of the tool call
+
+        Returns:
+            dict -- Contains the output of the call or its stderr
+            in case of an exception
+        """
+        logger.debug(f"Calling resident tool: {filepath} {args}")
+        loop = asyncio.get_event_loop()
+        stop = threading.Event()
+
+        try:
+            output = await loop.run_in_executor(
+                self._executor, self._execute, filepath, args, stop
+            )
+
+        except asyncio.CancelledError:
+            logger.debug("cancel_me(): resident call task cancelled")
+            stop.set()
+            raise
+
+        except Exception as e:
+            logger.debug(f"Could not call tool {filepath} - exception {repr(e)}")
+            out = {"stderr": repr(e)}
+
+        else:
+            out = {"output": output}
+
+        return out
+
+
+class Catalog:
+    """Persists the info of the tools loaded, indexed by the tool
+    file path and keyed by its modification time and content hash
+    (including the gym modules it imports, e.g., the tool ids in defs).
+    So a component restart can read the tools info from the catalog
+    without executing/importing any of them.
+    """
+
+    def __init__(self, folder="/tmp/gym/catalog/"):
+        self._folder = folder
+        self._filepath = None
+        self._entries = {}
+        self._modules = {}
+
+    def _hash(self, filepath):
+        sha = hashlib.sha256()
+
+        with open(filepath, "rb") as fp:
+            sha.update(fp.read())
+
+        return sha.hexdigest()
+
+    def _module(self, name):
+        """Finds the file of a gym module without importing it
+
+        Arguments:
+            name {string} -- The module name (e.g., gym.common.defs)
+
+        Returns:
+            string -- The path of the module file, or None if
+            it is not a gym module
+        """
+        parts = name.split(".")
+
+        if parts[0] != "gym":
+            return None
+
+        path = os.path.join(GYM_FOLDER, *parts[1:])
+
+        for filepath in [path + ".py", os.path.join(path, "__init__.py")]:
+            if os.path.isfile(filepath):
+                return filepath
+
+        return None
+
+    def _imports(self, filepath):
+        """Gets the gym modules imported by a file,
+        i.e., where the tool info may come from (e.g., ids in defs)
+
+        Arguments:
+            filepath {string} -- Path of the python file
+
+        Returns:
+            list -- The paths of the gym modules imported
+        """
+        with open(filepath, "rb") as fp:
+            tree = ast.parse(fp.read(), filepath)
+
+        names = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names.extend(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names.append(node.module)
+                names.extend(f"{node.module}.{alias.name}" for alias in node.names)
+
+        modules = [self._module(name) for name in names]
+        return sorted(set(module for module in modules if module))
+
+    def _digest(self, filepath):
+        """Hashes a file together with the gym modules
+        it imports (transitively), so the key of a tool changes when
+        any of them changes
+
+        Arguments:
+            filepath {string} -- Path of the tool file
+
+        Returns:
+            string -- The hash of the file and its gym imports
+        """
+        sha = hashlib.sha256(__version__.encode())
+        pending, visited = [filepath], set()
+
+        while pending:
+            path = pending.pop()
+            if path in visited:
+                continue
+            visited.add(path)
+
+            if path not in self._modules:
+                self._modules[path] = (self._hash(path), self._imports(path))
+
+            digest, imports = self._modules[path]
+            sha.update(digest.encode())
+            pending.extend(sorted(imports, reverse=True))
+
+        return sha.hexdigest()
+
+    def _key(self, filepath):
+        """Builds the key of a tool file in the catalog
+
+        Arguments:
+            filepath {string} -- Path of the tool file
+
+        Returns:
+            dict -- The mtime of the tool file and the hash of it
+            and of the gym modules it imports (and the gym version),
+            or empty if the file could not be read
+        """
+        key = {}
+
+        try:
+            mtime = os.stat(filepath).st_mtime
+            digest = self._digest(filepath)
+        except (OSError, SyntaxError) as e:
+            logger.debug(f"Could not build catalog key of {filepath} - {e}")
+        else:
+            key = {"mtime": mtime, "hash": digest}
+
+        return key
+
+    def open(self, name):
+        """Reads the catalog file of a set of tools
+
+        Arguments:
+            name {string} -- Name of the set of tools
+            (e.g., probers or listeners)
+        """
+        self._filepath = os.path.join(self._folder, f"{name}.json")
+        self._entries = {}
+        self._modules = {}
+
+        try:
+            with open(self._filepath, "r") as fp:
+                self._entries = json.load(fp)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read tools catalog {self._filepath} - {e}")
+        else:
+            logger.debug(f"Read tools catalog {self._filepath}")
+
+    def get(self, filepath):
+        """Gets the catalog entry of a tool, only if
+        the file was not modified since it was cataloged
+
+        Arguments:
+            filepath {string} -- Path of the tool file
+
+        Returns:
+            dict -- The entry of the tool (info and if it is
+            resident or not) or empty if not cataloged/outdated
+        """
+        entry = self._entries.get(filepath, {})
+
+        if entry:
+            key = self._key(filepath)
+
+            if key and all(entry.get(k) == v for k, v in key.items()):
+                return entry
+
+            logger.debug(f"Outdated catalog entry of {filepath}")
+
+        return {}
+
+    def set(self, filepath, info, resident):
+        key = self._key(filepath)
+
+        if key:
+            entry = {"info": info, "resident": resident}
+            entry.update(key)
+            self._entries[filepath] = entry
+
+    def save(self):
+        """Writes the catalog file (replacing the
+        previous one atomically)
+        """
+        if self._filepath:
+            tmp_filepath = self._filepath + ".tmp"
+
+            try:
+                os.makedirs(self._folder, exist_ok=True)
+                with open(tmp_filepath, "w") as fp:
+                    json.dump(self._entries, fp, indent=4, sort_keys=True)
+                os.replace(tmp_filepath, self._filepath)
+
+            except OSError as e:
+                logger.debug(f"Could not save tools catalog {self._filepath} - {e}")
+            else:
+                logger.debug(f"Saved tools catalog {self._filepath}")
+
+
 class Handler:
+    def __init__(self, runtime=None):
+        self.runtime = runtime
+
     def _parse(self, call):
         """_parse a call to a command to be executed as a python process
 
@@ -186,11 +588,15 @@ class Handler:
             output is None in this case, or correct parsed result of
             result parsing
         """
+        output = task_result.get("output", {})
         stdout = task_result.get("stdout", "")
         stderr = task_result.get("stderr", "")
         out_parsed, err_parsed = {}, {}
 
-        if stdout:
+        if output:
+            out_parsed = output
+
+        elif stdout:
             out_parsed = self.__parse_stdout(uid, stdout)
 
         elif stderr:
@@ -279,16 +685,74 @@ class Handler:
 
         return result
 
-    async def _schedule(self, call_id, cmd, sched):
+    def _coroutine(self, call):
+        """Builds the coroutine that executes a call:
+        in the resident runtime if the call is a dict referencing
+        a registered tool, or as a python subprocess otherwise
+
+        Arguments:
+            call {dict/list} -- The tool call
+
+        Returns:
+            coroutine -- The execution of the call
+        """
+        if isinstance(call, dict):
+            return self.runtime.call(call.get("file"), call.get("args"))
+
+        cmd = self._parse(call)
+        return self._call(cmd)
+
+    def _add_skew(self, result, skew):
+        """Adds the start skew of a call as a metric of its result
+
+        Arguments:
+            result {dict} -- The parsed result of a call
+            skew {float} -- Seconds between the start deadline
+            of the call and its actual start
+        """
+        metrics = result.get("metrics") or {}
+        metrics["start_skew"] = {
+            "name": "start_skew",
+            "type": "float",
+            "unit": "seconds",
+            "scalar": skew,
+        }
+        result["metrics"] = metrics
+
+    async def _wait_deadline(self, uid, deadline):
+        """Sleeps until the wall-clock instant of deadline
+
+        Arguments:
+            uid {string} -- The call unique id
+            deadline {float} -- Epoch time (seconds) of the deadline
+        """
+        delay = deadline - time.time()
+
+        if delay > 0:
+            logger.debug(f"Call {uid} waiting start deadline - {delay} seconds")
+            await asyncio.sleep(delay)
+        else:
+            logger.info(f"Call {uid} missed start deadline by {-delay} seconds")
+
+    async def _schedule(self, call_id, call, sched, queue=None, deadline=None):
         """Executes a call uid to the command cmd following the
         scheduling (time) properties of sched
 
         Arguments:
             uid {string} -- The call unique id
-            cmd {string} -- The command to be called/executed
+            call {dict/list} -- The tool call to be executed
             sched {dict} -- Contains keys that determine the timely manner
             that the cmd is going to be called
 
+        Keyword Arguments:
+            queue {asyncio.Queue} -- If provided, each result is put in the
+            queue as soon as its repetition completes, instead of being kept
+            in the returned list (default: {None})
+            deadline {float} -- Epoch time (seconds) when the call must start,
+            i.e., its sched from is counted from this instant and the skew
+            of the first repetition start is added to its result metrics
+            (default: {None})
+
         Returns:
             list -- A list of results of the called cmd according to sched parameters
         """
@@ -307,19 +771,36 @@ class Handler:
         timeout = 0
         task_duration = 0
         repeat = 1 if repeat == 0 else repeat
+        skew = None
+
+        if deadline:
+            await self._wait_deadline(uid, deadline)
 
         for repeatition in range(1, repeat + 1):
 
             await asyncio.sleep(begin)
-            begin = interval
 
-            task = loop.create_task(self._call(cmd))
+            task = loop.create_task(self._coroutine(call))
             logger.debug(f"Task {call_id} created {task}")
 
+            if deadline and repeatition == 1:
+                skew = time.time() - (deadline + begin)
+                logger.debug(f"Task {call_id} start skew {skew} seconds")
+
+            begin = interval
+
             task_duration = await self._check_task(call_id, task, duration)
             task_result = await self._check_task_result(call_id, task)
             result = self.__parse_result(uid, instance, repeatition, task_result)
-            results.append(result)
+
+            if skew is not None:
+                self._add_skew(result, skew)
+                skew = None
+
+            if queue:
+                await queue.put(result)
+            else:
+                results.append(result)
 
             timeout += task_duration + interval
             if self._check_finish(uid, finish, timeout):
@@ -327,38 +808,47 @@ class Handler:
 
         return results
 
-    async def _build(self, calls):
+    async def _build(self, calls, queue=None, deadline=None):
         """Builds list of command calls as coroutines to be
         executed by asyncio loop
 
         Arguments:
             calls {list} -- List of command calls
 
+        Keyword Arguments:
+            queue {asyncio.Queue} -- Queue where the calls put
+            their results (default: {None})
+            deadline {float} -- Epoch time (seconds) when the calls
+            must start (default: {None})
+
         Returns:
             list -- Set of coroutines scheduled to be called
         """
         logger.debug(f"Building calls into coroutines")
         aws = []
         for call_key, (call, call_sched) in calls.items():
-            cmd = self._parse(call)
-            aw = self._schedule(call_key, cmd, call_sched)
+            aw = self._schedule(call_key, call, call_sched, queue, deadline)
             aws.append(aw)
 
         return aws
 
-    async def run(self, calls):
+    async def run(self, calls, deadline=None):
         """Executes the list of calls as coroutines
         returning their results
 
         Arguments:
             calls {list} -- Set of commands to be scheduled and called as subprocesses
 
+        Keyword Arguments:
+            deadline {float} -- Epoch time (seconds) when the calls
+            must start (default: {None})
+
         Returns:
             dict -- Results of calls (stdout/stderr) indexed by call uid
         """
         results = {}
 
-        aws = await self._build(calls)
+        aws = await self._build(calls, deadline=deadline)
 
         logger.debug(f"Running built coroutines")
         tasks = await asyncio.gather(*aws, return_exceptions=True)
@@ -378,6 +868,45 @@ class Handler:
 
         return results
 
+    async def stream(self, calls, deadline=None):
+        """Executes the list of calls as coroutines
+        yielding each result as soon as it is obtained
+        (i.e., every repetition of a call).
+        If the consumer stops iterating, the pending calls are cancelled.
+
+        Arguments:
+            calls {list} -- Set of commands to be scheduled and called
+
+        Keyword Arguments:
+            deadline {float} -- Epoch time (seconds) when the calls
+            must start (default: {None})
+
+        Yields:
+            dict -- Result of a call repetition
+        """
+        queue = asyncio.Queue()
+        aws = await self._build(calls, queue, deadline)
+
+        logger.debug(f"Streaming built coroutines")
+        tasks = asyncio.ensure_future(asyncio.gather(*aws, return_exceptions=True))
+        tasks.add_done_callback(lambda _: queue.put_nowait(None))
+
+        try:
+            result = await queue.get()
+
+            while result is not None:
+                yield result
+                result = await queue.get()
+
+        finally:
+            if not tasks.done():
+                logger.debug(f"Cancelling streamed coroutines")
+                tasks.cancel()
+
+        for uid, aw in zip(calls.keys(), tasks.result()):
+            if isinstance(aw, Exception):
+                logger.debug(f"Could not run _schedule {calls[uid]} - exception {aw}")
+
     async def run_serial(self, calls):
         """Executes each call listed in calls in series
 
@@ -397,11 +926,30 @@ class Handler:
 
         return outputs
 
+    async def run_concurrent(self, calls):
+        """Executes all the calls listed in calls concurrently
+
+        Arguments:
+            calls {list} -- List of calls to be run at once
+
+        Returns:
+            dict -- Results of calls (stdout/stderr) indexed by call uid
+        """
+        uuids = list(calls.keys())
+        cmds = [self._parse(calls[uuid]) for uuid in uuids]
+
+        logger.debug(f"Running concurrently {cmds}")
+        outputs = await asyncio.gather(*[self._call(cmd) for cmd in cmds])
+
+        return dict(zip(uuids, outputs))
+
 
 class Tools:
-    def __init__(self):
+    def __init__(self, resident=True, catalog="/tmp/gym/catalog/", runtime=None):
         self.loader = Loader()
-        self.handler = Handler()
+        self.catalog = Catalog(catalog)
+        self.runtime = runtime or (Runtime() if resident else None)
+        self.handler = Handler(self.runtime)
         self._cfg = {}
         self._files = {}
         self._info = {}
@@ -421,35 +969,80 @@ class Tools:
         """Uses parameters configured in self.cfg() to load the tools into:
         - self._files (dict of tools file paths listed by Loader indexed by tool name)
         - self._info (dict of info of tools extracted with Handler indexed by tool id)
+        The info of tools is read from the catalog if the tool file was not
+        modified, otherwise it is discovered (concurrently) by importing the
+        tool in the runtime or by executing it with the flag --info
         """
 
         self.cfg(config)
         files = self.loader.files(**self._cfg)
+        self.catalog.open(config.get("name", "tools"))
+
+        pending = []
+
+        for filepath in files:
+            entry = self.catalog.get(filepath)
 
-        calls = {key: [files[key], "--info"] for key in range(len(files))}
+            if entry:
+                self._add(filepath, entry.get("info"))
 
-        logger.debug(f"Loading tools info")
-        outputs = await self.handler.run_serial(calls)
+                if self.runtime and entry.get("resident"):
+                    self.runtime.declare(filepath)
+            else:
+                pending.append(filepath)
+
+        if pending:
+            logger.debug(f"Discovering tools info: {pending}")
+            await self._discover(pending)
+            self.catalog.save()
+
+        tools_names = [tool.get("name") for tool in self._info.values()]
+        logger.info(f"Tools loaded: {tools_names}")
+
+        logger.debug(f"Tools full info: {self._info}")
 
-        for uuid, out in outputs.items():
+    async def _discover(self, files):
+        """Discovers the info of tools not present in the catalog
+
+        Arguments:
+            files {list} -- Paths of the tools files
+        """
+        infos = await self.runtime.discover(files) if self.runtime else {}
+        calls = {}
+
+        for filepath in files:
+            info = infos.get(filepath, {})
+
+            if info:
+                self._add(filepath, info)
+                self.catalog.set(filepath, info, resident=True)
+            else:
+                calls[filepath] = [filepath, "--info"]
+
+        outputs = await self.handler.run_concurrent(calls)
+
+        for filepath, out in outputs.items():
             stdout = out.get("stdout", None)
 
             if stdout:
                 info = json.loads(stdout)
-                tool_id = info["id"]
-                tool_name = info["name"]
-                self._files[tool_name] = files[uuid]
-                self._info[tool_id] = info
+                self._add(filepath, info)
+                self.catalog.set(filepath, info, resident=False)
             else:
                 expt = out.get("stderr", {})
-                logger.debug(
-                    f"Could not get info from {files[uuid]} - exception {expt}"
-                )
+                logger.debug(f"Could not get info from {filepath} - exception {expt}")
 
-        tools_names = [tool.get("name") for tool in self._info.values()]
-        logger.info(f"Tools loaded: {tools_names}")
+    def _add(self, filepath, info):
+        """Adds a tool info into the set of tools loaded
 
-        logger.debug(f"Tools full info: {self._info}")
+        Arguments:
+            filepath {string} -- Path of the tool file
+            info {dict} -- Info of the tool (id, name, parameters, metrics)
+        """
+        tool_id = info["id"]
+        tool_name = info["name"]
+        self._files[tool_name] = filepath
+        self._info[tool_id] = info
 
     def info(self):
         """Gets the information of tools after listed and loaded
@@ -466,7 +1059,8 @@ class Tools:
         """Builds calls of actions into a dict of commands
         Uses identifier of each tool (via the self._files dict) to
         build the call with the command (tool file path) and its arguments
-        (list of parameters prefixed by '--')
+        (list of parameters prefixed by '--'), or a dict call with the tool
+        file path and its args if the tool is registered in the runtime
 
         Arguments:
             actions {dict} -- Set of actions in the form of, for instance:
@@ -503,12 +1097,20 @@ class Tools:
                 act_args = action.get("args")
 
                 call_file = self._files.get(action_name)
-                call_args = [
-                    "--" + key + " " + str(value) for key, value in act_args.items()
-                ]
 
-                call = [call_file]
-                call.extend(call_args)
+                if self.runtime and self.runtime.has(call_file):
+                    call = {
+                        "file": call_file,
+                        "args": {key: str(value) for key, value in act_args.items()},
+                    }
+                else:
+                    call_args = [
+                        "--" + key + " " + str(value)
+                        for key, value in act_args.items()
+                    ]
+                    call = [call_file]
+                    call.extend(call_args)
+
                 call_sched = action.get("sched", {})
 
                 call_key = (action_id, action_instance)
@@ -543,20 +1145,51 @@ class Tools:
 
         return outputs
 
-    async def handle(self, actions):
+    async def handle(self, actions, deadline=None):
         """Handles actions to be executed by scheduled calls and
         properly parsed into output results
 
         Arguments:
             actions {dict} -- Set of actions indexed by unique identifiers
 
+        Keyword Arguments:
+            deadline {float} -- Epoch time (seconds) when the actions
+            must start (default: {None})
+
         Returns:
             dict -- Set of each action execution output
             indexed by action unique identifier
         """
         logger.info("Started handling instruction actions")
         calls = self.__build_calls(actions)
-        results = await self.handler.run(calls)
+        results = await self.handler.run(calls, deadline)
         outputs = self.__build_outputs(results)
         logger.info(f"Finished handling instruction actions")
         return outputs
+
+    async def stream(self, actions, deadline=None):
+        """Handles actions to be executed by scheduled calls
+        yielding each output as soon as it is obtained,
+        so outputs are not kept in memory until all actions finish
+
+        Arguments:
+            actions {dict} -- Set of actions indexed by unique identifiers
+
+        Keyword Arguments:
+            deadline {float} -- Epoch time (seconds) when the actions
+            must start (default: {None})
+
+        Yields:
+            dict -- Output of an action execution (i.e., a single
+            repetition) containing its unique identifier
+        """
+        logger.info("Started streaming instruction actions")
+        calls = self.__build_calls(actions)
+        output_ids = 1
+
+        async for result in self.handler.stream(calls, deadline):
+            result.setdefault("id", output_ids)
+            output_ids += 1
+            yield result
+
+        logger.info(f"Finished streaming instruction actions")
@@ -1,5 +1,6 @@
 import logging
 import json
+import copy
 import itertools
 
 
@@ -245,6 +246,7 @@ class VNFBD:
         self._protobuf = VnfBd()
         self._inputs = {}
         self._environment = {}
+        self._peers = []
 
     def set_environment(self, environment):
         self._environment = environment
@@ -262,6 +264,12 @@ class VNFBD:
     def inputs(self):
         return self._inputs
 
+    def set_peers(self, peers):
+        self._peers = peers
+
+    def peers(self):
+        return self._peers
+
     def load(self, filepath, yang=True):
         self._data = self._utils.data(filepath, is_json=True)
         if yang:
@@ -283,6 +291,10 @@ class VNFBD:
         json_format.ParseDict(self._data, self._protobuf)
         return self._protobuf
 
+    def set_yang(self, yang, path_helper=None):
+        self._yang = yang
+        self._yang_ph = path_helper
+
     def yang(self):
         return self._yang
 
@@ -437,3 +449,122 @@ class VNFBD:
                 return True
 
         return False
+
+
+class VNFBDTemplate:
+    """A compiled VNF-BD, i.e., the base VNF-BD of a VNF-BR
+    parsed (and validated) into a YANG model only once.
+    The setter of each input path is resolved only once too,
+    so every VNF-BD instance is stamped out cloning the
+    base YANG model and setting only its input leaves
+    (the leaf setters validate the input values).
+    """
+
+    def __init__(self, data, environment=None):
+        self._data = data
+        self._environment = environment if environment else {}
+        self._utils = Utils()
+        self._base = VNFBD()
+        self._targets = {}
+
+    def compile(self):
+        """Parses the base VNF-BD data into its YANG model
+
+        Returns:
+            bool -- If the base VNF-BD data was parsed correctly
+        """
+        logger.info("Compiling vnf-bd template")
+        ack = self._base.parse(self._data)
+        return ack
+
+    def target(self, path):
+        """Resolves (and caches) the setter of the leaf of a path
+        in the base YANG model
+
+        Arguments:
+            path {string} -- The path of a leaf in the VNF-BD model
+            e.g., /scenario/nodes[id='d2']/resources/cpu/vcpus
+
+        Returns:
+            tuple -- (object, string) The parent object of the leaf in the
+            base YANG model and the name of the leaf setter function,
+            or None if the path could not be resolved
+        """
+        if path not in self._targets:
+            try:
+                obj = self._base.yang_ph().get_unique(path)
+                target = (obj._parent, f"_set_{obj._yang_name}")
+            except Exception as e:
+                logger.debug(f"Exception resolving path {path}: {repr(e)}")
+                target = None
+
+            self._targets[path] = target
+
+        return self._targets[path]
+
+    def fill(self, memo, inputs):
+        """Sets the value of each input in the leaves of a
+        clone of the base YANG model
+
+        Arguments:
+            memo {dict} -- The memo of the deepcopy of the base
+            YANG model, i.e., its objects indexed by the id
+            of the base YANG model objects
+            inputs {dict} -- The inputs to be set, indexed by name
+
+        Returns:
+            bool -- If all the inputs were set
+        """
+        all_acks = {}
+
+        for input in inputs.values():
+            name = input.get("name")
+            path = input.get("path")
+            value = input.get("values")
+
+            target = self.target(path)
+
+            try:
+                (parent, set_func_name) = target
+                set_func = getattr(memo[id(parent)], set_func_name)
+                set_func(value)
+            except Exception as e:
+                logger.debug(f"Exception filling entry name {name}: {repr(e)}")
+                all_acks[name] = False
+            else:
+                logger.debug(f"Successful set entry: name {name} - value {value}")
+                all_acks[name] = True
+
+        all_inputs_set = all(all_acks.values())
+        return all_inputs_set
+
+    def instance(self, inputs):
+        """Stamps out a VNF-BD instance from the template
+        cloning the base YANG model (except its path helper,
+        the paths are resolved in the base model) and
+        setting the leaves of the inputs in the clone.
+        The data of the instance is serialized from the clone,
+        so its scenario and proceedings contain the inputs too
+
+        Arguments:
+            inputs {dict} -- The inputs of a VNF-BD instance,
+            indexed by name, each one containing the path of the leaf
+            and the (single) value to be set on it
+
+        Returns:
+            VNFBD -- A VNFBD object instance, or None if not all
+            the inputs could be set on it
+        """
+        base_yang = self._base.yang()
+        memo = {id(self._base.yang_ph()): None}
+        yang = copy.deepcopy(base_yang, memo)
+
+        if self.fill(memo, inputs):
+            data = self._utils.dictionary(yang)
+            vnfbd = VNFBD(data)
+            vnfbd.set_yang(yang)
+            vnfbd.set_environment(self._environment)
+            vnfbd.set_inputs(inputs)
+            return vnfbd
+
+        return None
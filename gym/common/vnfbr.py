@@ -1,10 +1,23 @@
 import os
 import json
 import logging
+import math
 import itertools
 import pandas as pd
-import copy
-from numpy import arange
+from numpy import (
+    add,
+    arange,
+    asarray,
+    ceil,
+    concatenate,
+    cumsum,
+    errstate,
+    floor,
+    isnan,
+    lexsort,
+    repeat,
+    sqrt,
+)
 
 from google.protobuf import json_format
 from pyangbind.lib.xpathhelper import YANGPathHelper
@@ -13,15 +26,43 @@ from gym.common.yang.utils import Utils
 from gym.common.yang import vnf_br
 from gym.common.protobuf.vnf_br_pb2 import VnfBr
 
-from gym.common.vnfbd import VNFBD
+from gym.common.vnfbd import VNFBDTemplate
 
 logger = logging.getLogger(__name__)
 
 
+class Range:
+    """A lazy sequence of the values from start (inclusive) to
+    stop (exclusive) spaced by step, i.e., the same values of
+    numpy.arange but computed on demand (no list is materialised)
+    """
+
+    def __init__(self, start, stop, step):
+        self.start = start
+        self.stop = stop
+        self.step = step
+        self._length = max(int(math.ceil((stop - start) / step)), 0)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("Range index out of range")
+
+        return self.start + index * self.step
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self.start + index * self.step
+
+
 class Inputs:
     def __init__(self):
         self._data = {}
-        self._mux_inputs = []
 
     def has_list_value(self, dict_items):
         fields_list = [
@@ -33,70 +74,185 @@ class Inputs:
         fields_dict = [field for field, value in inputs.items() if type(value) is dict]
         return fields_dict
 
-    def parse_dicts(self):
+    def parse_dicts(self, data=None):
+        data = self._data if data is None else data
         fields_list = {}
-        fields_dict = self.has_dict_value(self._data)
+        fields_dict = self.has_dict_value(data)
 
         for field in fields_dict:
-            value = self._data.get(field)
+            value = data.get(field)
 
             _min = value.get("min", None)
             _max = value.get("max", None)
             _step = value.get("step", None)
 
             if _min is not None and _max is not None and _step is not None:
-
-                value_list = list(arange(_min, _max, _step))
-                fields_list[field] = value_list
+                fields_list[field] = Range(_min, _max, _step)
 
         return fields_list
 
-    def lists(self):
+    def lists(self, data=None):
+        data = self._data if data is None else data
         lists_fields = []
         lists = []
 
-        data_dicts = self.parse_dicts()
-        data_lists = self.has_list_value(self._data)
+        data_dicts = self.parse_dicts(data)
+        data_lists = self.has_list_value(data)
 
         lists_fields.extend(data_lists)
         lists_fields.extend(data_dicts.keys())
 
+        lists.extend([data.get(field) for field in data_lists])
         lists.extend(data_dicts.values())
-        lists.extend([self._data.get(field) for field in data_lists])
 
         return lists, lists_fields
 
-    def fill_unique(self, lists_fields, unique_lists):
-        unique_inputs = []
+    def product(self, lists):
+        """Iterates over the cartesian product of lists (in the
+        same order of itertools.product), keeping only the index
+        of each list in memory, so lists can be lazy sequences
+
+        Arguments:
+            lists {list} -- Set of sequences (i.e., support len and index)
+
+        Yields:
+            tuple -- One value of each list
+        """
+        sizes = [len(values) for values in lists]
+
+        if not lists or not all(sizes):
+            return
+
+        indexes = [0] * len(lists)
+        position = 0
+
+        while position >= 0:
+            yield tuple(values[index] for values, index in zip(lists, indexes))
+
+            position = len(lists) - 1
+            while position >= 0:
+                indexes[position] += 1
+
+                if indexes[position] < sizes[position]:
+                    break
+
+                indexes[position] = 0
+                position -= 1
+
+    def fill_unique(self, lists_fields, unique_lists, data=None):
+        data = self._data if data is None else data
 
         for unique_list in unique_lists:
-            unique_input = copy.deepcopy(self._data)
+            unique_input = dict(data)
+            unique_input.update(zip(lists_fields, unique_list))
+            yield unique_input
 
-            for field_index in range(len(lists_fields)):
-                field = lists_fields[field_index]
-                value = unique_list[field_index]
-                unique_input[field] = value
+    def count(self, data):
+        """Counts the amount of unique inputs
+        the multiplexing of data generates, without
+        generating them
 
-            unique_inputs.append(unique_input)
+        Arguments:
+            data {dict} -- Inputs with list/range values
 
-        return unique_inputs
+        Returns:
+            int -- Amount of unique inputs
+        """
+        lists, _ = self.lists(data)
+
+        total = 1 if lists else 0
+        for values in lists:
+            total *= len(values)
+
+        return total
 
     def multiplex(self, data):
-        logger.info("Multiplexing inputs")
-        unique_inputs = []
+        """Generates lazily the unique inputs of the
+        multiplexing of data, bound to data (i.e., other
+        multiplexing/counting calls do not affect the generator)
 
-        self._data = data
-        lists, lists_fields = self.lists()
+        Arguments:
+            data {dict} -- Inputs with list/range values
+
+        Returns:
+            generator -- The unique inputs
+        """
+        logger.info("Multiplexing inputs")
 
-        if lists:
-            unique_lists = list(itertools.product(*lists))
-            unique_inputs = self.fill_unique(lists_fields, unique_lists)
-            self._mux_inputs = unique_inputs
+        lists, lists_fields = self.lists(data)
 
-        logger.info(f"Inputs multiplexed: total {len(unique_inputs)}")
+        unique_lists = self.product(lists)
+        unique_inputs = self.fill_unique(lists_fields, unique_lists, data)
         return unique_inputs
 
 
+class Summaries:
+    """Collects the values of metrics series so the summaries of
+    all of them (i.e., count, mean, std, min, quartiles, max) are
+    computed in a single vectorized pass, and set as features
+    of the metrics where each series was collected from
+    """
+
+    STATS = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+    def __init__(self):
+        self._series = []
+        self._values = []
+
+    def add(self, metrics, metric_name, metric_values):
+        if metric_values.dtype.kind in "iuf":
+            metric_values = metric_values.astype(float)
+            metric_values = metric_values[~isnan(metric_values)]
+
+        if metric_values.dtype.kind == "f" and len(metric_values):
+            self._series.append((metrics, metric_name))
+            self._values.append(metric_values)
+        else:
+            desc = pd.Series(metric_values).describe()
+            for k, v in desc.to_dict().items():
+                metrics["_".join([metric_name, k])] = v
+
+    def _quantile(self, values, starts, lengths, q):
+        position = starts + q * (lengths - 1)
+        low = floor(position).astype(int)
+        high = ceil(position).astype(int)
+        fraction = position - low
+        quantile = values[low] + (values[high] - values[low]) * fraction
+        return quantile
+
+    def compute(self):
+        if self._values:
+            lengths = asarray([len(values) for values in self._values])
+            starts = cumsum(lengths) - lengths
+            groups = repeat(arange(len(self._values)), lengths)
+            values = concatenate(self._values)
+            values = values[lexsort((values, groups))]
+
+            mean = add.reduceat(values, starts) / lengths
+            deviation = (values - repeat(mean, lengths)) ** 2
+
+            with errstate(divide="ignore", invalid="ignore"):
+                std = sqrt(add.reduceat(deviation, starts) / (lengths - 1))
+
+            stats = [
+                lengths.astype(float),
+                mean,
+                std,
+                values[starts],
+                self._quantile(values, starts, lengths, 0.25),
+                self._quantile(values, starts, lengths, 0.5),
+                self._quantile(values, starts, lengths, 0.75),
+                values[starts + lengths - 1],
+            ]
+
+            for index, (metrics, metric_name) in enumerate(self._series):
+                for stat, stat_values in zip(Summaries.STATS, stats):
+                    metrics["_".join([metric_name, stat])] = stat_values[index]
+
+        self._series = []
+        self._values = []
+
+
 class VNFBR:
     def __init__(self, data=None):
         self._utils = Utils()
@@ -105,6 +261,7 @@ class VNFBR:
         self._yang = vnf_br.vnf_br(path_helper=self._yang_ph)
         self._protobuf = VnfBr()
         self._inputs = Inputs()
+        self._template = None
         self._outputs = {}
         self._output_ids = 1
 
@@ -217,20 +374,44 @@ class VNFBR:
         return vnfbd_features
 
     def extract_vnfpp_metrics_series_summary(self, metric_name, metric_values):
-        metrics_summary = {}
-        data = [{metric_name: value} for value in metric_values]
-        df = pd.DataFrame(data=data)
-        desc = df[metric_name].describe()
+        desc = pd.Series(metric_values).describe()
         dict_desc = desc.to_dict()
-        col_metrics = {"_".join([metric_name, k]): v for k, v in dict_desc.items()}
-        metrics_summary.update(col_metrics)
+        metrics_summary = {
+            "_".join([metric_name, k]): v for k, v in dict_desc.items()
+        }
 
         return metrics_summary
 
+    def extract_vnfpp_metrics_series_values(self, metric):
+        """Gets the values of a metric series, either from its
+        columnar form or from its key/value form, as an array
+        of the metric type
+
+        Arguments:
+            metric {dict} -- A metric containing columns or series
+
+        Returns:
+            numpy.ndarray -- The values of the metric series
+        """
+        metric_columns = metric.get("columns", None)
+
+        if metric_columns:
+            values = metric_columns.get("values", [])
+        else:
+            metric_series = metric.get("series", {})
+            values = [ms.get("value") for ms in metric_series.values()]
+
+        dtypes = {"float": float, "int": int}
+        dtype = dtypes.get(metric.get("type", None), object)
+        metric_values = asarray(values, dtype=dtype)
+
+        return metric_values
+
     def extract_evaluations_metrics(
-        self, snap_origin_role, snap_origin_id, evaluations
+        self, snap_origin_role, snap_origin_id, evaluations, summaries=None
     ):
         evals_metrics = []
+        evals_summaries = summaries if summaries else Summaries()
 
         for evaluation in evaluations.values():
             eval_source = evaluation.get("source")
@@ -268,43 +449,24 @@ class VNFBR:
                     metric_name = metric.get("name")
                     metric_scalar = metric.get("scalar", None)
                     metric_series = metric.get("series", None)
-                    metric_type = metric.get("type", None)
+                    metric_columns = metric.get("columns", None)
 
                     if metric_scalar:
                         metrics[metric_name] = metric_scalar
-                    if metric_series:
-
-                        metric_values_raw = [
-                            ms.get("value") for ms in metric_series.values()
-                        ]
-
-                        metric_values = []
-
-                        for mv in metric_values_raw:
-                            if metric_type == "float":
-                                metric_values.append(float(mv))
-
-                            elif metric_type == "int":
-                                metric_values.append(int(mv))
-
-                            else:
-                                metric_values.append(mv)
-
-                        metrics_series_summary = (
-                            self.extract_vnfpp_metrics_series_summary(
-                                metric_name, metric_values
-                            )
+                    if metric_series or metric_columns:
+                        metric_values = self.extract_vnfpp_metrics_series_values(
+                            metric
                         )
-
-                        metrics.update(metrics_series_summary)
+                        evals_summaries.add(metrics, metric_name, metric_values)
 
                 evals_metrics.append(metrics)
 
-        return evals_metrics
+        if not summaries:
+            evals_summaries.compute()
 
-    def extract_snapshots_metrics(self, snapshots):
-        snapshots_metrics = []
+        return evals_metrics
 
+    def extract_snapshots_metrics(self, snapshots, summaries=None):
         snap_metrics_per_trial = {}
 
         for snapshot in snapshots.values():
@@ -316,58 +478,99 @@ class VNFBR:
             snaps_metrics = snap_metrics_per_trial.setdefault(snap_trial, [])
             snap_evaluations = snapshot.get("evaluations", {})
             evals_metrics = self.extract_evaluations_metrics(
-                snap_origin_role, snap_origin_id, snap_evaluations
+                snap_origin_role, snap_origin_id, snap_evaluations, summaries
             )
 
             if evals_metrics:
                 snaps_metrics.append(evals_metrics)
 
-        for trial, snaps_metrics in snap_metrics_per_trial.items():
-            product_snaps_metrics = list(itertools.product(*snaps_metrics))
-
-            for product in product_snaps_metrics:
-                joint_snaps_metrics = {"trial": trial}
-                for metrics in product:
-                    joint_snaps_metrics.update(metrics)
-
-                snapshots_metrics.append(joint_snaps_metrics)
-
-        return snapshots_metrics
+        return snap_metrics_per_trial
 
-    def extract_reports_metrics(self, reports):
+    def extract_reports_metrics(self, reports, summaries=None):
         reports_metrics = []
 
         for report in reports.values():
             report_test = report.get("test")
             report_snapshots = report.get("snapshots", {})
 
-            snaps_metrics = self.extract_snapshots_metrics(report_snapshots)
-            for snap_metrics in snaps_metrics:
-                snap_metrics["test"] = report_test
-                reports_metrics.append(snap_metrics)
+            snaps_metrics = self.extract_snapshots_metrics(report_snapshots, summaries)
+            reports_metrics.append((report_test, snaps_metrics))
 
         return reports_metrics
 
-    def extract_vnfpp_metrics(self, vnfpp):
+    def extract_vnfpp_metrics(self, vnfpp, summaries=None):
         reports = vnfpp.get("reports", {})
-        report_metrics = self.extract_reports_metrics(reports)
+        report_metrics = self.extract_reports_metrics(reports, summaries)
         return report_metrics
 
-    def parse_vnfpp(self, vnfpp):
-        vnfpp_features = self.extract_vnfpp_metrics(vnfpp)
-        return vnfpp_features
+    def cross_join(self, left, right):
+        """Joins each row of the left frame with each row of
+        the right frame (i.e., their cartesian product), the values
+        of the columns present in both frames are taken from right
+
+        Arguments:
+            left {pandas.DataFrame} -- A frame
+            right {pandas.DataFrame} -- A frame
+
+        Returns:
+            pandas.DataFrame -- The cross join of left and right
+        """
+        columns = list(left.columns)
+        columns.extend([col for col in right.columns if col not in left.columns])
+
+        left = left.drop(columns=[col for col in left.columns if col in right.columns])
+        joint = left.assign(_cross=0).merge(right.assign(_cross=0), on="_cross")
+        joint = joint.drop(columns="_cross")
+
+        return joint[columns]
+
+    def frame_trial(self, test, trial, snaps_metrics):
+        frame = pd.DataFrame([{}])
+
+        for evals_metrics in snaps_metrics:
+            evals_frame = pd.DataFrame(evals_metrics)
+            frame = self.cross_join(frame, evals_frame)
+
+        frame.insert(0, "trial", trial)
+        frame["test"] = test
+        return frame
+
+    def frame_features(self, vnfbd_features, reports_metrics):
+        """Builds the frame of features of an output, i.e.,
+        for each report and trial the cartesian product of the
+        metrics of all its snapshots, along with the vnf-bd features
+
+        Arguments:
+            vnfbd_features {dict} -- The features of a vnf-bd
+            reports_metrics {list} -- The test of each report and
+            the metrics of its snapshots indexed by trial
+
+        Returns:
+            pandas.DataFrame -- The frame of features
+        """
+        frames = [
+            self.frame_trial(test, trial, snaps_metrics)
+            for test, snap_metrics_per_trial in reports_metrics
+            for trial, snaps_metrics in snap_metrics_per_trial.items()
+        ]
+
+        if not frames:
+            return pd.DataFrame()
 
-    def extract_features(self, vnfbd, vnfpp):
-        vnfbr_features = []
+        frame = pd.concat(frames, ignore_index=True, sort=False)
+        vnfbd_columns = pd.DataFrame(
+            {name: [value] * len(frame) for name, value in vnfbd_features.items()}
+        )
 
-        vnfbd_features = self.parse_vnfbd(vnfbd)
-        vnfpp_features = self.parse_vnfpp(vnfpp)
+        # metrics named as a vnf-bd feature take precedence over it
+        overlap = [col for col in frame.columns if col in vnfbd_features]
+        for col in overlap:
+            vnfbd_columns[col] = frame[col].combine_first(vnfbd_columns[col])
 
-        for vnfpp_feature in vnfpp_features:
-            vnfbr_feature = {**vnfbd_features, **vnfpp_feature}
-            vnfbr_features.append(vnfbr_feature)
+        frame = frame.drop(columns=overlap)
+        frame = pd.concat([vnfbd_columns, frame], axis=1)
 
-        return vnfbr_features
+        return frame
 
     def dataframe(self, filedir=None, save=False):
         filedir = "/tmp/gym/results/" if not filedir else filedir
@@ -375,8 +578,7 @@ class VNFBR:
         filename = "vnfbr-" + str(self._data.get("id", 0)) + ".csv"
         filepath = os.path.normpath(os.path.join(filedir, filename))
 
-        features = self.features()
-        df = pd.DataFrame(features)
+        df = self.features()
 
         if save:
             df.to_csv(filepath)
@@ -384,16 +586,37 @@ class VNFBR:
         return df
 
     def features(self):
-        features = []
+        """Extracts the features of all the outputs,
+        computing the summaries of all the metrics series
+        at once and building the frame of each output
+        column-wise
+
+        Returns:
+            pandas.DataFrame -- The features of the outputs
+        """
+        summaries = Summaries()
+        outputs_features = []
         outputs = self._data.get("outputs", {})
 
         for output in outputs.values():
             vnfbd = output.get("vnfbd")
             vnfpp = output.get("vnfpp")
 
-            output_features = self.extract_features(vnfbd, vnfpp)
-            features.extend(output_features)
+            vnfbd_features = self.parse_vnfbd(vnfbd)
+            reports_metrics = self.extract_vnfpp_metrics(vnfpp, summaries)
+            outputs_features.append((vnfbd_features, reports_metrics))
+
+        summaries.compute()
+
+        frames = [
+            self.frame_features(vnfbd_features, reports_metrics)
+            for vnfbd_features, reports_metrics in outputs_features
+        ]
 
+        if not frames:
+            return pd.DataFrame()
+
+        features = pd.concat(frames, ignore_index=True, sort=False)
         return features
 
     def protobuf(self):
@@ -422,6 +645,9 @@ class VNFBR:
 
         if yang_model:
             logger.info(f"Parsing YANG model data successful")
+            if data is not self._data:
+                self._template = None
+
             self._yang = yang_model
             self._data = data
             return True
@@ -450,6 +676,7 @@ class VNFBR:
             self._data = json_format.MessageToDict(
                 self._protobuf, preserving_proto_field_name=True
             )
+            self._template = None
             return True
 
         else:
@@ -465,55 +692,109 @@ class VNFBR:
         deploy = environment.get("deploy", False)
         return deploy
 
-    def multiplex(self, input_vars):
-        vars_data = {}
-
+    def variables(self, input_vars):
         input_vars_dict = dict(input_vars)
+        vars_data = {}
 
         for name, var in input_vars_dict.items():
             var_dict = dict(var)
             values = list(var_dict.get("values"))
             vars_data[name] = values
 
+        return input_vars_dict, vars_data
+
+    def multiplex(self, input_vars):
+        input_vars_dict, vars_data = self.variables(input_vars)
         inputs_mux = self._inputs.multiplex(vars_data)
 
-        whole_mux_inputs = []
         for input_mux in inputs_mux:
 
             whole_input = {}
             for var_name, var_value in input_mux.items():
                 actual_input = input_vars_dict.get(var_name)
-                copy_input = dict(copy.deepcopy(actual_input))
+                copy_input = dict(actual_input)
                 copy_input["values"] = var_value
                 whole_input[var_name] = copy_input
 
-            whole_mux_inputs.append(whole_input)
+            yield whole_input
 
-        return whole_mux_inputs
+    def count(self):
+        """Counts the amount of vnf-bd instances the
+        multiplexing of the inputs variables generates
+
+        Returns:
+            int -- Amount of vnf-bd instances
+        """
+        vnfbr_yang = self.yang()
+        input_vars = vnfbr_yang.inputs.variables
+        _, vars_data = self.variables(input_vars)
+        total = self._inputs.count(vars_data)
+        return total
+
+    def preview(self, amount=10):
+        """Lists the first inputs of the vnf-bd instances
+        the multiplexing of the inputs variables generates
+
+        Keyword Arguments:
+            amount {int} -- Amount of inputs to list (default: {10})
+
+        Returns:
+            list -- The inputs of each vnf-bd instance, i.e.,
+            the value of each variable indexed by its name
+        """
+        vnfbr_yang = self.yang()
+        input_vars = vnfbr_yang.inputs.variables
+        _, vars_data = self.variables(input_vars)
+        inputs_mux = self._inputs.multiplex(vars_data)
+        inputs = list(itertools.islice(inputs_mux, amount))
+        return inputs
+
+    def template(self, vnfbr_yang=None):
+        """Compiles the input vnf-bd into a template only once,
+        i.e., the vnf-bd is parsed into its YANG model once and
+        cached for all the vnf-bd instances
+
+        Keyword Arguments:
+            vnfbr_yang {vnf_br} -- The vnf-br YANG model, if
+            already parsed (default: {None})
+
+        Returns:
+            VNFBDTemplate -- The compiled input vnf-bd template,
+            or None if the input vnf-bd could not be parsed
+        """
+        if not self._template:
+            vnfbr_yang = vnfbr_yang if vnfbr_yang else self.yang()
+            environment = self._data.get("environment", {})
+
+            input_vnfbd = vnfbr_yang.inputs.vnfbd
+            input_vnfbd_dict = self._utils.dictionary(input_vnfbd)
+
+            template = VNFBDTemplate(input_vnfbd_dict, environment)
+
+            if template.compile():
+                self._template = template
+
+        return self._template
 
     def instances(self):
         logger.info("Generating vnf-br instances")
         vnfbr_yang = self.yang()
-        environment = self._data.get("environment", {})
+        template = self.template(vnfbr_yang)
 
-        input_vnfbd = vnfbr_yang.inputs.vnfbd
-        input_vnfbd_dict = self._utils.dictionary(input_vnfbd)
+        if not template:
+            logger.info("Could not compile input vnf-bd template")
+            return
 
         input_vars = vnfbr_yang.inputs.variables
+        _, vars_data = self.variables(input_vars)
         input_mux = self.multiplex(input_vars)
 
-        logger.info(f"Generated: {len(input_mux)} vnf-bd instances")
+        logger.info(f"Generating: {self._inputs.count(vars_data)} vnf-bd instances")
 
         for inputs in input_mux:
+            vnfbd = template.instance(inputs)
 
-            vnfbd = VNFBD()
-            vnfbd.parse(input_vnfbd_dict)
-            vnfbd.set_environment(environment)
-
-            ack = self._utils.fill(vnfbd, inputs)
-
-            if ack:
-                vnfbd.set_inputs(inputs)
+            if vnfbd:
                 yield vnfbd
 
     def add_output(self, vnfbd, vnfpp):
@@ -550,6 +831,7 @@ class VNFBR:
         if yang:
             self._yang_ph = YANGPathHelper()
             self._utils.load(filepath, self._yang, self._yang_ph, is_json=True)
+            self._template = None
 
     def save(self, filedir=None, csv=False):
         filedir = "/tmp/gym/results/" if not filedir else filedir
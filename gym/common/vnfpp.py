@@ -43,6 +43,7 @@ class VNFPP:
 
     def protobuf(self):
         logger.info("Generating vnf-pp protobuf")
+        self.expand_series()
         self._protobuf = VnfPp()
         json_format.ParseDict(self._data, self._protobuf)
         return self._protobuf
@@ -89,9 +90,44 @@ class VNFPP:
         logger.info("vnf-pp message not instance of vnfpp protobuf")
         return False
 
+    def _series(self, columns):
+        """Builds the key/value (dict) form of a metric series
+        from its columnar form (arrays of keys and values)
+
+        Arguments:
+            columns {dict} -- The keys and values of a series
+
+        Returns:
+            dict -- The series items indexed by key
+        """
+        series = {}
+        keys = columns.get("keys", [])
+        values = columns.get("values", [])
+
+        for key, value in zip(keys, values):
+            key = int(key) if float(key).is_integer() else key
+            series[str(key)] = {"key": key, "value": value}
+
+        return series
+
+    def expand_series(self):
+        """Converts all the metrics series of the reports
+        in columnar form into their key/value form, as defined
+        by the vnf-pp model
+        """
+        for report in self._data.get("reports", {}).values():
+            for snapshot in report.get("snapshots", {}).values():
+                for evaluation in snapshot.get("evaluations", {}).values():
+                    for metric in evaluation.get("metrics", {}).values():
+                        columns = metric.pop("columns", None)
+
+                        if columns is not None:
+                            metric["series"] = self._series(columns)
+
     def build(self):
         tz = datetime.now().strftime("%Y-%m-%dT%H:%M:%S.%fZ")
         self._data["timestamp"] = tz
+        self.expand_series()
         self.parse()
 
     def dictionary(self):
@@ -1,13 +1,89 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 
+logger = logging.getLogger(__name__)
+
+
+class Deployment:
+    """Handle of a deploy (i.e., a plugin workflow call) in
+    progress, identified by the deploy id.
+    Plugins record the progress of each step (e.g., of each node)
+    and check if the deploy was cancelled between steps, as their
+    blocking work runs in worker threads that can not be interrupted.
+    """
+
+    def __init__(self, id, workflow):
+        self.id = id
+        self.workflow = workflow
+        self.task = None
+        self._progress = {}
+        self._cancelled = threading.Event()
+
+    def step(self, name, status):
+        """Records the status of a step of the deploy
+
+        Arguments:
+            name {string} -- The name of the step (e.g., a node id)
+            status {string} -- The status of the step (e.g., started)
+        """
+        logger.debug(f"Deploy {self.id} {self.workflow} - {name}: {status}")
+        self._progress[name] = status
+
+    def progress(self):
+        return dict(self._progress)
+
+    def cancel(self):
+        """Cancels the deploy: its pending steps are not
+        executed and its task (if running) is cancelled
+        """
+        logger.info(f"Cancelling deploy {self.id} {self.workflow}")
+        self._cancelled.set()
+
+        if self.task and not self.task.done():
+            self.task.cancel()
+
+    def cancelled(self):
+        return self._cancelled.is_set()
+
 
 class Plugin:
-    
-    def start(self, scenario):
+    def __init__(self, workers=8):
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="plugin"
+        )
+
+    async def run(self, func, *args):
+        """Runs a blocking function in the plugin
+        worker threads, so it does not block the event loop
+
+        Arguments:
+            func {function} -- The blocking function to be called
+            args {list} -- The arguments of func
+
+        Returns:
+            object -- The output of func
+        """
+        loop = asyncio.get_event_loop()
+        output = await loop.run_in_executor(self.executor, func, *args)
+        return output
+
+    def configure(self, parameters):
+        """Configures the plugin with the parameters of
+        the orchestrator of a scenario environment
+
+        Arguments:
+            parameters {dict} -- The orchestrator parameters
+        """
+        pass
+
+    def start(self, scenario, deployment=None):
+        raise NotImplementedError
+
+    def stop(self, scenario=None, deployment=None):
         raise NotImplementedError
 
-    def stop(self, scenario=None):
+    def update(self, scenario, deployment=None):
         raise NotImplementedError
-    
-    def update(self, scenario):
-        raise NotImplementedError
\ No newline at end of file
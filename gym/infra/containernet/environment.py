@@ -4,8 +4,8 @@ import json
 import yaml
 import logging
 import psutil
+import tempfile
 import subprocess
-import time
 
 from mininet.net import Containernet
 from mininet.node import Controller
@@ -14,6 +14,8 @@ from mininet.log import setLogLevel, info
 from mininet.link import TCLink, Link
 from mininet import clean
 
+from gym.common.readiness import wait_ports
+
 LOG = logging.getLogger(__name__)
 
 setLogLevel("info")
@@ -21,13 +23,16 @@ logging.getLogger("requests").setLevel(logging.WARNING)
 logging.getLogger("urllib3").setLevel(logging.WARNING)
 logging.getLogger("docker").setLevel(logging.WARNING)
 
-TRIGGER_DELAY = 10
+READY_TIMEOUT = 60
+READY_ADDRESS = re.compile(r"--address\s+([\w.-]+):(\d+)")
 
 
 class Environment:
-    def __init__(self, topo, cli_mode=False):
+    def __init__(self, topo, cli_mode=False, pool=None):
         self.topo = topo
         self.cli_mode = cli_mode
+        self.pool = pool
+        self.pooled = {}
         self.net = None
         self.nodes = {}
         self.switches = {}
@@ -41,19 +46,19 @@ class Environment:
         self.net.addController("c0")
         LOG.info("Created network: %r" % self.net)
 
-    def _add_container(self, node):
-        def calculate_cpu_cfs_values(cpu_resources):
-            vcpus = int(cpu_resources.get("vcpus", 1))
-            cpu_bw = float(cpu_resources.get("cpu_bw", 1.0))
+    def _cpu_cfs_values(self, cpu_resources):
+        vcpus = int(cpu_resources.get("vcpus", 1))
+        cpu_bw = float(cpu_resources.get("cpu_bw", 1.0))
 
-            cpu_bw_p = 100000 * vcpus
-            cpu_bw_q = int(cpu_bw_p * cpu_bw)
-            return cpu_bw_p, cpu_bw_q
+        cpu_bw_p = 100000 * vcpus
+        cpu_bw_q = int(cpu_bw_p * cpu_bw)
+        return cpu_bw_p, cpu_bw_q
 
+    def _add_container(self, node):
         resources = node.get("resources")
         cpu_resources = resources.get("cpu")
 
-        cpu_bw_p, cpu_bw_q = calculate_cpu_cfs_values(cpu_resources)
+        cpu_bw_p, cpu_bw_q = self._cpu_cfs_values(cpu_resources)
         cpu_cores = cpu_resources.get("pinning", "")
 
         memory = resources.get("memory")
@@ -63,21 +68,75 @@ class Environment:
 
         mng_ip = node.get("mng_intf", None)
 
+        node_id = node.get("id")
+        image = node.get("image")
+        profile = {
+            "volumes": ",".join(volumes),
+            "cpu_period": cpu_bw_p,
+            "cpu_quota": cpu_bw_q,
+            "cpuset_cpus": str(cpu_cores),
+            "mem_limit": str(memory.get("size", 1024)) + "m",
+        }
+        params = {}
+
+        if self.pool:
+            key = self.pool.key(node_id, image, profile)
+            self.pooled[node_id] = key
+            host = self.pool.acquire(key)
+
+            if host:
+                params["cls"] = self._pooled_host(host)
+
         container = self.net.addDocker(
-            node.get("id"),
+            node_id,
             ip=mng_ip,
-            dimage=node.get("image"),
+            dimage=image,
             volumes=volumes,
             cpu_period=cpu_bw_p,
             cpu_quota=cpu_bw_q,
             cpuset_cpus=str(cpu_cores),
             mem_limit=str(memory.get("size", 1024)) + "m",
             memswap_limit=0,
+            **params,
         )
 
-        LOG.debug("Added container: %s", node.get("id"))
+        LOG.debug("Added container: %s", node_id)
         return container
 
+    def _pooled_host(self, host):
+        """Builds the host class used by addDocker to add
+        a pooled host to the network, instead of creating a new one
+
+        Arguments:
+            host {Docker} -- A host handed out by the pool
+
+        Returns:
+            function -- Returns host with its params updated
+        """
+
+        def pooled(name, **params):
+            host.params.update(params)
+            return host
+
+        return pooled
+
+    def _update_container(self, node_id, node):
+        container = self.nodes.get(node_id)
+
+        resources = node.get("resources")
+        cpu_resources = resources.get("cpu")
+
+        cpu_bw_p, cpu_bw_q = self._cpu_cfs_values(cpu_resources)
+        cpu_cores = cpu_resources.get("pinning", "")
+        memory = resources.get("memory")
+
+        container.updateCpuLimit(
+            cpu_quota=cpu_bw_q, cpu_period=cpu_bw_p, cores=str(cpu_cores) or None,
+        )
+        container.updateMemoryLimit(mem_limit=str(memory.get("size", 1024)) + "m")
+
+        LOG.debug("Updated container: %s", node_id)
+
     def _add_nodes(self):
         nodes = self.topo.get("nodes")
 
@@ -184,34 +243,67 @@ class Environment:
             self.net.start()
             LOG.info("Started network: %r" % self.net)
 
-    def _config_sw_flow(self, sw_id, params):
-        LOG.info("_config_sw_flow %s", params)
-        cmd = "add-flow in_port={src},actions=output:{dst}".format(**params)
-        cmd_args = cmd.split(" ")
-        sw = self.switches.get(sw_id)
-        ack = sw.dpctl(*cmd_args)
-        LOG.info("Config switch flow dpctl output %s", ack)
-
-    def _get_sw_port(self, sw, port_name):
-        cmd = "find interface name={0}"
-        cmd = cmd.format(port_name)
-        cmd_args = cmd.split(" ")
-        stats_port = sw.vsctl(*cmd_args)
-        regex = "ofport\s+:\s+([0-9]+)"
-        of_ports = re.findall(regex, stats_port)
-        of_port = of_ports.pop()
-        return of_port
-
-    def _config_map_ports_sw(self, switch_links, sw_id, adjs):
+    def _config_sw_flows(self, sw_id, maps):
+        """Installs all the flows of a switch with a
+        single ovs-ofctl add-flows call
+
+        Arguments:
+            sw_id {string} -- The id of the switch
+            maps {list} -- The src/dst ports of each flow
+        """
+        flows = [
+            "in_port={src},actions=output:{dst}".format(**params) for params in maps
+        ]
+        LOG.info("Config switch %s flows %s", sw_id, flows)
+
+        with tempfile.NamedTemporaryFile("w", suffix=".flows", delete=False) as f:
+            f.write("\n".join(flows) + "\n")
+
+        try:
+            sw = self.switches.get(sw_id)
+            ack = sw.dpctl("add-flows", f.name)
+            LOG.info("Config switch flows dpctl output %s", ack)
+        finally:
+            os.remove(f.name)
+
+    def _get_sw_ports(self, sw):
+        """Queries the OpenFlow port number of all
+        the OVS interfaces with a single ovs-vsctl call
+
+        Arguments:
+            sw {OVSSwitch} -- A switch used to run ovs-vsctl
+
+        Returns:
+            dict -- The port numbers indexed by interface name
+        """
+        stats_ports = sw.vsctl(
+            "--format=csv",
+            "--data=bare",
+            "--no-headings",
+            "--columns=name,ofport",
+            "list",
+            "interface",
+        )
+        ports = {}
+
+        for line in stats_ports.splitlines():
+            fields = line.strip().split(",")
+
+            if len(fields) == 2 and fields[1].isdigit():
+                name, of_port = fields
+                ports[name] = of_port
+
+        return ports
+
+    def _config_map_ports_sw(self, switch_links, sw_id, adjs, ports):
         maps = []
-        sw = self.switches.get(sw_id)
         sw_links = switch_links.get(sw_id)
         default = {"src": None, "dst": None}
 
         for stats in adjs:
             sw_port = stats.intf1.name
             host_port = stats.intf2.name
-            port_num = self._get_sw_port(sw, sw_port)
+            port_num = ports.get(sw_port)
             for sw_link in sw_links:
                 src = sw_link.get("src")
                 dst = sw_link.get("dst")
@@ -227,10 +319,14 @@ class Environment:
 
         if self.config_sw_links:
             LOG.info("Configuring switches flow entries")
+            sw = next(iter(self.switches.values()))
+            ports = self._get_sw_ports(sw)
+
             for sw_id, adjs in self.config_sw_links.items():
-                map_sw_ports = self._config_map_ports_sw(switch_links, sw_id, adjs)
-                for map_ports in map_sw_ports:
-                    self._config_sw_flow(sw_id, map_ports)
+                map_sw_ports = self._config_map_ports_sw(
+                    switch_links, sw_id, adjs, ports
+                )
+                self._config_sw_flows(sw_id, map_sw_ports)
 
     def get_host_ip(self):
         intf = "docker0"
@@ -303,8 +399,46 @@ class Environment:
         finally:
             return p
 
+    def _ready_address(self, entrypoint):
+        """Parses the address a node entrypoint
+        serves on (e.g., gym-agent --address ip:port)
+
+        Arguments:
+            entrypoint {string} -- A formatted lifecycle entrypoint
+
+        Returns:
+            tuple -- (string, string) The host and port of the address,
+            or None if the entrypoint does not define an address
+        """
+        match = READY_ADDRESS.search(entrypoint)
+
+        if match:
+            return match.group(1), match.group(2)
+
+        return None
+
+    def _wait_lifecycle(self, entrypoints):
+        """Waits until the entrypoints started by the nodes
+        lifecycle accept connections in their addresses, probing
+        them with exponential backoff up to READY_TIMEOUT seconds
+
+        Arguments:
+            entrypoints {list} -- The entrypoints started
+        """
+        addresses = [self._ready_address(entrypoint) for entrypoint in entrypoints]
+        addresses = [address for address in addresses if address]
+
+        LOG.info("Waiting nodes addresses to be ready: %s", addresses)
+        pending = wait_ports(addresses, READY_TIMEOUT)
+
+        if pending:
+            LOG.info("Nodes addresses not ready: %s", pending)
+        else:
+            LOG.info("Nodes addresses ready")
+
     def _start_lifecycle(self):
         nodes_topo = self.topo.get("nodes")
+        started = []
 
         for node_id, node in nodes_topo.items():
             format = node.get("format")
@@ -328,6 +462,7 @@ class Environment:
                         if entrypoints:
                             for entrypoint in entrypoints:
                                 node_instance.cmd(entrypoint)
+                                started.append(entrypoint)
                                 LOG.debug(
                                     "Node %s, format %s, workflow start %s ",
                                     node_id,
@@ -354,6 +489,7 @@ class Environment:
                                 if entrypoints:
                                     for entrypoint in entrypoints:
                                         node_instance.cmd(entrypoint)
+                                        started.append(entrypoint)
                                         LOG.debug(
                                             "Node %s, format %s, relationship %s, target %s, workflow start %s ",
                                             node_id,
@@ -374,6 +510,7 @@ class Environment:
                             if entrypoints:
                                 for entrypoint in entrypoints:
                                     node_instance = self._new_process(entrypoint)
+                                    started.append(entrypoint)
                                     self.nodes[node_id] = node_instance
                                     target_id = "host-" + target
                                     LOG.debug(
@@ -385,7 +522,7 @@ class Environment:
                                         entrypoint,
                                     )
 
-        time.sleep(TRIGGER_DELAY)
+        self._wait_lifecycle(started)
 
     def parse_info(self, elements, specie):
         full_info = {}
@@ -449,11 +586,62 @@ class Environment:
         # CLI(self.net)
         return True, self.nodes_info
 
+    def update(self, topo, nodes):
+        """Updates the cpu/memory resources of the running
+        containers of the nodes, keeping the network deployed
+
+        Arguments:
+            topo {dict} -- The parsed scenario containing the nodes
+            nodes {list} -- The ids of the nodes to be updated
+
+        Returns:
+            tuple -- (bool, dict) If the nodes were updated, and the
+            info of the deployed nodes
+        """
+        self.topo = topo
+        nodes_topo = self.topo.get("nodes")
+        ack = True
+
+        for node_id in nodes:
+            node = nodes_topo.get(node_id)
+
+            if node.get("format") == "docker" and self.nodes.get(node_id):
+                try:
+                    self._update_container(node_id, node)
+                except Exception as e:
+                    LOG.info("Node %s not updated: %s", node_id, e)
+                    ack = False
+
+        return ack, self.nodes_info
+
     def _stop_network(self):
         if self.net:
+            released = self._detach_pooled()
             self.net.stop()
             LOG.info("Stopped network: %r" % self.net)
 
+            for key, host in released:
+                kept = self.pool.release(key, host)
+                LOG.info("Host %s kept in pool: %s", host.name, kept)
+
+    def _detach_pooled(self):
+        """Removes the pooled docker hosts from the network,
+        so stopping it removes their links but not their containers
+
+        Returns:
+            list -- The (key, host) of each detached host
+        """
+        detached = []
+
+        for node_id, key in self.pooled.items():
+            host = self.nodes.get(node_id)
+
+            if host in self.net.hosts:
+                self.net.hosts.remove(host)
+                detached.append((key, host))
+
+        return detached
+
     def _stop_processes(self):
         LOG.info("stopping processes")
         nodes_topo = self.topo.get("nodes")
@@ -494,7 +682,11 @@ class Environment:
     def stop(self):
         self._stop_network()
         self._stop_processes()
-        self.mn_cleanup()
+
+        if not self.pool or self.pool.empty():
+            self.mn_cleanup()
+
+        self.pooled = {}
         self.topo_parsed = {}
         self.nodes = {}
         self.switches = {}
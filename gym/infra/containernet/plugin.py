@@ -1,155 +1,74 @@
 import asyncio
 import logging
-import signal
-import time
 import json
+import copy
+import queue
+from itertools import count
 from multiprocessing import Process
 from multiprocessing import Queue 
 
+from gym.common.diff import Diff
 from gym.infra.base import Plugin
+from gym.infra.parser import Parser
 from gym.infra.containernet.environment import Environment
+from gym.infra.containernet.pool import Pool
 
 
 logger = logging.getLogger(__name__)
 
 
-class Parser:
-    def __init__(self):       
-        self.topology = None
-        self.deploy = {}
-
-    def get(self, what):
-        if what == "topology":
-            return self.topology
-        if what == "deploy":
-            return self.deploy
-        return None
-
-    def parse_nodes(self):
-        nodes = self.topology.get("nodes")
-
-        self.deploy["nodes"] = {}
-
-        for node in nodes.values():
-            node_id = node.get("id")
-            self.deploy["nodes"][node_id] = node
-
-            interfaces = node.get("connection_points")
-            faces = {}
-            if interfaces:
-                for intf in interfaces.values():
-                    intf_id = intf.get("id")
-                    faces[intf_id] = intf
-            self.deploy["nodes"][node_id]["interfaces"] = faces
-                
-    def parse_links(self):
-        links = self.topology.get("links")
-
-        self.deploy["links"] = {}
-        self.deploy["switches"] = []
-        self.deploy["port_maps"] = {}
-
-        for link in links.values():
-            link_id = link.get("id")
-            link_type = link.get("type")
-
-            if link_type == "E-Flow":
-                link_network = link.get("network")
-                if link_network not in self.deploy["switches"]:
-                    self.deploy["switches"].append(link_network)
-
-                adjacencies = link.get("connection_points")
-                src, src_inft = adjacencies[0].split(":")
-                dst, dst_intf = adjacencies[1].split(":")
-
-                if link_network not in self.deploy["port_maps"]: 
-                    self.deploy["port_maps"][link_network] = []
-                self.deploy["port_maps"][link_network].append({'src':src_inft, 'dst':link_network})
-                self.deploy["port_maps"][link_network].append({'src':link_network, 'dst':dst_intf})
-
-                link_id_num = 0
-                for (host,host_inft) in [(src,src_inft), (dst,dst_intf)]:
-                    params_dst = {}                    
-                    if host_inft in self.deploy["nodes"][host]["interfaces"]:
-                        face = self.deploy["nodes"][host]["interfaces"].get(host_inft)
-                        params_dst["ip"] = face.get("address", "")                  
-                        link_id_parsed = link_id + str(link_id_num)
-                        self.deploy["links"][link_id_parsed] = {
-                            'type': link_type,
-                            'src': link_network,
-                            'dst': host,
-                            'intf_dst': host_inft,
-                            'params_dst': params_dst,
-                        }
-
-                    link_id_num += 1
-        
-            elif link_type == "E-LAN":
-                link_network = link.get("network")
-                if link_network not in self.deploy["switches"]:
-                    self.deploy["switches"].append(link_network)
-
-                adjacencies = link.get("connection_points")
-                link_id_num = 0
-                for adj in adjacencies:
-                    dst, dst_intf = adj.split(":")
-
-                    params_dst = {}
-                    if dst_intf in self.deploy["nodes"][dst]["interfaces"]:
-                        face = self.deploy["nodes"][dst]["interfaces"].get(dst_intf)
-                        params_dst["ip"] = face.get("address", "")
-                        link_id_parsed = link_id + str(link_id_num)
-                        self.deploy["links"][link_id_parsed] = {
-                            'type': link_type,
-                            'src': link_network,
-                            'dst': dst,
-                            'intf_dst': dst_intf,
-                            'params_dst': params_dst,
-                        }
-                        link_id_num += 1
-
-            elif link_type == "E-Line":
-                adjacencies = link.get("connection_points")
-                logger.info(f"adjacencies: {adjacencies}")
-                src, src_inft = adjacencies[0].split(":")
-                dst, dst_intf = adjacencies[1].split(":")
-
-                params_dst = {}
-                if dst_intf in self.deploy["nodes"][dst]["interfaces"]:
-                    face = self.deploy["nodes"][dst]["interfaces"].get(dst_intf)
-                    params_dst["ip"] = face.get("address", "")
-
-                params_src = {}
-                if src_inft in self.deploy["nodes"][src]["interfaces"]:
-                    face = self.deploy["nodes"][src]["interfaces"].get(src_inft)
-                    params_src["ip"] = face.get("address", "")
-
-                self.deploy["links"][link_id] = {
-                    'type': link_type,
-                    'src': src,
-                    'intf_src': src_inft,
-                    'dst': dst,
-                    'intf_dst': dst_intf,
-                    'params_src': params_src,
-                    'params_dst': params_dst,
-                }
-            else:
-                logger.info("unknown link type %s", link_type)
+WORKER_POLL = 1
+
+
+class Request:
+    """A request to the playground worker
+
+    Arguments:
+        id {int} -- The id of the request, echoed by its response
+        cmd {string} -- The command (start, update or stop)
+
+    Keyword Arguments:
+        scenario {dict} -- The parsed scenario (default: {None})
+        nodes {list} -- The ids of the nodes to be updated (default: {None})
+        pool {dict} -- The size/idle settings of the pool (default: {None})
+    """
+
+    def __init__(self, id, cmd, scenario=None, nodes=None, pool=None):
+        self.id = id
+        self.cmd = cmd
+        self.scenario = scenario
+        self.nodes = nodes
+        self.pool = pool
 
-        logger.info("Plugin links %s", self.deploy["links"])
 
-    def build(self, topology):
-        logger.debug("Containernet plugin parsing topology")
-        logger.debug(f"{topology}")
-        self.topology = topology
-        self.parse_nodes()
-        self.parse_links()
-        return self.deploy
+class Response:
+    """The response of the playground worker to a request
+
+    Arguments:
+        id {int} -- The id of the request
+        ok {bool} -- If the request succeeded
+
+    Keyword Arguments:
+        info {dict} -- The info of the deployed nodes (default: {None})
+        error {string} -- The error of the request, if any (default: {""})
+    """
+
+    def __init__(self, id, ok, info=None, error=""):
+        self.id = id
+        self.ok = ok
+        self.info = info if info is not None else {}
+        self.error = error
 
 
 class Playground:
+    """Long-lived worker process that holds the Containernet
+    environment deployed, and the warm pool of hosts, across deploys.
+    Requests are handled one at a time, as Mininet is not thread safe.
+    """
+
     def __init__(self, in_queue, out_queue):
         self.exp_topo = None
+        self.pool = Pool()
         self.in_queue = in_queue
         self.out_queue = out_queue
         self.init()
@@ -161,59 +80,76 @@ class Playground:
         logger.info("Playground loop started")
         while True:
             try:
-                msg = in_queue.get()
+                request = in_queue.get(timeout=self.pool.idle)
+            except queue.Empty:
+                self.pool.evict()
+            except (EOFError, OSError) as e:
+                logger.info(f"Playground requests queue closed - exception {e}")
+                break
             except Exception as e:
-                logger.debug(f"Exception in the loop: {e}")
+                logger.info(f"Exception in the loop: {repr(e)}")
             else:
-                cmd = msg.get("cmd")
-                scenario = msg.get("scenario")
-                
-                logger.info("Playground command %s", cmd)
-
-                if cmd == "start":
-                    reply = self.start(scenario)
-                elif cmd == "stop":
-                    reply = self.stop()
-                else:
-                    reply = {}
-
-                out_queue.put(reply)
-
-                if cmd == "stop":
-                    break
-
-    def start(self, scenario):
-        self.clear()
-        self.exp_topo = Environment(scenario)       
+                logger.info("Playground request %s %s", request.id, request.cmd)
+                response = self.handle(request)
+                out_queue.put(response)
+
+    def handle(self, request):
+        """Executes a request in the environment
+
+        Arguments:
+            request {Request} -- The request
+
+        Returns:
+            Response -- The response to the request
+        """
+        handlers = {
+            "start": self.start,
+            "update": self.update,
+            "stop": self.stop,
+        }
+        handler = handlers.get(request.cmd)
+
+        if not handler:
+            error = f"Unknown playground command {request.cmd}"
+            return Response(request.id, False, error=error)
+
+        try:
+            ok, info = handler(request)
+        except Exception as e:
+            logger.info("Playground request %s failed: %s", request.id, repr(e))
+            return Response(request.id, False, error=repr(e))
+
+        return Response(request.id, bool(ok), info)
+
+    def start(self, request):
+        if self.exp_topo:
+            logger.info("Stopping running topo %s", self.exp_topo)
+            self.exp_topo.stop()
+        elif self.pool.empty():
+            self.clear()
+
+        if request.pool:
+            self.pool.configure(**request.pool)
+
+        self.exp_topo = Environment(request.scenario, pool=self.pool)
         ok, info = self.exp_topo.start()       
         logger.info("hosts info %s", info)
-        
-        msg = {
-            "info": info,
-            "error": None,
-        }
+        return ok, info
 
-        ack = {
-            'ok': str(ok),
-            'msg': msg, 
-        }
-        return ack
+    def update(self, request):
+        logger.info("Updating topo %s nodes %s", self.exp_topo, request.nodes)
+        ok, info = self.exp_topo.update(request.scenario, request.nodes)
+        return ok, info
 
-    def stop(self):
-        logger.info("Stopping topo %s", self.exp_topo)
-        ack = self.exp_topo.stop()
-        self.exp_topo = None
+    def stop(self, request):
+        ok = True
 
-        msg = {
-            "info": "",
-            "error": "",
-        }
+        if self.exp_topo:
+            logger.info("Stopping topo %s", self.exp_topo)
+            ok, _ = self.exp_topo.stop()
+            self.exp_topo = None
 
-        ack = {
-            'ok': str(ack),
-            'msg': msg, 
-        }
-        return ack
+        return ok, {}
 
     def clear(self):
         exp = Environment({})
@@ -222,69 +158,208 @@ class Playground:
 
 
 class ContainernetPlugin(Plugin):
+    UPDATABLE = ["resources/cpu", "resources/memory"]
+
     def __init__(self):
         Plugin.__init__(self)
         self.parser = Parser()
+        self.diff = Diff()
         self.playground = None
-        self.in_queue = Queue()
-        self.out_queue = Queue()
+        self.responses = None
+        self.requests = {}
+        self.ids = count()
+        self.scenario = None
+        self.info = {}
+        self.pool = {}
+        self.in_queue = None
+        self.out_queue = None
+
+    def configure(self, parameters):
+        """Sets the size and idle timeout of the warm pool of
+        containers from the orchestrator parameters pool_size and
+        pool_idle (a pool_size of 0 disables the pool)
+
+        Arguments:
+            parameters {dict} -- The orchestrator parameters
+        """
+        pool = {
+            "size": parameters.get("pool_size", {}).get("value"),
+            "idle": parameters.get("pool_idle", {}).get("value"),
+        }
+        self.pool = {k: v for k, v in pool.items() if v is not None}
+
+    async def call(self, cmd, scenario=None, nodes=None):
+        """Sends a request to the playground worker (starting
+        it if it is not running) and waits for its response
+
+        Arguments:
+            cmd {string} -- The command of the request
+
+        Keyword Arguments:
+            scenario {dict} -- The parsed scenario (default: {None})
+            nodes {list} -- The ids of the nodes to be updated (default: {None})
+
+        Returns:
+            Response -- The response of the worker
+        """
+        if not self.playground:
+            self._start()
+
+        request = Request(next(self.ids), cmd, scenario, nodes, self.pool)
+        future = asyncio.get_event_loop().create_future()
+        self.requests[request.id] = future
+        self.in_queue.put(request)
+
+        try:
+            response = await future
+        except asyncio.CancelledError:
+            self.requests.pop(request.id, None)
+            self._cancel()
+            raise
 
-    async def call(self, cmd, scenario):
-        msg = {"cmd": cmd, "scenario": scenario}
-        self.in_queue.put(msg)
-        reply = self.out_queue.get()
-        return reply
+        return response
 
     def init(self):
         Playground(self.in_queue, self.out_queue)
-        print("Finished Playground")
 
     def _start(self):
         self.in_queue = Queue()
         self.out_queue = Queue()
-        self.playground = Process(target=self.init)
+        self.playground = Process(target=self.init, daemon=True)
         self.playground.start()
+        self.responses = asyncio.ensure_future(
+            self._responses(self.playground, self.out_queue)
+        )
         logger.info("Started playground")
-                            
-    def _stop(self):       
-        self.playground.join(1)
-        time.sleep(0.5)
-        logger.info("playground alive %s", self.playground.is_alive())        
-        logger.info("playground exitcode ok %s", self.playground.exitcode)
-        self.in_queue = None
-        self.out_queue = None
+
+    def _receive(self, out_queue):
+        try:
+            return out_queue.get(timeout=WORKER_POLL)
+        except queue.Empty:
+            return None
+
+    async def _responses(self, playground, out_queue):
+        """Dispatches the responses of the playground worker
+        to the requests waiting for them, until the worker exits
+
+        Arguments:
+            playground {Process} -- The playground worker process
+            out_queue {Queue} -- The responses queue of the worker
+        """
+        while True:
+            response = await self.run(self._receive, out_queue)
+
+            if response:
+                future = self.requests.pop(response.id, None)
+                if future and not future.done():
+                    future.set_result(response)
+
+            elif not playground.is_alive():
+                break
+
+        if playground is self.playground:
+            self._crashed()
+
+    def _crashed(self):
+        """Handles the exit of the playground worker that
+        was not requested (e.g., a crash): fails the pending requests,
+        and starts a new worker, which cleans up the stale
+        Containernet state in its first start
+        """
+        logger.info(
+            "Playground exited with code %s - restarting it",
+            self.playground.exitcode,
+        )
+
+        self._fail_requests("Playground exited while handling the request")
+        self.scenario = None
+        self.info = {}
+        self._start()
+
+    def _fail_requests(self, error):
+        requests, self.requests = self.requests, {}
+
+        for request_id, future in requests.items():
+            if not future.done():
+                future.set_result(Response(request_id, False, error=error))
+
+    def _cancel(self):
+        logger.info("Cancelling playground")
+        playground = self.playground
         self.playground = None
-        logger.info("Stoped playground")
-
-    async def play(self, command, scenario):       
-        if command == "start":
-            if self.playground:
-                logger.debug("Stopping running playground")
-                await self.call("stop", None)
-                self._stop()
-            
-            self._start()            
-            reply = await self.call(command, scenario)
-
-        elif command == "stop":
-            reply = await self.call(command, scenario)
-            self._stop()
+        self.scenario = None
+        self.info = {}
+        playground.terminate()
+        playground.join(1)
+        self._fail_requests("Playground cancelled while handling the request")
+        logger.info("Cancelled playground")
+
+    async def play(self, command, scenario, nodes=None, deployment=None):
+        if command in ["start", "update", "stop"]:
+            response = await self.call(command, scenario, nodes)
         else:
             logger.debug(f"Unkown playground command {command}")
             return False, {}
-       
-        ack, info = reply.get("ok"), reply.get("msg")
-        return ack, info
 
-    async def start(self, scenario):
+        if response.error:
+            logger.info(f"Playground {command} error: {response.error}")
+
+        if deployment:
+            deployment.step("scenario", f"{command} {response.ok}")
+
+        return response.ok, response.info
+
+    async def start(self, scenario, deployment=None):
         logger.info("Containernet Start")
+        self.scenario = copy.deepcopy(scenario)
         cnet_scenario = self.parser.build(scenario)
-        ok, msg = await self.play("start", cnet_scenario)
-        logger.debug(f"Playground msg: {msg}")       
-        return ok, msg.get("info")
-
-    async def stop(self, scenario=None):     
+        ok, info = await self.play("start", cnet_scenario, deployment=deployment)
+        self.info = info
+        return ok, info
+
+    async def update(self, scenario, deployment=None):
+        """Updates the deployed scenario to the provided one:
+        if they are equal the deployment is reused, if only the cpu/memory
+        resources of deployed nodes changed these are updated in
+        their running containers, otherwise the scenario is redeployed
+
+        Arguments:
+            scenario {dict} -- A vnf-bd scenario
+
+        Returns:
+            tuple -- (bool, dict) If the scenario was updated and
+            the info of its deployed nodes
+        """
+        logger.info("Containernet Update")
+
+        if not self.playground or not self.scenario:
+            return await self.start(scenario, deployment)
+
+        delta = self.diff.compare(self.scenario, scenario)
+
+        if self.diff.empty(delta):
+            logger.info("Containernet scenario unchanged - reusing deployment")
+            return True, self.info
+
+        if self.diff.nodes_only(delta, ContainernetPlugin.UPDATABLE):
+            nodes = list(delta.get("nodes").get("modified"))
+            self.scenario = copy.deepcopy(scenario)
+            cnet_scenario = self.parser.build(scenario)
+            ok, info = await self.play("update", cnet_scenario, nodes, deployment)
+            self.info = info
+            return ok, info
+
+        logger.info("Containernet scenario changed - redeploying")
+        return await self.start(scenario, deployment)
+
+    async def stop(self, scenario=None, deployment=None):
         logger.info("Containernet Stop")
-        ok, msg = await self.play("stop", scenario)
-        logger.debug(f"Playground msg: {msg}")
-        return ok, msg.get("info")
+
+        if not self.playground:
+            logger.debug("No running playground to be stopped")
+            return True, {}
+
+        ok, info = await self.play("stop", scenario, deployment=deployment)
+        self.scenario = None
+        self.info = {}
+        return ok, info
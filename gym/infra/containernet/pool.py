@@ -0,0 +1,149 @@
+import time
+import logging
+
+
+LOG = logging.getLogger(__name__)
+
+
+POOL_SIZE = 8
+POOL_IDLE = 600
+
+RESET_CMD = "kill -9 $(ps -eo pid= | grep -v -w -e 1 -e $$) 2>/dev/null"
+
+
+class Pool:
+    """Warm pool of Containernet docker hosts.
+    When a scenario stops, its docker hosts are reset (i.e., their
+    processes are killed and their links removed) and kept running in
+    the pool, instead of having their containers removed. A later
+    scenario reuses them instead of creating new containers.
+    Hosts are keyed by node id, image and resource profile, as
+    Mininet binds a host to its name (e.g., container mn.<node id>).
+    The pool holds up to size hosts, evicting the least recently
+    released ones, and hosts idle for more than idle seconds.
+    """
+
+    def __init__(self, size=POOL_SIZE, idle=POOL_IDLE):
+        self.size = size
+        self.idle = idle
+        self._hosts = {}
+
+    def configure(self, size=None, idle=None):
+        """Sets the size and idle timeout of the pool,
+        evicting the hosts exceeding them
+
+        Keyword Arguments:
+            size {int} -- Maximum amount of pooled hosts (default: {None})
+            idle {int} -- Maximum idle seconds of a pooled host (default: {None})
+        """
+        if size is not None:
+            self.size = int(size)
+        if idle is not None:
+            self.idle = int(idle)
+
+        self.evict()
+
+    def key(self, node_id, image, profile):
+        """Builds the key of a docker host
+
+        Arguments:
+            node_id {string} -- The id of the node
+            image {string} -- The docker image of the node
+            profile {dict} -- The resource parameters of the container
+            (e.g., cpu_quota, mem_limit)
+
+        Returns:
+            tuple -- The key of the host in the pool
+        """
+        return (node_id, image, tuple(sorted(profile.items())))
+
+    def acquire(self, key):
+        """Hands out a pooled host
+
+        Arguments:
+            key {tuple} -- The key of the host
+
+        Returns:
+            Docker -- A pooled host, or None if there is none for key
+        """
+        entry = self._hosts.pop(key, None)
+
+        if entry:
+            LOG.info("Pool hit for node %s", key[0])
+            return entry.get("host")
+
+        LOG.info("Pool miss for node %s", key[0])
+        return None
+
+    def release(self, key, host):
+        """Resets a host (i.e., kills its processes and detaches its
+        interfaces) and keeps it in the pool, or terminates it if
+        it can not be kept
+
+        Arguments:
+            key {tuple} -- The key of the host
+            host {Docker} -- The docker host
+
+        Returns:
+            bool -- If the host was kept in the pool
+        """
+        if self.size <= 0:
+            self._terminate(host)
+            return False
+
+        try:
+            host.cmd(RESET_CMD)
+            host.intfs.clear()
+            host.ports.clear()
+            host.nameToIntf.clear()
+        except Exception as e:
+            LOG.info("Could not reset host %s: %s", host.name, e)
+            self._terminate(host)
+            return False
+
+        replaced = self._hosts.pop(key, None)
+        if replaced:
+            self._terminate(replaced.get("host"))
+
+        self._hosts[key] = {"host": host, "released": time.monotonic()}
+        self.evict()
+        return key in self._hosts
+
+    def evict(self):
+        """Terminates the hosts idle for more than self.idle
+        seconds, and the least recently released ones exceeding
+        self.size
+        """
+        now = time.monotonic()
+        keys = sorted(self._hosts, key=lambda k: self._hosts[k].get("released"))
+
+        for index, key in enumerate(keys):
+            entry = self._hosts.get(key)
+            exceeding = len(keys) - index > self.size
+            expired = now - entry.get("released") > self.idle
+
+            if exceeding or expired:
+                LOG.info("Evicting pooled host of node %s", key[0])
+                self._hosts.pop(key)
+                self._terminate(entry.get("host"))
+
+    def empty(self):
+        """Checks if the pool holds no hosts
+
+        Returns:
+            bool -- If there are no pooled hosts
+        """
+        return not self._hosts
+
+    def clear(self):
+        """Terminates all the pooled hosts"""
+        for entry in self._hosts.values():
+            self._terminate(entry.get("host"))
+
+        self._hosts = {}
+
+    def _terminate(self, host):
+        try:
+            host.terminate()
+        except Exception as e:
+            LOG.info("Could not terminate host %s: %s", host.name, e)
@@ -5,9 +5,11 @@ import json
 from google.protobuf import json_format
 
 from gym.common.protobuf.gym_grpc import InfraBase
-from gym.common.protobuf.gym_pb2 import Deploy, Built
+from gym.common.protobuf.gym_pb2 import Deploy, Built, Health
 
+from gym.infra.base import Deployment
 from gym.infra.containernet.plugin import ContainernetPlugin
+from gym.infra.netns.plugin import NetnsPlugin
 from gym.infra.ssh.plugin import SSHPlugin
 
 logger = logging.getLogger(__name__)
@@ -18,17 +20,71 @@ class Infra(InfraBase):
         logger.info(f"Infra starting - uuid {info.get('uuid')}")
         self.plugins = {}
         self.plugin_instances = {}
+        self.plugin_locks = {}
+        self.deployments = {}
         self.info = info
         self.load()
 
     def load(self):
         plugins = {
             "containernet": ContainernetPlugin,
+            "netns": NetnsPlugin,
             "ssh": SSHPlugin,
         }
         self.plugins = plugins
 
-    async def play(self, command, environment, scenario):
+    def progress(self, plugin, id_):
+        """Provides the progress of a running deploy
+
+        Arguments:
+            plugin {string} -- The plugin (orchestrator type) of the deploy
+            id_ {int} -- The id of the deploy
+
+        Returns:
+            dict -- The status of each step of the deploy
+            (empty if the deploy is not running)
+        """
+        deployment = self.deployments.get((plugin, id_))
+        progress = deployment.progress() if deployment else {}
+        return progress
+
+    def busy(self, plugin, id_):
+        """Checks if a plugin is running a deploy with another id,
+        i.e., of another scenario, as a plugin hosts a single
+        scenario at a time
+
+        Arguments:
+            plugin {string} -- The plugin (orchestrator type) of the deploy
+            id_ {int} -- The id of the deploy
+
+        Returns:
+            int -- The id of the other deploy running, or None
+        """
+        for running_plugin, running_id in self.deployments:
+            if running_plugin == plugin and running_id != id_:
+                return running_id
+
+        return None
+
+    def cancel(self, plugin, id_):
+        """Cancels a running deploy
+
+        Arguments:
+            plugin {string} -- The plugin (orchestrator type) of the deploy
+            id_ {int} -- The id of the deploy
+
+        Returns:
+            bool -- If there was a running deploy to be cancelled
+        """
+        deployment = self.deployments.get((plugin, id_))
+
+        if deployment:
+            deployment.cancel()
+            return True
+
+        return False
+
+    async def play(self, command, environment, scenario, deployment=None):
         ack, info = False, {}
 
         orchestrator = environment.get("orchestrator")
@@ -42,13 +98,19 @@ class Infra(InfraBase):
                 plugin_instance = plugin_cls()
                 self.plugin_instances[orchestrator_type] = plugin_instance
 
-            if plugin_instance:
+            plugin_lock = self.plugin_locks.setdefault(
+                orchestrator_type, asyncio.Lock()
+            )
+
+            async with plugin_lock:
+                plugin_instance.configure(orchestrator.get("parameters", {}))
+
                 if command == "start":
-                    ack, info = await plugin_instance.start(scenario)
+                    ack, info = await plugin_instance.start(scenario, deployment)
                 elif command == "stop":
-                    ack, info = await plugin_instance.stop(scenario)
+                    ack, info = await plugin_instance.stop(scenario, deployment)
                 elif command == "update":
-                    ack, info = await plugin_instance.update(scenario)
+                    ack, info = await plugin_instance.update(scenario, deployment)
                 else:
                     logger.info(f"Unknown infra plugin command {command}")
 
@@ -68,9 +130,56 @@ class Infra(InfraBase):
         scenario = deploy_dict.get("scenario")
         environment = deploy_dict.get("environment")
 
-        ok, info = await self.play(command, environment, scenario)
+        plugin = environment.get("orchestrator", {}).get("type")
+        key = (plugin, id_)
+
+        busy = self.busy(plugin, id_)
+        if busy is not None:
+            error = f"Deploy {id_} {command} refused - plugin busy with deploy {busy}"
+            logger.info(error)
+            built = Built(id=id_, ack=str(False), error=error, info=b"{}")
+            await stream.send_message(built)
+            return
+
+        running = self.deployments.get(key)
+        if running and command == "stop":
+            self.cancel(plugin, id_)
+
+        deployment = Deployment(id_, command)
+        self.deployments[key] = deployment
+        deployment.task = asyncio.create_task(
+            self.play(command, environment, scenario, deployment)
+        )
+
+        error = ""
+        try:
+            ok, info = await deployment.task
+            # plugins acknowledge with a bool or its string
+            ok = str(ok) == "True"
+            if not ok:
+                error = f"Deploy {id_} {command} failed"
+
+        except asyncio.CancelledError:
+            if not deployment.cancelled():
+                raise
+
+            ok, info = False, {}
+            error = f"Deploy {id_} {command} cancelled"
+            logger.info(f"{error} - progress {deployment.progress()}")
+
+        finally:
+            if self.deployments.get(key) is deployment:
+                self.deployments.pop(key)
+
         info_json = json.dumps(info)
         built_info = info_json.encode("utf-8")
-        built = Built(id=id_, ack=ok, info=built_info)
+        built = Built(id=id_, ack=str(ok), error=error, info=built_info)
 
         await stream.send_message(built)
+
+    async def Ready(self, stream):
+        await stream.recv_message()
+        reply = Health(
+            uuid=self.info.get("uuid"), role=self.info.get("role"), ready=True
+        )
+        await stream.send_message(reply)
@@ -0,0 +1,397 @@
+import os
+import re
+import json
+import signal
+import logging
+import ipaddress
+import subprocess
+
+from gym.common.readiness import wait_ports
+
+
+LOG = logging.getLogger(__name__)
+
+
+NS_PREFIX = "gym-"
+VETH_PREFIX = "gv"
+BRIDGE_PREFIX = "gbr"
+MNG_BRIDGE = "gbr-mng"
+MNG_INTF = "eth0"
+MNG_NETWORK = "10.254.0.0/24"
+WORKDIR = "/tmp/gym/netns"
+STATE = "state.json"
+
+READY_TIMEOUT = 60
+READY_ADDRESS = re.compile(r"--address\s+([\w.-]+):(\d+)")
+
+
+class Environment:
+    """Realizes a parsed scenario with Linux network namespaces.
+    Each docker node becomes a namespace (its image is not used), having
+    a management interface (eth0) in a bridge of the host, and its
+    lifecycle entrypoints run as processes inside it.
+    Process nodes run inside the namespace of their HostedOn target,
+    or in the host if AttachesTo.
+    E-Line links are veth pairs between namespaces, and E-LAN/E-Flow
+    links are veth pairs attached to a Linux bridge per network.
+    All the ip commands of the host, and of each namespace, are
+    executed in a single ip -batch call.
+    The namespaces and host links created are recorded in a state
+    file, so an environment left by a killed infra is cleaned up
+    without touching other namespaces or links of the host.
+    """
+
+    def __init__(self, topo, mng_network=MNG_NETWORK):
+        self.topo = topo
+        self.mng_network = ipaddress.ip_network(mng_network)
+        self.namespaces = {}
+        self.bridges = {}
+        self.links = []
+        self.processes = []
+        self.nodes_info = {}
+        self._veths = 0
+        self._batches = {}
+
+    def _ip(self, commands, namespace=None, force=False):
+        """Executes ip commands in a single ip -batch call
+
+        Arguments:
+            commands {list} -- The ip commands (without the ip prefix)
+
+        Keyword Arguments:
+            namespace {string} -- The namespace where the commands are
+            executed, the host if None (default: {None})
+            force {bool} -- If the commands after a failed one must
+            still be executed (default: {False})
+
+        Returns:
+            bool -- If all the commands succeeded
+        """
+        args = ["ip", "-batch", "-"]
+        if namespace:
+            args = ["ip", "-n", namespace, "-batch", "-"]
+        if force:
+            args.insert(1, "-force")
+
+        result = subprocess.run(
+            args, input="\n".join(commands) + "\n", capture_output=True, text=True,
+        )
+
+        if result.returncode != 0:
+            LOG.info("ip commands failed in %s: %s", namespace, result.stderr)
+            return False
+
+        return True
+
+    def _batch(self, namespace, *commands):
+        self._batches.setdefault(namespace, []).extend(commands)
+
+    def _flush(self):
+        """Executes the ip commands batched, the ones of the host
+        first (e.g., creating namespaces and moving veths into them)
+
+        Returns:
+            bool -- If all the commands succeeded
+        """
+        batches, self._batches = self._batches, {}
+        ok = self._ip(batches.pop(None, []))
+
+        for namespace, commands in batches.items():
+            ok = self._ip(commands, namespace) and ok
+
+        return ok
+
+    def _veth(self):
+        self._veths += 1
+        name = f"{VETH_PREFIX}{self._veths}"
+        return f"{name}a", f"{name}b"
+
+    def _add_intf(self, namespace, veth, intf, address):
+        self._batch(None, f"link set {veth} netns {namespace}")
+        self._batch(namespace, f"link set {veth} name {intf}")
+
+        if address:
+            self._batch(namespace, f"addr add {address} dev {intf}")
+
+        self._batch(namespace, f"link set {intf} up")
+
+    def _add_mng(self):
+        gateway = next(self.mng_network.hosts())
+        prefix = self.mng_network.prefixlen
+
+        self._batch(
+            None,
+            f"link add {MNG_BRIDGE} type bridge",
+            f"addr add {gateway}/{prefix} dev {MNG_BRIDGE}",
+            f"link set {MNG_BRIDGE} up",
+        )
+        self.links.append(MNG_BRIDGE)
+
+    def _add_namespace(self, node_id, mng_ip):
+        namespace = NS_PREFIX + node_id
+        prefix = self.mng_network.prefixlen
+        veth_host, veth_node = self._veth()
+
+        self._batch(
+            None,
+            f"netns add {namespace}",
+            f"link add {veth_host} type veth peer name {veth_node}",
+            f"link set {veth_host} master {MNG_BRIDGE}",
+            f"link set {veth_host} up",
+        )
+        self.links.append(veth_host)
+        self._batch(namespace, "link set lo up")
+        self._add_intf(namespace, veth_node, MNG_INTF, f"{mng_ip}/{prefix}")
+
+        self.namespaces[node_id] = namespace
+        self.nodes_info[node_id] = {
+            "ip": str(mng_ip),
+            "broadcast": str(self.mng_network.broadcast_address),
+            "mask": str(self.mng_network.netmask),
+        }
+        LOG.debug("Added namespace %s for node %s", namespace, node_id)
+
+    def _add_nodes(self):
+        nodes = self.topo.get("nodes")
+        mng_ips = self.mng_network.hosts()
+        next(mng_ips)
+
+        for node_id, node in nodes.items():
+            format = node.get("format")
+
+            if format == "docker":
+                self._add_namespace(node_id, next(mng_ips))
+
+            elif format != "process":
+                LOG.info("Node %s not added, unknown format %s", node_id, format)
+
+    def _add_bridge(self, network):
+        bridge = self.bridges.get(network)
+
+        if not bridge:
+            bridge = f"{BRIDGE_PREFIX}{len(self.bridges)}"
+            self._batch(
+                None, f"link add {bridge} type bridge", f"link set {bridge} up",
+            )
+            self.bridges[network] = bridge
+            self.links.append(bridge)
+
+        return bridge
+
+    def _add_links(self):
+        links = self.topo.get("links")
+
+        for link_id, link in links.items():
+            link_type = link.get("type")
+            src, dst = link.get("src"), link.get("dst")
+            dst_ns = self.namespaces.get(dst)
+            dst_ip = link.get("params_dst", {}).get("ip")
+
+            if link_type in ["E-LAN", "E-Flow"] and dst_ns:
+                bridge = self._add_bridge(src)
+                veth_bridge, veth_node = self._veth()
+
+                self._batch(
+                    None,
+                    f"link add {veth_bridge} type veth peer name {veth_node}",
+                    f"link set {veth_bridge} master {bridge}",
+                    f"link set {veth_bridge} up",
+                )
+                self.links.append(veth_bridge)
+                self._add_intf(dst_ns, veth_node, link.get("intf_dst"), dst_ip)
+                LOG.info("Link %s added, type %s", link_id, link_type)
+
+            elif link_type == "E-Line" and dst_ns and self.namespaces.get(src):
+                src_ns = self.namespaces.get(src)
+                src_ip = link.get("params_src", {}).get("ip")
+                veth_src, veth_dst = self._veth()
+
+                self._batch(None, f"link add {veth_src} type veth peer name {veth_dst}")
+                self._add_intf(src_ns, veth_src, link.get("intf_src"), src_ip)
+                self._add_intf(dst_ns, veth_dst, link.get("intf_dst"), dst_ip)
+                LOG.info("Link %s added, type %s", link_id, link_type)
+
+            else:
+                LOG.info("Link %s not added, type %s", link_id, link_type)
+
+    def _format_workflow(self, workflow, node_info):
+        implementations = workflow.get("implementation")
+        parameters = workflow.get("parameters")
+        fmt_kwargs = {}
+
+        if not parameters:
+            return implementations
+
+        for param in parameters.values():
+            value = param.get("value")
+            args = value.split(":")
+
+            if args[0] == "get_attrib":
+                fmt_kwargs[param.get("input")] = node_info.get(args[1])
+            else:
+                fmt_kwargs[param.get("input")] = value
+
+        entrypoints = [
+            implementation.format(**fmt_kwargs) for implementation in implementations
+        ]
+        return entrypoints
+
+    def _run(self, node_id, entrypoint, namespace=None):
+        """Runs an entrypoint via shell, inside a namespace or in
+        the host, in its own session (so its background processes
+        can be killed with it)
+
+        Arguments:
+            node_id {string} -- The id of the node of the entrypoint
+            entrypoint {string} -- The entrypoint
+
+        Keyword Arguments:
+            namespace {string} -- The namespace where the entrypoint is
+            executed, the host if None (default: {None})
+        """
+        workdir = os.path.join(WORKDIR, node_id)
+        os.makedirs(workdir, exist_ok=True)
+
+        args = ["sh", "-c", entrypoint]
+        if namespace:
+            args = ["ip", "netns", "exec", namespace, *args]
+
+        process = subprocess.Popen(
+            args,
+            cwd=workdir,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        self.processes.append(process)
+        LOG.debug("Node %s, namespace %s, started %s", node_id, namespace, entrypoint)
+
+    def _start_lifecycle(self):
+        nodes_topo = self.topo.get("nodes")
+        mng_gateway = str(next(self.mng_network.hosts()))
+        started = []
+
+        for node_id, node in nodes_topo.items():
+            workflows = node.get("lifecycle", {})
+            start_workflows = [
+                workflow
+                for workflow in workflows.values()
+                if workflow.get("workflow") == "start"
+            ]
+
+            namespace, node_info = None, None
+
+            if node.get("format") == "docker":
+                namespace = self.namespaces.get(node_id)
+                node_info = self.nodes_info.get(node_id)
+
+            elif node.get("format") == "process":
+                for rel in node.get("relationships", {}).values():
+                    if rel.get("type") == "HostedOn":
+                        namespace = self.namespaces.get(rel.get("target"))
+                        node_info = self.nodes_info.get(rel.get("target"))
+
+                    if rel.get("type") == "AttachesTo":
+                        node_info = {"ip": mng_gateway}
+
+                if node_info:
+                    self.nodes_info[node_id] = node_info
+
+            if node_info:
+                for workflow in start_workflows:
+                    for entrypoint in self._format_workflow(workflow, node_info):
+                        self._run(node_id, entrypoint, namespace)
+                        started.append(entrypoint)
+
+        addresses = [READY_ADDRESS.search(entrypoint) for entrypoint in started]
+        addresses = [address.groups() for address in addresses if address]
+        pending = wait_ports(addresses, READY_TIMEOUT)
+
+        if pending:
+            LOG.info("Nodes addresses not ready: %s", pending)
+
+    def _stop_processes(self):
+        for namespace in self.namespaces.values():
+            pids = subprocess.run(
+                ["ip", "netns", "pids", namespace], capture_output=True, text=True,
+            )
+
+            for pid in pids.stdout.split():
+                self._kill(os.kill, int(pid))
+
+        for process in self.processes:
+            self._kill(os.killpg, process.pid)
+            process.wait()
+
+        self.processes = []
+
+    def _kill(self, kill, pid):
+        try:
+            kill(pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def _state(self):
+        return os.path.join(WORKDIR, STATE)
+
+    def _save(self):
+        """Records the namespaces and host links of the environment
+        before they are created
+        """
+        os.makedirs(WORKDIR, exist_ok=True)
+        state = {"namespaces": list(self.namespaces.values()), "links": self.links}
+
+        with open(self._state(), "w") as f:
+            json.dump(state, f)
+
+    def cleanup(self):
+        """Removes the namespaces and host links left by a previous
+        environment (e.g., of an infra that was killed), as recorded
+        in its state file
+        """
+        try:
+            with open(self._state()) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        commands = [f"netns delete {ns}" for ns in state.get("namespaces", [])]
+        commands += [f"link delete {link}" for link in state.get("links", [])]
+
+        if commands:
+            LOG.info("Cleaning up %s", commands)
+            self._ip(commands, force=True)
+
+        os.remove(self._state())
+
+    def start(self):
+        self.cleanup()
+        self._add_mng()
+        self._add_nodes()
+        self._add_links()
+        self._save()
+        ok = self._flush()
+
+        if ok:
+            self._start_lifecycle()
+
+        LOG.info("Scenario running: %s", ok)
+        return ok, self.nodes_info
+
+    def stop(self):
+        self._stop_processes()
+
+        commands = [f"netns delete {ns}" for ns in self.namespaces.values()]
+        commands += [f"link delete {bridge}" for bridge in self.bridges.values()]
+        commands.append(f"link delete {MNG_BRIDGE}")
+        ok = self._ip(commands, force=True)
+
+        if ok and os.path.exists(self._state()):
+            os.remove(self._state())
+
+        self.namespaces = {}
+        self.bridges = {}
+        self.links = []
+        self.nodes_info = {}
+        return ok, {}
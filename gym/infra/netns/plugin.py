@@ -0,0 +1,100 @@
+import copy
+import logging
+
+from gym.common.diff import Diff
+from gym.infra.base import Plugin
+from gym.infra.parser import Parser
+from gym.infra.netns.environment import Environment, MNG_NETWORK
+
+
+logger = logging.getLogger(__name__)
+
+
+class NetnsPlugin(Plugin):
+    """Deploys scenarios with Linux network namespaces,
+    for fast local scenarios that do not need container isolation
+    (i.e., docker images are not used, only namespaces, veths and
+    bridges). It requires root privileges (i.e., CAP_NET_ADMIN).
+    """
+
+    def __init__(self):
+        Plugin.__init__(self)
+        self.parser = Parser()
+        self.diff = Diff()
+        self.environment = None
+        self.scenario = None
+        self.info = {}
+        self.mng_network = MNG_NETWORK
+
+    def configure(self, parameters):
+        """Sets the management network of the namespaces
+        from the orchestrator parameter mng_network
+
+        Arguments:
+            parameters {dict} -- The orchestrator parameters
+        """
+        mng_network = parameters.get("mng_network", {}).get("value")
+        self.mng_network = mng_network or MNG_NETWORK
+
+    def _stop(self, deployment=None):
+        ok = True
+
+        if self.environment:
+            ok, _ = self.environment.stop()
+            self.environment = None
+
+            if deployment:
+                deployment.step("scenario", f"stop {ok}")
+
+        self.scenario = None
+        self.info = {}
+        return ok
+
+    def _start(self, scenario, deployment=None):
+        self._stop()
+
+        if deployment and deployment.cancelled():
+            return False, {}
+
+        netns_scenario = self.parser.build(copy.deepcopy(scenario))
+        self.environment = Environment(netns_scenario, self.mng_network)
+        ok, info = self.environment.start()
+
+        if deployment:
+            deployment.step("scenario", f"start {ok}")
+
+        self.scenario = copy.deepcopy(scenario)
+        self.info = info
+        return ok, info
+
+    async def start(self, scenario, deployment=None):
+        logger.info("Netns Start")
+        ok, info = await self.run(self._start, scenario, deployment)
+        return str(ok), info
+
+    async def update(self, scenario, deployment=None):
+        """Updates the deployed scenario to the provided one:
+        if they are equal the deployment is reused, otherwise
+        the scenario is redeployed (i.e., it takes less than a second)
+
+        Arguments:
+            scenario {dict} -- A vnf-bd scenario
+
+        Returns:
+            tuple -- (string, dict) If the scenario was updated and
+            the info of its deployed nodes
+        """
+        logger.info("Netns Update")
+
+        if self.environment and self.diff.empty(
+            self.diff.compare(self.scenario, scenario)
+        ):
+            logger.info("Netns scenario unchanged - reusing deployment")
+            return str(True), self.info
+
+        return await self.start(scenario, deployment)
+
+    async def stop(self, scenario=None, deployment=None):
+        logger.info("Netns Stop")
+        ok = await self.run(self._stop, deployment)
+        return str(ok), {}
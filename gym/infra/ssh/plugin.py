@@ -1,11 +1,20 @@
+import io
 import os
 import re
+import copy
+import time
+import shlex
+import hashlib
+import posixpath
+import asyncio
 import logging
+import threading
 import paramiko
-import traceback
+from contextlib import contextmanager
 from scp import SCPClient, SCPException
 
 
+from gym.common.diff import Diff
 from gym.infra.base import Plugin
 
 
@@ -40,78 +49,232 @@ class Parser:
         return self.deploy
 
 
-class SSHProxy:
+class Sessions:
+    """Pool of keep-alive SSH sessions (paramiko clients) indexed
+    by node address (host:port:user), so all the commands and file
+    uploads to a node are multiplexed (as channels) over a single
+    transport, instead of a new handshake for each one.
+    Sessions whose transport is no longer active are reopened, and
+    sessions not used for idle seconds are closed.
+    """
+
+    def __init__(self, keepalive=30, idle=300):
+        self._keepalive = keepalive
+        self._idle = idle
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def _key(self, cfg):
+        key = "{}:{}:{}".format(
+            cfg.get("address").get("value"),
+            cfg.get("port").get("value"),
+            cfg.get("user").get("value"),
+        )
+        return key
+
+    def _open(self, cfg):
+        client = paramiko.SSHClient()
+        # client.load_system_host_keys()
+        client.set_missing_host_key_policy(paramiko.WarningPolicy())
+
+        try:
+            client.connect(
+                hostname=cfg.get("address").get("value"),
+                port=cfg.get("port").get("value"),
+                username=cfg.get("user").get("value"),
+                password=cfg.get("password").get("value"),
+                look_for_keys=False,
+                timeout=60,
+            )
+        except Exception:
+            client.close()
+            raise
+
+        client.get_transport().set_keepalive(self._keepalive)
+        return client
+
+    def _evict(self):
+        now = time.monotonic()
+
+        idle_keys = [
+            key
+            for key, session in self._sessions.items()
+            if session.get("users") == 0 and now - session.get("used") > self._idle
+        ]
+
+        for key in idle_keys:
+            logger.debug(f"Closing idle ssh session {key}")
+            session = self._sessions.pop(key)
+
+            if session.get("client"):
+                session.get("client").close()
+
+    @contextmanager
+    def connect(self, cfg):
+        """Provides the pooled session of a node,
+        opening it if it does not exist or is not active
+
+        Arguments:
+            cfg {dict} -- The ssh configuration of the node
+            (address, port, user and password)
+
+        Yields:
+            SSHClient -- A connected paramiko client
+        """
+        key = self._key(cfg)
+
+        with self._lock:
+            self._evict()
+            session = self._sessions.setdefault(
+                key, {"client": None, "lock": threading.Lock(), "users": 0}
+            )
+            session["users"] += 1
+
+        try:
+            with session.get("lock"):
+                client = session.get("client")
+                transport = client.get_transport() if client else None
+
+                if not transport or not transport.is_active():
+                    logger.debug(f"Opening ssh session {key}")
+                    session["client"] = self._open(cfg)
+
+            yield session.get("client")
+
+        finally:
+            with self._lock:
+                session["users"] -= 1
+                session["used"] = time.monotonic()
+
+    def discard(self, cfg):
+        """Closes and removes the session of a node,
+        e.g., when a command failed in its transport
+
+        Arguments:
+            cfg {dict} -- The ssh configuration of the node
+        """
+        key = self._key(cfg)
+
+        with self._lock:
+            session = self._sessions.pop(key, None)
+
+        if session and session.get("client"):
+            logger.debug(f"Discarding ssh session {key}")
+            session.get("client").close()
+
+    def close(self):
+        """Closes all the sessions in the pool"""
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+
+        for session in sessions.values():
+            if session.get("client"):
+                session.get("client").close()
+
+
+class Blobs:
+    """Content-addressed view of local files: each file is
+    split in chunks, and the file and each of its chunks are
+    identified by their sha256 digest. Manifests are cached by
+    file path, size and modification time, so files are hashed only
+    when they change. Remote nodes keep the chunks in a blob store,
+    so only the chunks missing there are transferred (i.e., a changed
+    large file sends only its changed chunks).
+    Chunks not used by any sync for RETENTION seconds are pruned
+    from the remote store.
+    """
+
+    CHUNK = 4 * 1024 * 1024
+    STORE = "/tmp/gym/blobs"
+    RETENTION = 24 * 60 * 60
+
     def __init__(self):
+        self._manifests = {}
+        self._lock = threading.Lock()
+
+    def manifest(self, filepath):
+        """Provides the digests of a local file and its chunks
+
+        Arguments:
+            filepath {string} -- Path of the local file
+
+        Returns:
+            dict -- The digest of the file, the digests of its
+            chunks (in order) and its size
+        """
+        stat = os.stat(filepath)
+        key = (filepath, stat.st_size, stat.st_mtime)
+
+        with self._lock:
+            manifest = self._manifests.get(key)
+
+        if not manifest:
+            file_hash = hashlib.sha256()
+            chunks = []
+
+            with open(filepath, "rb") as fp:
+                for data in iter(lambda: fp.read(Blobs.CHUNK), b""):
+                    file_hash.update(data)
+                    chunks.append(hashlib.sha256(data).hexdigest())
+
+            manifest = {
+                "digest": file_hash.hexdigest(),
+                "chunks": chunks,
+                "size": stat.st_size,
+            }
+
+            with self._lock:
+                self._manifests[key] = manifest
+
+        return manifest
+
+    def chunk(self, filepath, index):
+        with open(filepath, "rb") as fp:
+            fp.seek(index * Blobs.CHUNK)
+            data = fp.read(Blobs.CHUNK)
+        return data
+
+
+class SSHProxy:
+    def __init__(self, sessions=None, blobs=None):
         self._cfg = None
-        self._client = None
+        self._sessions = sessions if sessions else Sessions()
+        self._blobs = blobs if blobs else Blobs()
 
     def cfg(self, cfg):
         logger.debug(f"SSHProxy cfg set: {cfg}")
         self._cfg = cfg
 
-    def _connect(self):
-        connect_flag = True
-        try:
-            self._client = paramiko.SSHClient()
-            # self._client.load_system_host_keys()
-            self._client.set_missing_host_key_policy(paramiko.WarningPolicy())
-            
-            self._client.connect(
-                hostname=self._cfg.get("address").get("value"), 
-                port=self._cfg.get("port").get("value"),
-                username=self._cfg.get("user").get("value"),
-                password=self._cfg.get("password").get("value"),
-                look_for_keys=False,
-                timeout=60,
-            )      
-        
-        except Exception as e:
-            logger.debug(f"ssh connect exception: {e.__class__}, {e}")
-            traceback.print_exc()
-            
-            try:
-                self._client.close()
-            except:
-                pass
-            finally:
-                connect_flag = False
-                self._client = None
-        
-        finally:
-            return connect_flag
-
     def execute_command(self, command):
         """Execute a command on the remote host."""
 
-        self.ssh_output = None
         result_flag = True
         result = ""
 
         try:
-            if self._connect():                
+            with self._sessions.connect(self._cfg) as client:
                 logger.info("Executing command --> {}".format(command))
-                _, stdout, stderr = self._client.exec_command(command, timeout=60)
-                self.ssh_output = stdout.read()
-                self.ssh_error = stderr.read()
+                _, stdout, stderr = client.exec_command(command, timeout=60)
+                ssh_output = stdout.read()
+                ssh_error = stderr.read()
                 
-                if self.ssh_error:
-                    logger.info(f"Problem occurred while running command: error {self.ssh_error}")
+                if ssh_error:
+                    logger.info(f"Problem occurred while running command: error {ssh_error}")
                     # result_flag = False
-                    result = self.ssh_error
-                
-                if self.ssh_output:    
-                    logger.info(f"Command execution completed successfully: output {self.ssh_output}")
-                    result = self.ssh_output
+                    result = ssh_error
                 
-                self._client.close()
-            else:
-                print("Could not establish SSH connection")
-                result_flag = False   
+                if ssh_output:    
+                    logger.info(f"Command execution completed successfully: output {ssh_output}")
+                    result = ssh_output
         
-        except paramiko.SSHException:
-            logger.info(f"Failed to execute the commands {command}")
-            self._client.close()
+        except (paramiko.SSHException, OSError) as e:
+            logger.info(f"Failed to execute the commands {command} - exception {e}")
+            self._sessions.discard(self._cfg)
             result_flag = False    
+
+        except Exception as e:
+            logger.info(f"Could not establish SSH connection - exception {e}")
+            result_flag = False
  
         return result_flag, result
 
@@ -119,35 +282,158 @@ class SSHProxy:
         """This method uploads a local file to a remote server"""
         
         result_flag = True
-        if self._connect():
-            try:
-            
-                self.scp = SCPClient(self._client.get_transport())
+
+        try:
+            with self._sessions.connect(self._cfg) as client:
+                scp = SCPClient(client.get_transport())
                 
-                self.scp.put(local_filepath,
-                            recursive=True,
-                            remote_path=remote_filepath)
+                scp.put(local_filepath,
+                        recursive=True,
+                        remote_path=remote_filepath)
                 
-                self._client.close()
+                scp.close()
     
-            except Exception as e:
-                logger.info(f"Unable to upload the file {local_filepath}"
-                            f" to the remote server - exception {e}")
-                
-                result_flag = False
-                self._client.close()
-        else:
-            logger.info("Could not establish SSH connection")
+        except (paramiko.SSHException, SCPException, OSError) as e:
+            logger.info(f"Unable to upload the file {local_filepath}"
+                        f" to the remote server - exception {e}")
+            
+            result_flag = False
+            self._sessions.discard(self._cfg)
+
+        except Exception as e:
+            logger.info(f"Could not establish SSH connection - exception {e}")
             result_flag = False  
     
         return result_flag
 
+    def _remote(self, client, command):
+        _, stdout, stderr = client.exec_command(command, timeout=60)
+        output = stdout.read().decode("utf-8")
+        code = stdout.channel.recv_exit_status()
+        return code, output
+
+    def _sync(self, client, local_filepath, remote_filepath):
+        manifest = self._blobs.manifest(local_filepath)
+        digest = manifest.get("digest")
+
+        remote = shlex.quote(remote_filepath)
+        store = shlex.quote(Blobs.STORE)
+
+        code, output = self._remote(client, f"sha256sum {remote}")
+        if code == 0 and output.split(" ")[0] == digest:
+            logger.info(f"File {remote_filepath} up to date - digest {digest}")
+            return True
+
+        code, _ = self._remote(client, f"mkdir -p {store}")
+        if code != 0:
+            return False
+
+        sftp = client.open_sftp()
+
+        try:
+            stored = set(sftp.listdir(Blobs.STORE))
+            chunks = manifest.get("chunks")
+            missing = [
+                index for index, chunk in enumerate(chunks) if chunk not in stored
+            ]
+
+            logger.info(
+                f"Sending {len(missing)} out of {len(chunks)} chunks "
+                f"of {local_filepath} to {remote_filepath}"
+            )
+
+            for index in missing:
+                data = self._blobs.chunk(local_filepath, index)
+                chunk_filepath = posixpath.join(Blobs.STORE, chunks[index])
+                sftp.putfo(io.BytesIO(data), chunk_filepath + ".part")
+                sftp.posix_rename(chunk_filepath + ".part", chunk_filepath)
+
+        finally:
+            sftp.close()
+
+        chunks_filepaths = " ".join(
+            shlex.quote(posixpath.join(Blobs.STORE, chunk)) for chunk in chunks
+        )
+        chunks_filepaths = chunks_filepaths if chunks_filepaths else "/dev/null"
+        remote_dir = shlex.quote(posixpath.dirname(remote_filepath))
+        remote_part = shlex.quote(remote_filepath + ".part")
+        retention = Blobs.RETENTION // 60
+
+        # the chunks used are touched, so the prune of the store
+        # removes only the chunks (and partial uploads) unused since
+        # the retention period
+        command = (
+            f"mkdir -p {remote_dir} && "
+            f"cat {chunks_filepaths} > {remote_part} && "
+            f"mv {remote_part} {remote} && "
+            f"(touch -c {chunks_filepaths}; "
+            f"find {store} -maxdepth 1 -type f -mmin +{retention} -delete; "
+            f"sha256sum {remote})"
+        )
+        code, output = self._remote(client, command)
+        synced = code == 0 and output.split(" ")[0] == digest
+        return synced
+
+    def sync_file(self, local_filepath, remote_path):
+        """Uploads a local file (or the files in a local directory)
+        to a remote path only if its content changed, transferring
+        only the chunks missing in the remote blob store
+
+        Arguments:
+            local_filepath {string} -- Path of the local file/directory
+            remote_path {string} -- Remote directory where the file
+            (or directory) is placed, as in upload_file
+
+        Returns:
+            bool -- If the remote file is synchronized with the local one
+        """
+        local_filepath = local_filepath.rstrip(os.sep)
+        name = os.path.basename(local_filepath)
+        files = {}
+
+        if os.path.isdir(local_filepath):
+            for root, _, filenames in os.walk(local_filepath):
+                for filename in filenames:
+                    filepath = os.path.join(root, filename)
+                    relpath = os.path.relpath(filepath, local_filepath)
+                    files[filepath] = posixpath.join(
+                        remote_path, name, *relpath.split(os.sep)
+                    )
+        else:
+            files[local_filepath] = posixpath.join(remote_path, name)
+
+        try:
+            with self._sessions.connect(self._cfg) as client:
+                acks = [
+                    self._sync(client, filepath, remote_filepath)
+                    for filepath, remote_filepath in files.items()
+                ]
+                result_flag = all(acks)
+
+        except (paramiko.SSHException, OSError) as e:
+            logger.info(f"Unable to sync the file {local_filepath}"
+                        f" to the remote server - exception {e}")
+            self._sessions.discard(self._cfg)
+            result_flag = False
+
+        except Exception as e:
+            logger.info(f"Could not establish SSH connection - exception {e}")
+            result_flag = False
+
+        return result_flag
+
 
 class Environment:
     def __init__(self):
-        self.proxy = SSHProxy()
         self._ssh_cfg = {}
         self._config = {}
+        self._sessions = Sessions()
+        self._blobs = Blobs()
+
+    def _proxy(self, cfg):
+        proxy = SSHProxy(self._sessions, self._blobs)
+        proxy.cfg(cfg)
+        return proxy
 
     def _get_mng_host_ip(self, node_id):
         logger.info(f"Get management ip address from node {node_id}")
@@ -156,12 +442,11 @@ class Environment:
         if not cfg:
             cfg = self._get_ssh_cfg(node_id)            
         
-        if cfg:
-            self.proxy.cfg(cfg)
+        proxy = self._proxy(cfg)
 
         intf = 'eth0'
         command = "ifconfig {} 2>/dev/null".format(intf)
-        ack, config = self.proxy.execute_command(command)
+        ack, config = proxy.execute_command(command)
         
         if ack: 
             if not config:
@@ -241,6 +526,8 @@ class Environment:
 
     def _gym_configure_map(self, step):
         local_filepath = self._filepath("files/gym.tar.xz")
+        digest = self._blobs.manifest(local_filepath).get("digest")
+        installed = shlex.quote("/home/gym/.gym.tar.xz.installed")
         
         steps_map = {
             "ssh-copy:gym": {
@@ -250,8 +537,10 @@ class Environment:
             },
             "ssh-install:gym": {
                 "type": "cmd",
-                "cmd": "cd /home/gym/ && tar xf gym.tar.xz && "
-                       "cd gym && sudo python3.7 setup.py install"
+                "cmd": f"test \"$(cat {installed} 2>/dev/null)\" = {digest} || "
+                       f"(cd /home/gym/ && tar xf gym.tar.xz && "
+                       f"cd gym && sudo python3.7 setup.py install && "
+                       f"echo {digest} > {installed})"
             }
         }
         
@@ -262,7 +551,7 @@ class Environment:
         cfg = self._ssh_cfg.setdefault(node_id, workflow.get("parameters"))
         
         if cfg:
-            self.proxy.cfg(cfg)
+            proxy = self._proxy(cfg)
             steps = workflow.get("implementation", [])
             
             logger.debug(f"Configure implementation steps for node {node_id} - steps {steps}")
@@ -277,7 +566,7 @@ class Environment:
                         logger.info(f"SSH configure: push file local in {node_id} "
                                     f"{local_path} to remote {remote_path}")
 
-                        ack = self.proxy.upload_file(local_path, remote_path)
+                        ack = proxy.sync_file(local_path, remote_path)
                         logger.info(f"SSH configure: push file ran {ack}")
 
                     elif step_map.get("type") == "cmd":
@@ -285,7 +574,7 @@ class Environment:
                         logger.info(f"SSH configure: run command "
                                     f"{command} remotely in {node_id}")
                         
-                        ack, _ = self.proxy.execute_command(command)
+                        ack, _ = proxy.execute_command(command)
                         logger.info(f"SSH configure: command ran {ack}")
 
                     else:
@@ -307,14 +596,14 @@ class Environment:
             cfg = self._get_ssh_cfg(node_id)            
         
         if cfg:
-            self.proxy.cfg(cfg)
+            proxy = self._proxy(cfg)
             commands = self._format_workflow(node_id, workflow)
 
             for command in commands:                
                 logger.info(f"SSH start: run command "
                             f"{command} remotely in {node_id}")
                 
-                ack, _ = self.proxy.execute_command(command)
+                ack, _ = proxy.execute_command(command)
                 logger.info(f"SSH start: command ran {ack}")
 
                 acks.append(ack)
@@ -333,14 +622,14 @@ class Environment:
             cfg = self._get_ssh_cfg(node_id)            
         
         if cfg:
-            self.proxy.cfg(cfg)
+            proxy = self._proxy(cfg)
             commands = self._format_workflow(node_id, workflow)
 
             for command in commands:                
                 logger.info(f"SSH stop: run command "
                             f"{command} remotely in {node_id}")
                 
-                ack = self.proxy.execute_command(command)
+                ack, _ = proxy.execute_command(command)
                 logger.info(f"SSH stop: command ran {ack}")
                 acks.append(ack)
 
@@ -350,53 +639,91 @@ class Environment:
         else:
             return False
 
-    def _nodes_info(self):
-        info = {}
+    def set_config(self, config):
+        self._config = config
 
-        for node_id in self._config.get("nodes"):
-            node_ips = self._get_mng_host_ip(node_id)
-            info[node_id] = node_ips
+    def forget(self, node_ids):
+        """Removes the cached ssh configuration of nodes
+        (e.g., removed nodes or nodes whose configure workflow changed)
 
-        return info
+        Arguments:
+            node_ids {list} -- The ids of the nodes
+        """
+        for node_id in node_ids:
+            self._ssh_cfg.pop(node_id, None)
 
-    def start(self, config):
-        acks = []
-        self._config = config 
+    def node_info(self, node_id):
+        node_ips = self._get_mng_host_ip(node_id)
+        return node_ips
 
-        for node_id, workflows in config.get("nodes").items():
+    def start_node(self, node_id, workflows, deployment=None):
+        """Configures (if it has a configure workflow) and starts
+        a node. It is a blocking call, run by the plugin in a worker
+        thread, so nodes can be started concurrently
 
-            configure = workflows.get("configure", {})
-            if configure:
-                self._configure(node_id, configure)
+        Arguments:
+            node_id {string} -- The id of the node
+            workflows {dict} -- The parsed lifecycle workflows of the node
 
+        Keyword Arguments:
+            deployment {Deployment} -- The handle of the deploy, where
+            the progress of the node is recorded (default: {None})
 
-            start = workflows.get("start", {})
-            if start:
-                ack = self._start(node_id, start)
-                acks.append(ack)
-        
-        if all(acks):
-            info = self._nodes_info()
-            return True, info
+        Returns:
+            bool -- If the node was started
+        """
+        ack = True
 
-        else:
-            return False, {}
+        for step in ["configure", "start"]:
+            workflow = workflows.get(step, {})
 
-    def stop(self, config):
-        acks = []
-        for node_id, workflows in config.get("nodes").items():
-            stop = workflows.get("stop", {})
+            if not workflow:
+                continue
 
-            if stop:
-                ack = self._stop(node_id, stop)
-                acks.append(ack)
-        
-        if all(acks):
-            info = self._nodes_info()
-            return True, info
+            if deployment and deployment.cancelled():
+                return False
 
-        else:
-            return False, {}
+            if deployment:
+                deployment.step(node_id, step)
+
+            if step == "configure":
+                self._configure(node_id, workflow)
+            else:
+                ack = self._start(node_id, workflow)
+
+        if deployment:
+            deployment.step(node_id, "started" if ack else "failed")
+
+        return ack
+
+    def stop_node(self, node_id, workflows, deployment=None):
+        """Stops a node, a blocking call run by the plugin
+        in a worker thread, so nodes can be stopped concurrently
+
+        Arguments:
+            node_id {string} -- The id of the node
+            workflows {dict} -- The parsed lifecycle workflows of the node
+
+        Keyword Arguments:
+            deployment {Deployment} -- The handle of the deploy, where
+            the progress of the node is recorded (default: {None})
+
+        Returns:
+            bool -- If the node was stopped
+        """
+        ack = True
+        stop = workflows.get("stop", {})
+
+        if stop:
+            if deployment and deployment.cancelled():
+                return False
+
+            ack = self._stop(node_id, stop)
+
+        if deployment:
+            deployment.step(node_id, "stopped" if ack else "failed")
+
+        return ack
 
 
 class SSHPlugin(Plugin):
@@ -404,17 +731,140 @@ class SSHPlugin(Plugin):
         Plugin.__init__(self)
         self.parser = Parser()
         self.env = Environment()
+        self.diff = Diff()
+        self.scenario = None
+        self.info = {}
+
+    async def nodes(self, call, nodes, deployment=None):
+        """Runs the blocking call of each node concurrently
+        in the plugin worker threads
+
+        Arguments:
+            call {function} -- Environment node call
+            (i.e., start_node or stop_node)
+            nodes {dict} -- The parsed workflows of the nodes
+            indexed by node id
+
+        Keyword Arguments:
+            deployment {Deployment} -- The handle of the deploy
+            (default: {None})
+
+        Returns:
+            bool -- If the call succeeded in all the nodes
+        """
+        aws = [
+            self.run(call, node_id, workflows, deployment)
+            for node_id, workflows in nodes.items()
+        ]
+        acks = await asyncio.gather(*aws)
+        return all(acks)
+
+    async def nodes_info(self, node_ids):
+        aws = [self.run(self.env.node_info, node_id) for node_id in node_ids]
+        infos = await asyncio.gather(*aws)
+        info = dict(zip(node_ids, infos))
+        return info
 
-    async def start(self, scenario):
+    async def start(self, scenario, deployment=None):
         ack, info = False, {}
+        self.scenario = copy.deepcopy(scenario)
         deploy = self.parser.parse(scenario)
-        ack, info = self.env.start(deploy)
+        self.env.set_config(deploy)
+
+        ack = await self.nodes(self.env.start_node, deploy.get("nodes"), deployment)
+
+        if ack:
+            info = await self.nodes_info(list(deploy.get("nodes")))
+
+        self.info = info
         logger.info(f"SSHPlugin Start ack {ack} - info {info}")
         return str(ack), info
 
-    async def stop(self, scenario):
+    async def update(self, scenario, deployment=None):
+        """Updates the deployed scenario to the provided one,
+        running the workflows only of the nodes that were added,
+        removed or had their lifecycle modified
+        (i.e., the deployment is reused if the nodes are equal):
+        removed nodes are stopped, added nodes are configured and
+        started, and nodes with modified lifecycle workflows are stopped
+        (with the previous workflow) and started again (with the current one)
+
+        Arguments:
+            scenario {dict} -- A vnf-bd scenario
+
+        Keyword Arguments:
+            deployment {Deployment} -- The handle of the deploy
+            (default: {None})
+
+        Returns:
+            tuple -- (string, dict) If the scenario was updated and
+            the info of its nodes
+        """
+        if not self.scenario:
+            return await self.start(scenario, deployment)
+
+        delta = self.diff.compare(self.scenario, scenario)
+        nodes_delta = delta.get("nodes")
+
+        if not any(nodes_delta.values()):
+            logger.info(f"SSHPlugin Update nodes unchanged - reusing deployment")
+            return str(True), self.info
+
+        previous = Parser().parse(self.scenario)
+        deploy = Parser().parse(scenario)
+
+        modified = nodes_delta.get("modified")
+        restart = [
+            node_id
+            for node_id, changed in modified.items()
+            if any(path.startswith("lifecycle/") for path in changed)
+        ]
+        reconfigure = [
+            node_id
+            for node_id, changed in modified.items()
+            if any(path.startswith("lifecycle/configure/") for path in changed)
+        ]
+
+        stops = {
+            node_id: previous.get("nodes").get(node_id)
+            for node_id in nodes_delta.get("removed") + restart
+        }
+        starts = {
+            node_id: dict(deploy.get("nodes").get(node_id))
+            for node_id in nodes_delta.get("added") + restart
+        }
+        for node_id in restart:
+            if node_id not in reconfigure:
+                starts[node_id].pop("configure", None)
+
+        self.env.set_config(previous)
+        stop_ack = await self.nodes(self.env.stop_node, stops, deployment)
+
+        self.env.set_config(deploy)
+        self.env.forget(nodes_delta.get("removed") + reconfigure)
+        start_ack = await self.nodes(self.env.start_node, starts, deployment)
+
+        ack, info = False, {}
+        if stop_ack and start_ack:
+            ack = True
+            info = await self.nodes_info(list(deploy.get("nodes")))
+
+        self.scenario = copy.deepcopy(scenario)
+        self.info = info
+        logger.info(f"SSHPlugin Update ack {ack} - info {info}")
+        return str(ack), info
+
+    async def stop(self, scenario, deployment=None):
         ack, info = False, {}
         deploy = self.parser.parse(scenario)
-        ack, info = self.env.stop(deploy)
+        self.env.set_config(deploy)
+
+        ack = await self.nodes(self.env.stop_node, deploy.get("nodes"), deployment)
+
+        if ack:
+            info = await self.nodes_info(list(deploy.get("nodes")))
+
+        self.scenario = None
+        self.info = {}
         logger.info(f"SSHPlugin Stop ack {ack} - info {info}")
-        return str(ack), info
\ No newline at end of file
+        return str(ack), info
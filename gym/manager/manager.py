@@ -17,6 +17,11 @@ class Manager(ManagerBase):
         reply = await self.core.info(request)
         await stream.send_message(reply)
 
+    async def Ready(self, stream):
+        request = await stream.recv_message()
+        reply = await self.core.health(request)
+        await stream.send_message(reply)
+
     async def CallTask(self, stream):
         request = await stream.recv_message()
         reply = await self.core.task(request)
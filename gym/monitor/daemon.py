@@ -0,0 +1,557 @@
+import json
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from gym.common.tools import Runtime
+
+
+logger = logging.getLogger(__name__)
+
+
+DAEMON_INTERVAL = 1.0
+DAEMON_MIN_INTERVAL = 0.01
+DAEMON_RETENTION = 300
+DAEMON_CAPACITY = 6000
+DAEMON_SOURCES = 32
+DAEMON_EXPIRE = 1.0
+
+
+class Buffer:
+    """Ring buffer of the samples of a source, bounded by
+    capacity (amount of samples) and retention (seconds)
+    """
+
+    def __init__(self, capacity=DAEMON_CAPACITY, retention=DAEMON_RETENTION):
+        self.retention = retention
+        self._samples = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def append(self, sample):
+        """Appends a sample, dropping the ones older than retention
+
+        Arguments:
+            sample {tuple} -- (float, dict) The epoch time of the sample
+            and the sample itself
+        """
+        tm, _ = sample
+        oldest = tm - self.retention
+
+        with self._lock:
+            while self._samples and self._samples[0][0] < oldest:
+                self._samples.popleft()
+
+            self._samples.append(sample)
+
+    def resize(self, capacity, retention):
+        with self._lock:
+            self._samples = deque(self._samples, maxlen=capacity)
+            self.retention = retention
+
+    def window(self, start, stop):
+        """Gets the samples in the time window [start, stop]
+
+        Arguments:
+            start {float} -- Epoch time (seconds) of the window start
+            stop {float} -- Epoch time (seconds) of the window stop
+
+        Returns:
+            list -- The samples as (time, sample) tuples
+        """
+        with self._lock:
+            return [(tm, s) for (tm, s) in self._samples if start <= tm <= stop]
+
+
+class Source:
+    """A listener sampled continuously by the coordinator,
+    i.e., with the same options (e.g., target) and interval its
+    samples are kept in a buffer and shared by all the queries for
+    them. A source without interval is sampled on demand, only at
+    the edges of the windows of its queries.
+    """
+
+    def __init__(self, listener, opts, interval, buffer):
+        self.listener = listener
+        self.opts = opts
+        self.interval = interval
+        self.buffer = buffer
+        self.queried = time.monotonic()
+        self.due = None
+        self.missed = 0
+        self._call = None
+        self._failed = False
+        self._busy = threading.Lock()
+
+    def start(self):
+        """Prepares the listener to be sampled
+
+        Returns:
+            bool -- If the listener could be sampled with opts
+        """
+        self._call = self.listener.sampler(self.opts)
+        return self._call is not None
+
+    def running(self):
+        return self._call is not None and not self._failed
+
+    def acquire(self):
+        """Reserves the source for a sample, if it is not
+        still taking a previous one
+
+        Returns:
+            bool -- If the source was reserved
+        """
+        return self._busy.acquire(blocking=False)
+
+    def take(self, tm, mono):
+        """Takes a sample of the listener (the source must be
+        reserved), stopping the source if the listener fails
+
+        Arguments:
+            tm {float} -- Epoch time (seconds) of the tick
+            mono {float} -- Monotonic time (seconds) of the tick
+        """
+        try:
+            tm = tm + time.monotonic() - mono
+            self.buffer.append((tm, self._call(tm)))
+
+        except Exception as e:
+            logger.info(f"Source {self.listener.name} stopped - exception {repr(e)}")
+            self._failed = True
+
+        finally:
+            self._busy.release()
+
+    def edge(self):
+        """Takes a sample of the listener on demand (i.e., at
+        an edge of the window of a query), waiting for a sample
+        being taken by another query
+        """
+        self._busy.acquire()
+        self.take(time.time(), time.monotonic())
+
+
+class Coordinator:
+    """Samples all the sources of the daemon from a single
+    clock: each source has its own deadlines on the monotonic
+    clock (its first sample + k * interval), and the clock sleeps
+    until the earliest deadline, taking the samples of the sources
+    due, once per source no matter how many calls query it.
+    The samples are taken in a pool of threads, so a slow source
+    (e.g., docker stats) does not delay the others. A deadline
+    passed while a source still takes its previous sample is missed
+    (i.e., skipped, not taken late), keeping the samples of each
+    source spaced by its interval.
+    While there are sources, expire is called (in the pool of
+    threads) at most once per DAEMON_EXPIRE seconds.
+    """
+
+    def __init__(self, workers=DAEMON_SOURCES, expire=None):
+        self._sources = {}
+        self._expire = expire
+        self._expired = 0.0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="sampler"
+        )
+
+    def _tick(self, mono):
+        """Takes the samples of the sources due at a time
+
+        Arguments:
+            mono {float} -- Monotonic time (seconds) of the tick
+
+        Returns:
+            float -- Seconds until the next deadline of the sources,
+            or None if there are no sources
+        """
+        tm = time.time()
+
+        with self._lock:
+            sources = list(self._sources.values())
+
+        deadlines = []
+
+        for source in sources:
+            if not source.running():
+                continue
+
+            if source.due is None:
+                source.due = mono
+
+            if mono >= source.due:
+                late = int((mono - source.due) // source.interval)
+                source.due += (late + 1) * source.interval
+                source.missed += late
+
+                if source.acquire():
+                    self._executor.submit(source.take, tm, mono)
+                else:
+                    source.missed += 1
+                    logger.debug(f"Source {source.listener.name} missed tick {tm}")
+
+            deadlines.append(source.due)
+
+        if sources and self._expire:
+            if mono - self._expired >= DAEMON_EXPIRE:
+                self._expired = mono
+                self._executor.submit(self._expire)
+
+            deadlines.append(self._expired + DAEMON_EXPIRE)
+
+        return min(deadlines) - mono if deadlines else None
+
+    def _run(self, stop):
+        while not stop.is_set():
+            self._wake.clear()
+            delay = self._tick(time.monotonic())
+            self._wake.wait(delay)
+
+    def _start(self):
+        if not self._thread:
+            self._stop = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._stop,),
+                name="daemon-coordinator",
+                daemon=True,
+            )
+            self._thread.start()
+            logger.info("Coordinator started")
+
+    def _halt(self):
+        self._stop.set()
+        self._wake.set()
+
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def add(self, key, source):
+        """Adds a source, sampled from its next tick on
+
+        Arguments:
+            key {tuple} -- The key of the source
+            source {Source} -- The source
+        """
+        with self._lock:
+            self._sources[key] = source
+
+        self._start()
+        self._wake.set()
+
+    def remove(self, key):
+        """Removes a source
+
+        Arguments:
+            key {tuple} -- The key of the source
+        """
+        with self._lock:
+            self._sources.pop(key, None)
+
+    def close(self):
+        with self._lock:
+            self._sources = {}
+
+        self._halt()
+
+
+class Daemon(Runtime):
+    """Resident sampling daemon of the Monitor.
+    It keeps listeners (host, process, docker, net) sampled
+    continuously, each one in its own source, keeping the
+    samples in ring buffers. A listener call becomes a query
+    of the time window [start - baseline, start + duration] over
+    the buffer of its source, instead of a listener sampling
+    only for its duration (i.e., no warm-up per call, and the
+    baseline seconds before the call can be looked back).
+    Calls with the same listener options and interval (e.g.,
+    instances of an action, or actions only differing in duration)
+    share a single source, sampled by the coordinator at that
+    interval, so the rates of its samples (e.g., cpu_percent) are
+    computed over the interval of the calls.
+    Listeners without an interval parameter (e.g., network) are
+    sampled only at the edges of the window of each call, their
+    baseline covering the samples taken by previous calls.
+    A source is started by the first call for it, and stopped
+    retention seconds after its last query, or when
+    the amount of sources exceeds the maximum (least recently
+    queried ones first).
+    Listeners that can not be sampled continuously are called
+    as in the Runtime.
+    """
+
+    def __init__(
+        self,
+        retention=DAEMON_RETENTION,
+        capacity=DAEMON_CAPACITY,
+        sources=DAEMON_SOURCES,
+        workers=32,
+    ):
+        Runtime.__init__(self, workers)
+        self.retention = retention
+        self.capacity = capacity
+        self.sources = sources
+        self.coordinator = Coordinator(sources, expire=self._expire)
+        self._sources = {}
+        self._buffers = {}
+        self._listeners = {}
+        self._sources_lock = threading.Lock()
+
+    def configure(self, retention=None, capacity=None):
+        """Sets the retention and capacity of the buffers
+
+        Keyword Arguments:
+            retention {float} -- Seconds of samples kept (default: {None})
+            capacity {int} -- Maximum samples kept per source (default: {None})
+        """
+        if retention:
+            self.retention = float(retention)
+        if capacity:
+            self.capacity = int(capacity)
+
+        for buffer in self._buffers.values():
+            buffer.resize(self.capacity, self.retention)
+
+    def _opts(self, filepath, args):
+        """Builds the options of a listener call, i.e., the
+        args serialized as the listener does before sampling
+
+        Arguments:
+            filepath {string} -- Path to the listener file
+            args {dict} -- Args of the listener call
+
+        Returns:
+            dict -- The options of the listener
+        """
+        listener = self._listeners.get(filepath)
+
+        if not listener:
+            listener = self._class(filepath)()
+            self._listeners[filepath] = listener
+
+        options, _ = listener.serialize(args)
+        opts = listener.options(options).get("opts")
+        return opts
+
+    def _key(self, filepath, opts, interval):
+        if isinstance(opts, dict):
+            opts = {k: v for k, v in opts.items() if k not in ["interval", "duration"]}
+        return (filepath, json.dumps(opts, sort_keys=True, default=str), interval)
+
+    def _args(self, filepath, args):
+        """Gets the interval, duration and baseline of a listener call.
+        Listeners without an interval parameter (e.g., network) have
+        no interval, i.e., they are sampled at the edges of the window
+
+        Arguments:
+            filepath {string} -- Path to the listener file
+            args {dict} -- Args of the listener call (baseline is removed)
+
+        Returns:
+            tuple -- (float, float, float) Seconds of the interval
+            (or None), duration and baseline of the call
+        """
+        parameters = getattr(self._class(filepath), "PARAMETERS", {})
+        interval = None
+
+        if "interval" in parameters:
+            interval = float(args.get("interval", DAEMON_INTERVAL))
+            interval = max(interval, DAEMON_MIN_INTERVAL)
+
+        duration = float(args.get("duration", 0))
+        baseline = float(args.pop("baseline", 0))
+        return interval, duration, baseline
+
+    def _source(self, filepath, args, interval):
+        """Gets the source of a listener call, starting it if
+        it is not running
+
+        Arguments:
+            filepath {string} -- Path to the listener file
+            args {dict} -- Args of the listener call
+            interval {float} -- Seconds between samples of the source,
+            None if sampled on demand
+
+        Returns:
+            Source -- The running source, or None if the listener
+            can not be sampled continuously
+        """
+        with self._sources_lock:
+            opts = self._opts(filepath, args)
+            key = self._key(filepath, opts, interval)
+            source = self._start(key, filepath, opts, interval)
+            self._evict()
+            return source
+
+    def _start(self, key, filepath, opts, interval):
+        source = self._sources.get(key)
+
+        if source and source.running():
+            return source
+
+        listener = self._class(filepath)()
+        buffer = self._buffers.setdefault(key, Buffer(self.capacity, self.retention))
+        source = Source(listener, opts, interval, buffer)
+
+        if not source.start():
+            self._stop(key)
+            return None
+
+        self._sources[key] = source
+
+        if interval:
+            logger.info(f"Daemon sampling {key} every {interval} seconds")
+            self.coordinator.add(key, source)
+        else:
+            logger.info(f"Daemon sampling {key} on demand")
+
+        return source
+
+    def _stop(self, key):
+        self._sources.pop(key, None)
+        self._buffers.pop(key, None)
+        self.coordinator.remove(key)
+
+    def _evict(self):
+        """Stops the sources not queried for retention seconds,
+        and the least recently queried ones exceeding the maximum
+        amount of sources
+        """
+        now = time.monotonic()
+        keys = sorted(self._sources, key=lambda k: self._sources[k].queried)
+
+        for index, key in enumerate(keys):
+            source = self._sources.get(key)
+            exceeding = len(keys) - index > self.sources
+            expired = now - source.queried > self.retention
+
+            if exceeding or expired:
+                logger.info(f"Daemon stopping source {key}")
+                self._stop(key)
+
+    def _expire(self):
+        """Stops the sources expired, i.e., when queries finish
+        and periodically by the coordinator
+        """
+        with self._sources_lock:
+            self._evict()
+
+    def _missed(self, samples, interval):
+        """Counts the ticks of a source missed among the samples
+        of a window, i.e., the gaps between them larger than its interval
+
+        Arguments:
+            samples {list} -- The samples as (time, sample) tuples
+            interval {float} -- Seconds between samples of the source,
+            None if sampled on demand
+
+        Returns:
+            int -- The amount of ticks missed
+        """
+        if not interval:
+            return 0
+
+        times = [tm for tm, _ in samples]
+        gaps = [round((tm - last) / interval) - 1 for last, tm in zip(times, times[1:])]
+        return sum(max(gap, 0) for gap in gaps)
+
+    def _recall(self, source, filepath, args, start, stop):
+        samples = source.buffer.window(start, stop)
+        missed = self._missed(samples, source.interval)
+        samples = [sample for _, sample in samples]
+
+        listener = self._class(filepath)()
+        output = listener.recall(args, samples, start, stop, missed)
+        output_json = json.dumps(output, default=str)
+        return json.loads(output_json)
+
+    async def query(self, filepath, args):
+        """Queries the buffer of the source of a listener
+        call for the time window of the call, waiting its end
+
+        Arguments:
+            filepath {string} -- Path to the listener file
+            args {dict} -- Args of the listener call, where
+            baseline is the amount of seconds before the call
+            included in the window
+
+        Returns:
+            dict -- Contains the output of the call, or None
+            if the listener can not be sampled continuously
+        """
+        loop = asyncio.get_event_loop()
+        args = dict(args)
+        interval, duration, baseline = self._args(filepath, args)
+        source = await loop.run_in_executor(
+            self._executor, self._source, filepath, args, interval
+        )
+
+        if not source:
+            return None
+
+        start = time.time()
+        stop = start + duration
+        source.queried = time.monotonic() + duration
+
+        if source.interval:
+            await asyncio.sleep(duration + source.interval)
+        else:
+            await loop.run_in_executor(self._executor, source.edge)
+            await asyncio.sleep(duration)
+            await loop.run_in_executor(self._executor, source.edge)
+            stop = max(stop, time.time())
+
+        output = await loop.run_in_executor(
+            self._executor,
+            self._recall,
+            source,
+            filepath,
+            args,
+            start - baseline,
+            stop,
+        )
+        await loop.run_in_executor(self._executor, self._expire)
+        return {"output": output}
+
+    async def call(self, filepath, args):
+        """Executes the listener call as a query of the daemon
+        buffers, or in the Runtime if the listener can not be
+        sampled continuously
+
+        Arguments:
+            filepath {string} -- Path to the registered tool
+            args {dict} -- Args of the tool call
+
+        Returns:
+            dict -- Contains the output of the call or its stderr
+            in case of an exception
+        """
+        try:
+            out = await self.query(filepath, args)
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as e:
+            logger.debug(f"Could not query daemon {filepath} - exception {repr(e)}")
+            out = None
+
+        if out is None:
+            args = {k: v for k, v in args.items() if k != "baseline"}
+            out = await Runtime.call(self, filepath, args)
+
+        return out
+
+    def close(self):
+        """Stops all the sources"""
+        with self._sources_lock:
+            self.coordinator.close()
+            self._sources = {}
+            self._buffers = {}
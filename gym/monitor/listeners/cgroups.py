@@ -0,0 +1,322 @@
+import os
+import time
+import logging
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+CGROUP_BATCH_AGE = 0.05
+CGROUP_IDLE = 60
+
+CLK_TCK = os.sysconf("SC_CLK_TCK")
+NS = 1e9
+
+CONTROLLERS = {
+    "cpu": "cpuacct",
+    "memory": "memory",
+    "io": "blkio",
+}
+
+
+class Cgroups:
+    """Reads the stats of containers directly from their
+    cgroups (v1 and/or v2 controllers), instead of the Docker API.
+    A container is resolved to its cgroup paths once (via the cgroup
+    of its main process), and then the stats of all the registered
+    containers are read in a single batched pass per tick, i.e., the
+    first container sampled in a tick reads all of them, and the
+    others get the stats of that pass (if not older than
+    CGROUP_BATCH_AGE seconds).
+    Containers not sampled for CGROUP_IDLE seconds are unregistered.
+    """
+
+    def __init__(self, root="/"):
+        self.root = root
+        self._mounts = None
+        self._paths = {}
+        self._previous = {}
+        self._batch = {}
+        self._batched = 0.0
+        self._sampled = {}
+        self._lock = threading.Lock()
+
+    def _path(self, *parts):
+        return os.path.join(self.root, *[part.lstrip("/") for part in parts])
+
+    def mounts(self):
+        """Gets the mount points of the cgroup hierarchies
+
+        Returns:
+            dict -- The mount point of each v1 controller, and
+            of the v2 hierarchy (indexed by "")
+        """
+        if self._mounts is None:
+            mounts = {}
+
+            with open(self._path("proc/self/mountinfo")) as f:
+                for line in f:
+                    fields, _, fs = line.partition(" - ")
+                    mount_point = fields.split()[4]
+                    fs_type, _, options = fs.split()[:3]
+
+                    if fs_type == "cgroup2":
+                        mounts.setdefault("", mount_point)
+                    elif fs_type == "cgroup":
+                        for option in options.split(","):
+                            mounts.setdefault(option, mount_point)
+
+            self._mounts = mounts
+
+        return self._mounts
+
+    def resolve(self, pid):
+        """Resolves the cgroup directories of a process,
+        for the cpu, memory and io controllers
+
+        Arguments:
+            pid {int} -- The pid of the (container main) process
+
+        Returns:
+            dict -- The (version, directory) of each controller,
+            empty if some controller could not be resolved
+        """
+        mounts = self.mounts()
+        hierarchies = {}
+        paths = {}
+
+        with open(self._path(f"proc/{pid}/cgroup")) as f:
+            for line in f:
+                _, controllers, path = line.strip().split(":", 2)
+                for controller in controllers.split(",") if controllers else [""]:
+                    hierarchies[controller] = path
+
+        for name, controller in CONTROLLERS.items():
+            if controller in mounts and controller in hierarchies:
+                directory = self._path(mounts[controller], hierarchies[controller])
+                paths[name] = (1, directory)
+            elif "" in mounts and "" in hierarchies:
+                directory = self._path(mounts[""], hierarchies[""])
+                paths[name] = (2, directory)
+
+            if name not in paths or not os.path.isdir(paths[name][1]):
+                logger.debug(f"Could not resolve {name} cgroup of pid {pid}")
+                return {}
+
+        return paths
+
+    def register(self, key, pid):
+        """Registers a container to be read in the batched passes
+
+        Arguments:
+            key {string} -- The container id (or name)
+            pid {int} -- The pid of the container main process
+
+        Returns:
+            bool -- If the cgroups of the container were resolved
+        """
+        try:
+            paths = self.resolve(pid)
+        except OSError as e:
+            logger.debug(f"Could not resolve cgroups of {key} - exception {e}")
+            paths = {}
+
+        if paths:
+            with self._lock:
+                self._paths[key] = paths
+                self._sampled[key] = time.monotonic()
+                self._batch.pop(key, None)
+
+        return bool(paths)
+
+    def registered(self, key):
+        return key in self._paths
+
+    def _read(self, path):
+        with open(path) as f:
+            return f.read()
+
+    def _values(self, path):
+        values = {}
+
+        for line in self._read(path).splitlines():
+            fields = line.split()
+            if len(fields) == 2:
+                values[fields[0]] = int(fields[1])
+
+        return values
+
+    def _number(self, path, default=None):
+        try:
+            value = self._read(path).strip()
+        except OSError:
+            return default
+
+        return int(value) if value.isdigit() else default
+
+    def _system(self):
+        """Reads the system cpu usage (as the Docker API does,
+        i.e., the sum of the cpu times in /proc/stat in nanoseconds)
+
+        Returns:
+            float -- The system cpu usage in nanoseconds
+        """
+        fields = self._read(self._path("proc/stat")).split("\n", 1)[0].split()
+        ticks = sum(int(field) for field in fields[1:8])
+        return ticks * NS / CLK_TCK
+
+    def _memory_total(self):
+        for line in self._read(self._path("proc/meminfo")).splitlines():
+            if line.startswith("MemTotal:"):
+                return int(line.split()[1]) * 1024
+        return 0
+
+    def _cpu(self, version, directory):
+        stats = {}
+
+        if version == 2:
+            values = self._values(os.path.join(directory, "cpu.stat"))
+            stats["cpu_total_usage"] = values.get("usage_usec", 0) * 1000.0
+            stats["cpu_usage_in_usermode"] = values.get("user_usec", 0) * 1000.0
+            stats["cpu_usage_in_kernelmode"] = values.get("system_usec", 0) * 1000.0
+        else:
+            usage = self._number(os.path.join(directory, "cpuacct.usage"), 0)
+            values = self._values(os.path.join(directory, "cpuacct.stat"))
+            stats["cpu_total_usage"] = float(usage)
+            stats["cpu_usage_in_usermode"] = values.get("user", 0) * NS / CLK_TCK
+            stats["cpu_usage_in_kernelmode"] = values.get("system", 0) * NS / CLK_TCK
+
+        return stats
+
+    def _memory(self, version, directory, total):
+        stats = {}
+
+        if version == 2:
+            values = self._values(os.path.join(directory, "memory.stat"))
+            usage = self._number(os.path.join(directory, "memory.current"), 0)
+            limit = self._number(os.path.join(directory, "memory.max"), total)
+            peak = self._number(os.path.join(directory, "memory.peak"), usage)
+        else:
+            values = self._values(os.path.join(directory, "memory.stat"))
+            usage = self._number(os.path.join(directory, "memory.usage_in_bytes"), 0)
+            limit = self._number(os.path.join(directory, "memory.limit_in_bytes"))
+            peak = self._number(
+                os.path.join(directory, "memory.max_usage_in_bytes"), usage
+            )
+
+        limit = min(limit or total, total) if total else limit or 0
+
+        for name, value in values.items():
+            stats["mem_" + name] = value
+
+        stats["mem_percent"] = 100.0 * usage / limit if limit else 0.0
+        stats["mem_limit"] = limit
+        stats["mem_max_usage"] = peak
+        stats["mem_usage"] = usage
+        return stats
+
+    def _io(self, version, directory):
+        stats = {"io_read": 0, "io_write": 0}
+
+        if version == 2:
+            for line in self._read(os.path.join(directory, "io.stat")).splitlines():
+                for field in line.split()[1:]:
+                    name, _, value = field.partition("=")
+                    if name == "rbytes":
+                        stats["io_read"] += int(value)
+                    elif name == "wbytes":
+                        stats["io_write"] += int(value)
+        else:
+            path = os.path.join(directory, "blkio.throttle.io_service_bytes_recursive")
+            if not os.path.exists(path):
+                path = os.path.join(directory, "blkio.throttle.io_service_bytes")
+
+            for line in self._read(path).splitlines():
+                fields = line.split()
+                if len(fields) == 3 and fields[1] == "Read":
+                    stats["io_read"] += int(fields[2])
+                elif len(fields) == 3 and fields[1] == "Write":
+                    stats["io_write"] += int(fields[2])
+
+        return stats
+
+    def _cpu_percent(self, key, stats, online_cpus):
+        previous = self._previous.get(key)
+        self._previous[key] = stats
+        cpu_percent = 0.0
+
+        if previous:
+            cpu_delta = stats["cpu_total_usage"] - previous["cpu_total_usage"]
+            system_delta = stats["system_cpu_usage"] - previous["system_cpu_usage"]
+            if system_delta > 0 and cpu_delta > 0:
+                cpu_percent = (100.0 * (cpu_delta / system_delta)) * online_cpus
+
+        return cpu_percent
+
+    def read(self, keys=None):
+        """Reads the stats of containers in a single pass,
+        i.e., the system stats are read once for all of them
+
+        Keyword Arguments:
+            keys {list} -- The containers to be read, all the
+            registered ones if None (default: {None})
+
+        Returns:
+            dict -- The stats of each container read, indexed by key
+            (containers that could not be read are unregistered)
+        """
+        keys = list(self._paths) if keys is None else keys
+        system = self._system()
+        total = self._memory_total()
+        online_cpus = os.cpu_count() or 1
+        batch = {}
+
+        for key in keys:
+            paths = self._paths.get(key)
+
+            try:
+                stats = {"system_cpu_usage": system}
+                stats.update(self._cpu(*paths["cpu"]))
+                stats["cpu_percent"] = self._cpu_percent(key, stats, online_cpus)
+                stats.update(self._memory(*paths["memory"], total))
+                stats.update(self._io(*paths["io"]))
+
+            except (OSError, TypeError, ValueError) as e:
+                logger.info(f"Could not read cgroups of {key} - exception {repr(e)}")
+                self._paths.pop(key, None)
+                self._previous.pop(key, None)
+
+            else:
+                batch[key] = stats
+
+        return batch
+
+    def stats(self, key):
+        """Gets the stats of a container from the batched pass
+        of the current tick, reading a new pass if the container
+        was already sampled from the current one (or if it is
+        older than CGROUP_BATCH_AGE seconds)
+
+        Arguments:
+            key {string} -- The container id (or name)
+
+        Returns:
+            dict -- The stats of the container, or None
+            if it could not be read
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._sampled[key] = now
+
+            if key not in self._batch or now - self._batched > CGROUP_BATCH_AGE:
+                idle = [k for k, tm in self._sampled.items() if now - tm > CGROUP_IDLE]
+                for k in idle:
+                    self._sampled.pop(k)
+                    self._paths.pop(k, None)
+                    self._previous.pop(k, None)
+
+                self._batch = self.read()
+                self._batched = now
+
+            return self._batch.pop(key, None)
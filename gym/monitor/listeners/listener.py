@@ -1,4 +1,6 @@
+import time
 import logging
+import numpy as np
 from datetime import datetime
 
 from gym.common.tool import Tool
@@ -7,6 +9,71 @@ from gym.common.tool import Tool
 logger = logging.getLogger(__name__)
 
 
+NS = 1e9
+
+
+def schedule(call, interval, duration, samples=None, stop=None):
+    """Calls the sampling function at ticks scheduled on
+    monotonic clock deadlines (start + k * interval), so the sampling
+    cost does not drift the period of the samples.
+    A tick whose deadline passed while a previous sample was
+    taken is missed (i.e., skipped, not taken late), keeping the
+    samples aligned to the schedule.
+    The time provided to call is the actual wall clock time of the
+    sample, derived from the monotonic clock (i.e., time differences
+    between samples are not affected by wall clock adjustments).
+
+    Arguments:
+        call {function} -- Receives the time of the sample and
+        returns it
+        interval {float} -- Seconds between ticks (e.g., 0.01)
+        duration {float} -- Seconds from the first to the last tick,
+        if None it samples until stop is set
+
+    Keyword Arguments:
+        samples {list} -- Where the samples are appended, e.g., a
+        bounded deque (default: {None})
+        stop {threading.Event} -- Stops the sampling when set
+        (default: {None})
+
+    Returns:
+        tuple -- (list, int) The samples, and the amount of missed ticks
+    """
+    samples = [] if samples is None else samples
+    missed = 0
+    period = max(int(interval * NS), 1)
+    wall = time.time()
+    start = time.monotonic_ns()
+    end = start + int(duration * NS) if duration is not None else None
+    deadline = start
+
+    while not (stop and stop.is_set()):
+        now = time.monotonic_ns()
+        samples.append(call(wall + (now - start) / NS))
+
+        deadline += period
+        now = time.monotonic_ns()
+
+        if now > deadline:
+            late = (now - deadline) // period + 1
+            if end is None:
+                missed += late
+            elif deadline <= end:
+                missed += min(late, (end - deadline) // period + 1)
+            deadline += late * period
+
+        if end is not None and deadline > end:
+            break
+
+        delay = max(deadline - time.monotonic_ns(), 0) / NS
+        if stop:
+            stop.wait(delay)
+        else:
+            time.sleep(delay)
+
+    return samples, missed
+
+
 class Listener(Tool):
     """A Listener is a Tool that must implement a 
     listen function.
@@ -42,7 +109,7 @@ class Listener(Tool):
         if self._command:
             cmd = [self._command, *opts]
             self._call = " ".join(cmd)
-            results = self._processor.start_process(cmd, timeout)
+            results = self._processor.start_process(cmd, timeout, self._stop)
         else:
             opts_list = [k for j in opts.items() for k in j]
             self._call = self.__class__.__name__ + " " + " ".join(opts_list)
@@ -57,6 +124,171 @@ class Listener(Tool):
 
         return results
 
+    def columns(self, out, unit=""):
+        """Builds the metrics of a list of samples (dicts having
+        the same metric names as keys) in columnar form, i.e.,
+        each metric contains its series as the arrays of keys (the
+        time of the samples, or their indexes if samples have no time)
+        and values
+
+        Arguments:
+            out {list} -- Set of samples, each one a dict of
+            metric name/value
+
+        Keyword Arguments:
+            unit {str} -- The unit of the metrics (default: {""})
+
+        Returns:
+            list -- Set of metrics with their series in columnar form
+        """
+        metrics = []
+
+        if out:
+            names = list(out[0].keys())
+            samples = np.array(
+                [[sample.get(name) for name in names] for sample in out], dtype=float
+            )
+            if "time" in names:
+                keys = samples[:, names.index("time")].tolist()
+            else:
+                keys = np.arange(len(out), dtype=float).tolist()
+
+            for index, name in enumerate(names):
+                m = {
+                    "name": name,
+                    "type": "float",
+                    "unit": unit,
+                    "columns": {"keys": keys, "values": samples[:, index].tolist()},
+                }
+                metrics.append(m)
+
+        return metrics
+
+    def sample(self, call, interval, duration, samples=None, stop=None):
+        """Samples the listener on drift-free ticks (see schedule)
+
+        Arguments:
+            call {function} -- Receives the time of the sample and
+            returns it
+            interval {float} -- Seconds between ticks (e.g., 0.01)
+            duration {float} -- Seconds from the first to the last tick,
+            if None it samples until stop is set
+
+        Keyword Arguments:
+            samples {list} -- Where the samples are appended (default: {None})
+            stop {threading.Event} -- Stops the sampling when set, if None
+            the stop event of the tool call is used (default: {None})
+
+        Returns:
+            tuple -- (list, int) The samples, and the amount of missed ticks
+        """
+        stop = self._stop if stop is None else stop
+        samples, missed = schedule(call, interval, duration, samples, stop)
+
+        if missed:
+            logger.info(
+                f"Listener {self.name} missed {missed} ticks "
+                f"of {interval}s interval in {duration}s"
+            )
+
+        return samples, missed
+
+    def missed(self, results):
+        """Builds the metric of the missed ticks of a sampling
+
+        Arguments:
+            results {dict} -- The results of a monitor call
+
+        Returns:
+            list -- The missed_ticks scalar metric, empty if no ticks
+            were missed
+        """
+        metrics = []
+        missed = results.get("missed", 0)
+
+        if missed:
+            m = {
+                "name": "missed_ticks",
+                "type": "int",
+                "unit": "",
+                "scalar": missed,
+            }
+            metrics.append(m)
+
+        return metrics
+
+    def sampler(self, opts):
+        """Prepares the listener to be sampled continuously
+        (i.e., by the monitor daemon) with the provided opts.
+        Must be implemented by listeners that support it.
+
+        Arguments:
+            opts {dict} -- The options of the listener (e.g., target)
+
+        Returns:
+            function -- Receives the time of a sample and returns it,
+            or None if the listener can not be sampled
+        """
+        return None
+
+    def window(self, samples, opts, missed=0):
+        """Builds the results of the listener (i.e., the same
+        returned by monitor) from samples of a time window
+
+        Arguments:
+            samples {list} -- The samples in the window
+            opts {dict} -- The options of the listener
+
+        Keyword Arguments:
+            missed {int} -- Amount of ticks missed in the window (default: {0})
+
+        Returns:
+            dict -- The results of the listener
+        """
+        results = {
+            "code": 0,
+            "out": samples,
+            "err": "",
+            "missed": missed,
+        }
+        return results
+
+    def recall(self, args, samples, start, stop, missed=0):
+        """Runs the listener over samples of the time window
+        [start, stop] instead of sampling it, i.e., the same
+        lifecycle of call() having its results built by window()
+
+        Arguments:
+            args {dict} -- The args of the listener call
+            samples {list} -- The samples in the window
+            start {float} -- Epoch time (seconds) of the window start
+            stop {float} -- Epoch time (seconds) of the window stop
+
+        Keyword Arguments:
+            missed {int} -- Amount of ticks missed in the window (default: {0})
+
+        Returns:
+            dict -- The formated output of the listener
+        """
+        options, _ = self.serialize(args)
+        settings = self.options(options)
+        opts = settings.get("opts")
+
+        opts_list = [str(k) for j in opts.items() for k in j]
+        self._call = self.__class__.__name__ + " " + " ".join(opts_list)
+        self._tstart = datetime.fromtimestamp(start).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        self._tstop = datetime.fromtimestamp(stop).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+        try:
+            results = self.window(samples, opts, missed)
+        except Exception as e:
+            logger.info(f"Recall listener exception - {repr(e)}")
+            results = {"err": repr(e)}
+
+        formated = self.format(results)
+        output = self.output(formated)
+        return output
+
     def monitor(self, opts):
         results = {
             "code": 0,
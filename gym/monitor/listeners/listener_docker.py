@@ -5,15 +5,16 @@ logger = logging.getLogger(__name__)
 import docker
 
 from gym.monitor.listeners.listener import Listener
+from gym.monitor.listeners.cgroups import Cgroups
 from gym.common.defs import LISTENER_DOCKER
 
-import time
-from datetime import datetime
 
 # Based on: https://github.com/signalfx/docker-collectd-plugin/blob/master/dockerplugin.py
 
 
 class ListenerDocker(Listener):
+    CGROUPS = Cgroups()
+
     PARAMETERS = {
         "interval": "interval",
         "target": "target",
@@ -203,16 +204,56 @@ class ListenerDocker(Listener):
         summary_stats.update(stats_io)
         return summary_stats
 
+    def _discover(self, name):
+        """Resolves the cgroups of a container, using the Docker API
+        only to discover the pid of the container (once per container)
+
+        Arguments:
+            name {string} -- The name (or id) of the container
+
+        Returns:
+            bool -- If the container stats can be read from its cgroups
+        """
+        if self.CGROUPS.registered(name):
+            return True
+
+        if not self._dc:
+            return False
+
+        container = self._dc.containers.get(name)
+        pid = container.attrs.get("State", {}).get("Pid")
+        return bool(pid) and self.CGROUPS.register(name, pid)
+
+    def _sample(self, name):
+        measurement = None
+
+        if self._discover(name):
+            measurement = self.CGROUPS.stats(name)
+
+        if measurement is None:
+            measurement = self._stats(name=name)
+
+        if "read" in measurement:
+            del measurement["read"]
+        return measurement
+
+    def sampler(self, opts):
+        if "target" not in opts:
+            return None
+
+        name = opts["target"]
+        return lambda tm: {"time": tm, **self._sample(name)}
+
     def options(self, options):
         timeout = None
-        args = {}
+        opts = {}
 
         for k, v in options.items():
             # if k == "stop":
             #     stop = True
             if k == "duration":
                 timeout = v
-            args[k] = v
+            opts[k] = v
 
         settings = {"opts": opts, "timeout": timeout}
         return settings
@@ -227,30 +268,12 @@ class ListenerDocker(Listener):
         if "duration" in opts:
             t = float(opts["duration"])
 
-        if "target" in opts:
-            name = opts["target"]
-        else:
+        call = self.sampler(opts)
+        if not call:
             return results
 
-        past = datetime.now()
-        while True:
-            current = datetime.now()
-            seconds = (current - past).total_seconds()
-            if seconds > t:
-                break
-            else:
-                measurement = self._stats(name=name)
-                if "read" in measurement:
-                    del measurement["read"]
-
-                results.append(measurement)
-                time.sleep(interval)
-
-        results = {
-            "code": 0,
-            "out": results,
-            "err": "",
-        }
+        samples, missed = self.sample(call, interval, t)
+        results = self.window(samples, opts, missed)
         return results
 
     def parser(self, results):
@@ -263,31 +286,8 @@ class ListenerDocker(Listener):
             error = err
 
         if out:
-            metric_names = list(out[0].keys())
-
-            for name in metric_names:
-
-                metric_values = dict(
-                    [
-                        (
-                            out.index(out_value),
-                            {
-                                "key": out.index(out_value),
-                                "value": float(out_value.get(name)),
-                            },
-                        )
-                        for out_value in out
-                    ]
-                )
-
-                m = {
-                    "name": name,
-                    "type": "float",
-                    "unit": "",
-                    "series": metric_values,
-                }
-
-                metrics.append(m)
+            metrics = self.columns(out)
+            metrics.extend(self.missed(results))
 
         return metrics, error
 
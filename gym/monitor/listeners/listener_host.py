@@ -8,9 +8,6 @@ import platform as pl
 from gym.monitor.listeners.listener import Listener
 from gym.common.defs import LISTENER_HOST
 
-import time
-from datetime import datetime
-
 
 class ListenerHost(Listener):
     PARAMETERS = {
@@ -57,6 +54,7 @@ class ListenerHost(Listener):
         )
         self._first = True
         self._command = None
+        self._cpu_times = None
 
     def _get_node_info(self):
         info = {}
@@ -69,9 +67,32 @@ class ListenerHost(Listener):
         info["processor"] = processor
         return info
 
+    def _cpu_percent(self, times):
+        """Gets the cpu percent of the host since the previous sample
+        from the cpu times kept by the listener, as psutil keeps the
+        ones of cpu_percent(interval=None) per thread, and a sampler
+        can be called from different threads (e.g., by the daemon)
+
+        Arguments:
+            times {scputimes} -- The cpu times of the host
+
+        Returns:
+            float -- The cpu percent, 0.0 in the first sample
+        """
+        total = sum(times) - times.guest - times.guest_nice
+        busy = total - times.idle - times.iowait
+        previous, self._cpu_times = self._cpu_times, (total, busy)
+
+        if not previous or total <= previous[0]:
+            return 0.0
+
+        percent = 100.0 * (busy - previous[1]) / (total - previous[0])
+        return min(max(percent, 0.0), 100.0)
+
     def _get_node_cpu(self, tm, prev_info):
         cpu_stats = {}
-        cpu_stats["cpu_percent"] = ps.cpu_percent(interval=0.5)
+        times = ps.cpu_times()
+        cpu_stats["cpu_percent"] = self._cpu_percent(times)
 
         (
             user,
@@ -84,7 +105,7 @@ class ListenerHost(Listener):
             steal,
             guest,
             guest_nice,
-        ) = ps.cpu_times()
+        ) = times
 
         if self._first == False:
             cpu_stats["user_time"] = (user - prev_info["user_time"]) / (
@@ -222,6 +243,20 @@ class ListenerHost(Listener):
         resources.update(net)
         return resources
 
+    def _sample(self, tm):
+        measurement = self._get_node_stats(tm, self._measurement)
+        measurement["time"] = tm
+        self._first = False
+        self._measurement = measurement
+        return measurement
+
+    def sampler(self, opts):
+        self._first = True
+        self._measurement = {"time": 0.0}
+        self._cpu_times = None
+        self._cpu_percent(ps.cpu_times())
+        return self._sample
+
     def options(self, options):
         opts = {}
         timeout = None
@@ -247,28 +282,8 @@ class ListenerHost(Listener):
         else:
             return results
 
-        past = datetime.now()
-        measurement = {}
-        measurement["time"] = 0.0
-        while True:
-            current = datetime.now()
-            seconds = (current - past).total_seconds()
-            if seconds > t:
-                break
-            else:
-                tm = time.time()
-                measurement = self._get_node_stats(tm, measurement)
-                measurement["time"] = tm
-                current = datetime.now()
-                self._first = False
-                results.append(measurement)
-                time.sleep(interval)
-
-        results = {
-            "code": 0,
-            "out": results,
-            "err": "",
-        }
+        samples, missed = self.sample(self.sampler(opts), interval, t)
+        results = self.window(samples, opts, missed)
         return results
 
     def parser(self, results):
@@ -281,32 +296,8 @@ class ListenerHost(Listener):
             error = err
 
         if out:
-            metric_names = list(out[0].keys())
-
-            for name in metric_names:
-                # metric_values = dict([ (out.index(out_value),float(out_value.get(name))) for out_value in out ])
-
-                metric_values = dict(
-                    [
-                        (
-                            out.index(out_value),
-                            {
-                                "key": out.index(out_value),
-                                "value": float(out_value.get(name)),
-                            },
-                        )
-                        for out_value in out
-                    ]
-                )
-
-                m = {
-                    "name": name,
-                    "type": "float",
-                    "unit": "",
-                    "series": metric_values,
-                }
-
-                metrics.append(m)
+            metrics = self.columns(out)
+            metrics.extend(self.missed(results))
 
         return metrics, error
 
@@ -3,8 +3,6 @@ import logging
 from gym.monitor.listeners.listener import Listener
 from gym.common.defs import LISTENER_NET
 
-import time
-from datetime import datetime
 from subprocess import check_output
 
 
@@ -72,6 +70,34 @@ class ListenerNet(Listener):
         }
         stats_diffs.update(stats_diffs_extra)
 
+    def _diffs(self, stats_before, stats_after):
+        stats_join = zip(stats_after.values(), stats_before.values())
+        stats_diffs = [x - y for (x, y) in stats_join]
+        stats_diff = dict(zip(stats_before.keys(), stats_diffs))
+        elapsed = stats_diff.pop("time")
+        self.process_diffs(stats_diff, elapsed)
+        return stats_diff
+
+    def sampler(self, opts):
+        if "interface" not in opts:
+            return None
+
+        interface = opts["interface"]
+        return lambda tm: {"time": tm, **self._stats(interface)}
+
+    def window(self, samples, opts, missed=0):
+        results = {}
+
+        if len(samples) > 1:
+            results = self._diffs(samples[0], samples[-1])
+
+        results = {
+            "code": 0,
+            "out": results,
+            "err": "",
+        }
+        return results
+
     def options(self, options):
         opts = {}
         timeout = None
@@ -99,14 +125,10 @@ class ListenerNet(Listener):
             interface = opts["interface"]
 
         if duration and interface:
-            stats_before = self._stats(interface)
-            time.sleep(duration)
-            stats_after = self._stats(interface)
-            stats_join = zip(stats_after.values(), stats_before.values())
-            stats_diffs = [x - y for (x, y) in stats_join]
-            stats_diff = dict(zip(stats_before.keys(), stats_diffs))
-            self.process_diffs(stats_diff, duration)
-            results = stats_diff
+            samples, _ = self.sample(self.sampler(opts), duration, duration)
+
+            if len(samples) > 1:
+                results = self._diffs(samples[0], samples[-1])
 
         results = {
             "code": 0,
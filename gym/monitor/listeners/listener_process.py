@@ -2,23 +2,23 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+import time
 import psutil as ps
-import os
 
 from gym.monitor.listeners.listener import Listener
+from gym.monitor.listeners.procfs import Procfs, CLK_TCK
 from gym.common.defs import LISTENER_PROCESS
 
-import time
-from datetime import datetime
-from subprocess import check_output, CalledProcessError
-
 
 class ListenerProcess(Listener):
+    PROCFS = Procfs()
+
     PARAMETERS = {
         "interval": "interval",
         "name": "name",
         "pid": "pid",
         "duration": "duration",
+        "connections": "connections",
     }
 
     METRICS = {
@@ -35,6 +35,10 @@ class ListenerProcess(Listener):
         10: "read_chars",
         11: "write_chars",
         12: "time",
+        13: "num_procs",
+        14: "thread_cpu_percent",
+        15: "ctx_switches",
+        16: "num_connections",
     }
 
     def __init__(self):
@@ -48,135 +52,96 @@ class ListenerProcess(Listener):
         self._first = True
         self._command = None
 
-    def _get_process_info(self):
-        info = {}
-        info["name"] = self._p.name()
-        info["exe"] = self._p.exe()
-        info["cwd"] = self._p.cwd()
-        info["status"] = self._p.status()
-        info["username"] = self._p.username()
-        info["create_time"] = self._p.create_time()
-        return info
-
-    def _get_process_cpu(self, tm, prev_info):
-        cpu_stats = {}
-        cpu_stats["cpu_num"] = self._p.cpu_num()
-
-        # cpu_affinity
-        # affinity = self._p.cpu_affinity()
-
-        # cpu_stats["cpu_affinity"] = ""
-        # for index in range(len(affinity)):
-        #     if cpu_stats["cpu_affinity"] == "":
-        #         cpu_stats["cpu_affinity"] = str(affinity[index])
-        #     else:
-        #         cpu_stats["cpu_affinity"] = cpu_stats["cpu_affinity"] + "," + str(affinity[index])
-
-        # cpu_percent
-        cpu_stats["cpu_percent"] = self._p.cpu_percent(interval=0.5)
-
-        # user_time, system_time
-        cpu_times = self._p.cpu_times()
-        user_time, system_time = cpu_times.user, cpu_times.system
-
-        if self._first == False:
-            cpu_stats["user_time"] = (user_time - prev_info["user_time"]) / (
-                tm - prev_info["time"]
-            )
-            cpu_stats["system_time"] = (system_time - prev_info["system_time"]) / (
-                tm - prev_info["time"]
-            )
-
-        cpu_stats["user_time"] = user_time
-        cpu_stats["system_time"] = system_time
-        cpu_stats["num_threads"] = self._p.num_threads() * 1.0
-
-        return cpu_stats
-        # cpu = {}
-        # cpu['percent'] = self._p.cpu_percent()
-        # cpu['affinity'] = self._p.cpu_affinity()
-        # cpu['cputimes'] = self._p.cpu_times().__dict__
-        # cpu['nice'] = self._p.nice()
-        # ts = self._p.threads()
-        # ts = [t.__dict__ for t in ts]
-        # cpu['threads'] = ts
-        # return cpu
-
-    def _get_process_mem(self):
-        mem_stats = {}
-        mem_stats["mem_percent"] = self._p.memory_percent()
-        return mem_stats
-
-        # mem = {}
-        # mem['percent'] = self._p.memory_percent()
-        # mem['swap'] = self._p.memory_info().__dict__
-
-    def _get_process_storage(self, tm, prev_info):
-        io_stats = {}
-        # if os.getuid() == 0:
-        io_counters = self._p.io_counters()
-
-        if self._first == False:
-            io_stats["read_count"] = (
-                io_counters.read_count * 1.0 - prev_info["read_count"]
-            ) / (tm - prev_info["time"])
-            io_stats["read_bytes"] = (
-                io_counters.read_bytes * 1.0 - prev_info["read_bytes"]
-            ) / (tm - prev_info["time"])
-            io_stats["write_count"] = (
-                io_counters.write_count * 1.0 - prev_info["write_count"]
-            ) / (tm - prev_info["time"])
-            io_stats["write_bytes"] = (
-                io_counters.write_bytes * 1.0 - prev_info["write_bytes"]
-            ) / (tm - prev_info["time"])
-            io_stats["write_chars"] = (
-                io_counters.write_chars * 1.0 - prev_info["write_chars"]
-            ) / (tm - prev_info["time"])
-            io_stats["read_chars"] = (
-                io_counters.read_chars * 1.0 - prev_info["read_chars"]
-            ) / (tm - prev_info["time"])
-
-        io_stats["read_count"] = io_counters.read_count * 1.0
-        io_stats["read_bytes"] = io_counters.read_bytes * 1.0
-        io_stats["write_count"] = io_counters.write_count * 1.0
-        io_stats["write_bytes"] = io_counters.write_bytes * 1.0
-        io_stats["read_chars"] = io_counters.read_chars * 1.0
-        io_stats["write_chars"] = io_counters.write_chars * 1.0
-        # else:
-        #     io_stats["read_count"] = "0.0"
-        #     io_stats["read_bytes"] = "0.0"
-        #     io_stats["write_count"] = "0.0"
-        #     io_stats["write_bytes"] = "0.0"
-
-        return io_stats
-        # storage = {}
-        # of = self._p.open_files()
-        # of = [f.__dict__ for f in of]
-        # storage['open_files'] = of
-        # storage['num_fds'] = self._p.num_fds()
-        # storage['io_counters'] = self._p.io_counters().__dict__
-        # return storage
-
-    def _get_process_net(self):
-        net = {}
-        conns = self._p.connections()
-        conns = [c.__dict__ for c in conns]
-        net["connections"] = conns
-        net["connections"] = []
-        return net
-
-    def _get_process_stats(self, tm, measurement):
-        resources = {}
-        cpu = self._get_process_cpu(tm, measurement)
-        mem = self._get_process_mem()
-        disk = self._get_process_storage(tm, measurement)
-        # net = self._get_process_net()
-        resources.update(cpu)
-        resources.update(mem)
-        resources.update(disk)
-        # resources.update(net)
+    def _percent(self, ticks, previous, elapsed):
+        """Gets the highest cpu percent among processes (or threads),
+        or their total, from their cpu times in two samples
+
+        Arguments:
+            ticks {dict} -- The cpu time (ticks) of each pid (or tid)
+            previous {dict} -- The same of the previous sample, the ones
+            not in it (i.e., created in between) are not accounted
+            elapsed {float} -- Seconds between the samples
+
+        Returns:
+            tuple -- (float, float) The total and the highest cpu percent
+        """
+        deltas = [
+            max(value - previous.get(key, value), 0) for key, value in ticks.items()
+        ]
+        if not deltas or elapsed <= 0:
+            return 0.0, 0.0
+
+        scale = 100.0 / CLK_TCK / elapsed
+        return sum(deltas) * scale, max(deltas) * scale
+
+    def _get_process_net(self, pids):
+        connections = 0
+
+        for pid in pids:
+            try:
+                connections += len(ps.Process(pid).connections(kind="inet"))
+            except ps.Error:
+                continue
+
+        return connections
+
+    def _get_process_stats(self, tm, previous):
+        """Reads the stats of the process tree in a single pass,
+        aggregating the cpu and io of all its processes, and
+        the cpu percent of its busiest thread
+
+        Arguments:
+            tm {float} -- The time of the sample
+            previous {dict} -- The stats of the previous sample
+
+        Returns:
+            dict -- The stats of the process tree
+
+        Raises:
+            ProcessLookupError -- If the root process exited
+        """
+        stats = self.PROCFS.read(self._pid, start=self._start)
+        if stats is None:
+            raise ProcessLookupError(f"Process {self._pid} exited")
+
+        elapsed = tm - previous.get("time", tm)
+        cpu_percent, _ = self._percent(stats["procs"], previous["procs"], elapsed)
+        _, thread_cpu_percent = self._percent(
+            stats["threads"], previous["threads"], elapsed
+        )
+        mem_total = self.PROCFS.mem_total()
+
+        resources = {
+            "cpu_num": stats["processor"] * 1.0,
+            "cpu_percent": cpu_percent,
+            "user_time": stats["utime"] / CLK_TCK,
+            "system_time": stats["stime"] / CLK_TCK,
+            "num_threads": stats["num_threads"] * 1.0,
+            "mem_percent": 100.0 * stats["rss"] / mem_total if mem_total else 0.0,
+            "read_count": stats["read_count"] * 1.0,
+            "read_bytes": stats["read_bytes"] * 1.0,
+            "write_count": stats["write_count"] * 1.0,
+            "write_bytes": stats["write_bytes"] * 1.0,
+            "read_chars": stats["read_chars"] * 1.0,
+            "write_chars": stats["write_chars"] * 1.0,
+            "num_procs": len(stats["pids"]) * 1.0,
+            "thread_cpu_percent": thread_cpu_percent,
+            "ctx_switches": stats["ctx_switches"] * 1.0,
+        }
+
+        if self._connections:
+            resources["num_connections"] = self._get_process_net(stats["pids"]) * 1.0
+
+        self._ticks = {"procs": stats["procs"], "threads": stats["threads"]}
         return resources
 
+    def _sample(self, tm):
+        measurement = self._get_process_stats(tm, self._measurement)
+        measurement["time"] = tm
+        self._first = False
+        self._measurement = {"time": tm, **self._ticks}
+        return measurement
+
     def options(self, options):
         opts = {}
         timeout = None
@@ -191,71 +156,55 @@ class ListenerProcess(Listener):
         return settings
 
     def get_pid(self, name):
-        pidlist = []
-        try:
-            pidlist = list(map(int, check_output(["pidof", name]).split()))
-        except CalledProcessError:
-            pidlist = []
-        finally:
-            if pidlist:
-                pid = pidlist.pop()
-            else:
-                pid = None
-            return pid
+        return self.PROCFS.find(name)
 
-    def monitor(self, opts):
-        results = []
-        interval = 1
+    def sampler(self, opts):
         pid = None
 
-        if "interval" in opts:
-            interval = float(opts["interval"])
-
-        if "duration" in opts:
-            t = float(opts.get("duration"))
-        else:
-            return results
-
         if "pid" in opts:
             pid = int(opts["pid"])
         elif "name" in opts:
             name = str(opts["name"])
             pid = self.get_pid(name)
         else:
-            return results
+            return None
 
         if not pid:
             logger.debug("pid not found")
+            return None
+
+        self._start = self.PROCFS.start(pid)
+        if self._start is None:
+            return None
+
+        self._pid = pid
+        self._connections = str(opts.get("connections", "")).lower() in ("true", "1")
+
+        tm = time.time()
+        self._first = True
+        self._measurement = {"time": tm, "procs": {}, "threads": {}}
+        self._get_process_stats(tm, self._measurement)
+        self._measurement = {"time": tm, **self._ticks}
+        return self._sample
+
+    def monitor(self, opts):
+        results = []
+        interval = 1
+
+        if "interval" in opts:
+            interval = float(opts["interval"])
+
+        if "duration" in opts:
+            t = float(opts.get("duration"))
+        else:
             return results
 
-        if not ps.pid_exists(pid):
+        call = self.sampler(opts)
+        if not call:
             return results
 
-        self._p = ps.Process(pid)
-        # stats = self._get_process_info()
-        measurement = {}
-        measurement["time"] = 0.0
-        past = datetime.now()
-
-        while True:
-            current = datetime.now()
-
-            seconds = (current - past).total_seconds()
-            if seconds > t:
-                break
-            else:
-                tm = time.time()
-                measurement = self._get_process_stats(tm, measurement)
-                measurement["time"] = tm
-                self._first = False
-                results.append(measurement)
-                time.sleep(interval)
-
-        results = {
-            "code": 0,
-            "out": results,
-            "err": "",
-        }
+        samples, missed = self.sample(call, interval, t)
+        results = self.window(samples, opts, missed)
         return results
 
     def parser(self, results):
@@ -268,31 +217,8 @@ class ListenerProcess(Listener):
             error = err
 
         if out:
-            metric_names = list(out[0].keys())
-
-            for name in metric_names:
-                # metric_values = dict([ (out.index(out_value),float(out_value.get(name))) for out_value in out ])
-                metric_values = dict(
-                    [
-                        (
-                            out.index(out_value),
-                            {
-                                "key": out.index(out_value),
-                                "value": float(out_value.get(name)),
-                            },
-                        )
-                        for out_value in out
-                    ]
-                )
-
-                m = {
-                    "name": name,
-                    "type": "float",
-                    "unit": "",
-                    "series": metric_values,
-                }
-
-                metrics.append(m)
+            metrics = self.columns(out)
+            metrics.extend(self.missed(results))
 
         return metrics, error
 
@@ -0,0 +1,325 @@
+import os
+import time
+import logging
+import threading
+
+
+logger = logging.getLogger(__name__)
+
+
+PROC_BATCH_AGE = 0.05
+PROC_VALIDATE_AGE = 1.0
+
+CLK_TCK = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+IO_FIELDS = {
+    "syscr": "read_count",
+    "syscw": "write_count",
+    "read_bytes": "read_bytes",
+    "write_bytes": "write_bytes",
+    "rchar": "read_chars",
+    "wchar": "write_chars",
+}
+
+
+class Procfs:
+    """Reads the stats of process trees directly from /proc,
+    instead of per-process psutil calls.
+    It keeps an index of the pids in /proc (their name, parent and
+    start time), updated in each pass only with the processes that
+    were created (fork/exec) or exited since the previous pass, so
+    the children of a process are found without scanning all of them.
+    All the pids are re-read at most once per PROC_VALIDATE_AGE
+    seconds, so a pid reused between passes (i.e., a process exited
+    and another one created with its pid) does not keep the entry of
+    the exited process.
+    The stat, status and io files of all the processes of a tree
+    (and the stat of their threads) are read in a single pass, and
+    the index is refreshed at most once per PROC_BATCH_AGE seconds,
+    being shared by all the trees read in the same tick.
+    """
+
+    def __init__(self, root="/"):
+        self.root = root
+        self._procs = {}
+        self._children = {}
+        self._refreshed = 0.0
+        self._validated = 0.0
+        self._mem_total = None
+        self._lock = threading.Lock()
+
+    def _path(self, *parts):
+        return os.path.join(self.root, "proc", *[str(part) for part in parts])
+
+    def _read(self, *parts):
+        with open(self._path(*parts)) as f:
+            return f.read()
+
+    def _stat(self, *parts):
+        """Parses a stat file of /proc (of a process or thread)
+
+        Returns:
+            dict -- The name, state, parent, cpu times (ticks), threads,
+            start time (ticks), rss (bytes) and last cpu of the process
+        """
+        content = self._read(*parts, "stat")
+        head, _, tail = content.rpartition(")")
+        fields = tail.split()
+
+        stat = {
+            "name": head.partition("(")[2],
+            "state": fields[0],
+            "ppid": int(fields[1]),
+            "utime": int(fields[11]),
+            "stime": int(fields[12]),
+            "num_threads": int(fields[17]),
+            "start": int(fields[19]),
+            "rss": int(fields[21]) * PAGE_SIZE,
+            "processor": int(fields[36]) if len(fields) > 36 else 0,
+        }
+        return stat
+
+    def _status(self, pid):
+        status = {}
+
+        for line in self._read(pid, "status").splitlines():
+            name, _, value = line.partition(":")
+            if name in ("voluntary_ctxt_switches", "nonvoluntary_ctxt_switches"):
+                status[name] = int(value)
+
+        return status
+
+    def _io(self, pid):
+        io = {}
+
+        try:
+            content = self._read(pid, "io")
+        except OSError:
+            return io
+
+        for line in content.splitlines():
+            name, _, value = line.partition(":")
+            if name in IO_FIELDS:
+                io[IO_FIELDS[name]] = int(value)
+
+        return io
+
+    def _threads(self, pid):
+        threads = {}
+
+        for tid in os.listdir(self._path(pid, "task")):
+            try:
+                stat = self._stat(pid, "task", tid)
+            except (OSError, IndexError, ValueError):
+                continue
+            threads[int(tid)] = stat["utime"] + stat["stime"]
+
+        return threads
+
+    def mem_total(self):
+        if self._mem_total is None:
+            self._mem_total = 0
+            for line in self._read("meminfo").splitlines():
+                if line.startswith("MemTotal:"):
+                    self._mem_total = int(line.split()[1]) * 1024
+                    break
+
+        return self._mem_total
+
+    def _index(self, pid):
+        try:
+            stat = self._stat(pid)
+        except (OSError, IndexError, ValueError):
+            return False
+
+        self._update(pid, stat)
+        return True
+
+    def _update(self, pid, stat):
+        proc = self._procs.get(pid)
+
+        if proc and proc["ppid"] != stat["ppid"]:
+            self._children.get(proc["ppid"], set()).discard(pid)
+
+        self._procs[pid] = {
+            "name": stat["name"],
+            "ppid": stat["ppid"],
+            "start": stat["start"],
+        }
+        self._children.setdefault(stat["ppid"], set()).add(pid)
+
+    def _remove(self, pid):
+        proc = self._procs.pop(pid, None)
+
+        if proc:
+            self._children.get(proc["ppid"], set()).discard(pid)
+            if not self._children.get(proc["ppid"]):
+                self._children.pop(proc["ppid"], None)
+
+        self._children.pop(pid, None)
+
+    def refresh(self, force=False):
+        """Updates the index of pids with the processes created and
+        exited since the previous refresh (if older than PROC_BATCH_AGE),
+        re-reading all of them if forced or the last time they were
+        re-read is older than PROC_VALIDATE_AGE
+
+        Keyword Arguments:
+            force {bool} -- Refresh (and re-read all the pids) regardless
+            of the age of the index (default: {False})
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._refreshed <= PROC_BATCH_AGE:
+                return
+
+            entries = os.listdir(self._path())
+            pids = set(int(entry) for entry in entries if entry.isdigit())
+
+            for pid in set(self._procs) - pids:
+                self._remove(pid)
+
+            indexed = pids - set(self._procs)
+            if force or now - self._validated > PROC_VALIDATE_AGE:
+                indexed = pids
+                self._validated = now
+
+            for pid in indexed:
+                if not self._index(pid):
+                    self._remove(pid)
+
+            self._refreshed = now
+
+    def find(self, name):
+        """Finds the topmost process with the given name, i.e.,
+        a process whose parent does not have the same name (e.g., the
+        master of a pool of forked workers), the oldest one if many
+
+        Arguments:
+            name {string} -- The name (comm) of the process
+
+        Returns:
+            int -- The pid of the process, or None if not found
+        """
+        self.refresh(force=True)
+        comm = name[:15]
+
+        with self._lock:
+            matches = [pid for pid, proc in self._procs.items() if proc["name"] == comm]
+            roots = [
+                (self._procs[pid]["start"], pid)
+                for pid in matches
+                if self._procs.get(self._procs[pid]["ppid"], {}).get("name") != comm
+            ]
+
+        return min(roots)[1] if roots else None
+
+    def start(self, pid):
+        """Gets the start time of a process, used to tell it
+        apart from a later process that reuses its pid
+
+        Arguments:
+            pid {int} -- The pid of the process
+
+        Returns:
+            int -- The start time (ticks after boot), or None if the
+            process does not exist
+        """
+        self.refresh(force=True)
+
+        with self._lock:
+            proc = self._procs.get(pid)
+            return proc["start"] if proc else None
+
+    def tree(self, pid):
+        """Gets the pids of a process and all its descendants
+
+        Arguments:
+            pid {int} -- The pid of the root process of the tree
+
+        Returns:
+            list -- The pids of the tree, starting by the root
+        """
+        with self._lock:
+            pids, index = [pid], 0
+
+            while index < len(pids):
+                pids.extend(sorted(self._children.get(pids[index], ())))
+                index += 1
+
+        return pids
+
+    def read(self, pid, start=None, threads=True):
+        """Reads the stats of a process tree in a single pass
+
+        Arguments:
+            pid {int} -- The pid of the root process of the tree
+
+        Keyword Arguments:
+            start {int} -- The start time of the root process, to
+            detect the reuse of its pid (default: {None})
+            threads {bool} -- Read the cpu times of each thread
+            (default: {True})
+
+        Returns:
+            dict -- The stats of the tree: processes, summed cpu times
+            (ticks), threads, rss (bytes), context switches and io
+            counters, the cpu times of each process and thread (ticks),
+            and the last cpu of the root; or None if the root exited
+        """
+        self.refresh()
+
+        stats = {
+            "pids": [],
+            "utime": 0,
+            "stime": 0,
+            "num_threads": 0,
+            "rss": 0,
+            "ctx_switches": 0,
+            "processor": 0,
+            "procs": {},
+            "threads": {},
+        }
+        stats.update({field: 0 for field in IO_FIELDS.values()})
+
+        members = set()
+
+        for member in self.tree(pid):
+            try:
+                stat = self._stat(member)
+                status = self._status(member)
+                io = self._io(member)
+                tasks = self._threads(member) if threads else {}
+            except (OSError, IndexError, ValueError) as e:
+                if member == pid:
+                    logger.debug(f"Could not read process {pid} - exception {repr(e)}")
+                    return None
+                continue
+
+            with self._lock:
+                self._update(member, stat)
+
+            if member == pid:
+                if start is not None and stat["start"] != start:
+                    return None
+                stats["processor"] = stat["processor"]
+
+            elif stat["ppid"] not in members:
+                # a reused pid, of a process out of the tree
+                continue
+
+            members.add(member)
+            stats["pids"].append(member)
+            stats["procs"][member] = stat["utime"] + stat["stime"]
+            stats["threads"].update(tasks)
+            stats["utime"] += stat["utime"]
+            stats["stime"] += stat["stime"]
+            stats["num_threads"] += stat["num_threads"]
+            stats["rss"] += stat["rss"]
+            stats["ctx_switches"] += sum(status.values())
+
+            for field, value in io.items():
+                stats[field] += value
+
+        return stats
@@ -3,8 +3,10 @@ import asyncio
 import logging
 
 from gym.common.core import WorkerCore
+from gym.common.tools import Tools
+from gym.monitor.daemon import Daemon
 from gym.common.protobuf.gym_grpc import MonitorBase
-from gym.common.protobuf.gym_pb2 import Instruction, Info
+from gym.common.protobuf.gym_pb2 import Instruction, Info, Health
 
 
 logger = logging.getLogger(__name__)
@@ -14,7 +16,9 @@ class Monitor(MonitorBase):
     def __init__(self, info):
         logger.info(f"Monitor starting - uuid {info.get('uuid')}")
         info['folder'] = self._folder()
-        self.core = WorkerCore(info)
+        self.daemon = Daemon()
+        self.daemon.configure(info.get("retention"), info.get("capacity"))
+        self.core = WorkerCore(info, tools=Tools(runtime=self.daemon))
 
     def _folder(self):
         folder = os.path.join(
@@ -28,8 +32,17 @@ class Monitor(MonitorBase):
         reply = await self.core.info(request)
         await stream.send_message(reply)
 
+    async def Ready(self, stream):
+        request: Health = await stream.recv_message()
+        reply = await self.core.health(request)
+        await stream.send_message(reply)
+
     async def CallInstruction(self, stream):
         request: Instruction = await stream.recv_message()
         reply = await self.core.instruction(request)
         await stream.send_message(reply)
 
+    async def StreamInstruction(self, stream):
+        request: Instruction = await stream.recv_message()
+        async for evaluation in self.core.stream_instruction(request):
+            await stream.send_message(evaluation)
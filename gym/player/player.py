@@ -18,6 +18,11 @@ class Player(PlayerBase):
         reply = await self.core.info(request)
         await stream.send_message(reply)
 
+    async def Ready(self, stream):
+        request = await stream.recv_message()
+        reply = await self.core.health(request)
+        await stream.send_message(reply)
+
     async def CallLayout(self, stream):
         request = await stream.recv_message()
         reply = await self.core.layout(request)
@@ -0,0 +1,110 @@
+import os
+import shutil
+import tempfile
+import unittest
+import logging
+
+from gym.monitor.listeners.cgroups import Cgroups, CLK_TCK
+
+
+logger = logging.getLogger(__name__)
+
+
+MOUNTINFO_V1 = """\
+33 32 0:29 / /sys/fs/cgroup/cpu,cpuacct rw,relatime - cgroup cgroup rw,cpu,cpuacct
+36 32 0:32 / /sys/fs/cgroup/memory rw,relatime - cgroup cgroup rw,memory
+39 32 0:35 / /sys/fs/cgroup/blkio rw,relatime - cgroup cgroup rw,blkio
+42 32 0:38 / /sys/fs/cgroup/unified rw,relatime - cgroup2 cgroup2 rw
+"""
+
+MOUNTINFO_V2 = """\
+32 24 0:28 / /sys/fs/cgroup rw,relatime - cgroup2 cgroup2 rw
+"""
+
+
+class TestCgroups(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.write("proc/stat", "cpu  100 0 100 700 100 0 0 0 0 0\n")
+        self.write("proc/meminfo", "MemTotal:        1024 kB\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def write(self, path, content):
+        path = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "w") as f:
+            f.write(content)
+
+    def test_v1(self):
+        self.write("proc/self/mountinfo", MOUNTINFO_V1)
+        self.write(
+            "proc/10/cgroup",
+            "4:memory:/docker/abc\n3:blkio:/docker/abc\n"
+            "2:cpu,cpuacct:/docker/abc\n0::/\n",
+        )
+        cpu = "sys/fs/cgroup/cpu,cpuacct/docker/abc/"
+        memory = "sys/fs/cgroup/memory/docker/abc/"
+        blkio = "sys/fs/cgroup/blkio/docker/abc/"
+        self.write(cpu + "cpuacct.usage", "2000000000\n")
+        self.write(cpu + "cpuacct.stat", f"user {CLK_TCK}\nsystem 0\n")
+        self.write(memory + "memory.usage_in_bytes", "256\n")
+        self.write(memory + "memory.limit_in_bytes", "9223372036854771712\n")
+        self.write(memory + "memory.max_usage_in_bytes", "512\n")
+        self.write(memory + "memory.stat", "cache 64\nrss 128\n")
+        self.write(
+            blkio + "blkio.throttle.io_service_bytes_recursive",
+            "8:0 Read 10\n8:0 Write 20\n8:16 Read 5\n8:0 Total 30\nTotal 35\n",
+        )
+
+        cgroups = Cgroups(root=self.root)
+        self.assertTrue(cgroups.register("abc", 10))
+
+        stats = cgroups.stats("abc")
+        self.assertEqual(stats["cpu_total_usage"], 2e9)
+        self.assertEqual(stats["cpu_usage_in_usermode"], 1e9)
+        self.assertEqual(stats["system_cpu_usage"], 1000 * 1e9 / CLK_TCK)
+        self.assertEqual(stats["cpu_percent"], 0.0)
+        self.assertEqual(stats["mem_limit"], 1024 * 1024)
+        self.assertEqual(stats["mem_usage"], 256)
+        self.assertEqual(stats["mem_max_usage"], 512)
+        self.assertEqual(stats["mem_rss"], 128)
+        self.assertEqual((stats["io_read"], stats["io_write"]), (15, 20))
+
+        self.write(cpu + "cpuacct.usage", "3000000000\n")
+        self.write("proc/stat", "cpu  150 0 150 800 100 0 0 0 0 0\n")
+        stats = cgroups.stats("abc")
+        system_delta = 200 * 1e9 / CLK_TCK
+        cpu_percent = 100.0 * 1e9 / system_delta * os.cpu_count()
+        self.assertAlmostEqual(stats["cpu_percent"], cpu_percent)
+
+    def test_v2(self):
+        self.write("proc/self/mountinfo", MOUNTINFO_V2)
+        self.write("proc/10/cgroup", "0::/system.slice/docker-abc.scope\n")
+        self.write("proc/11/cgroup", "0::/system.slice/docker-def.scope\n")
+
+        for name in ["abc", "def"]:
+            scope = f"sys/fs/cgroup/system.slice/docker-{name}.scope/"
+            self.write(
+                scope + "cpu.stat", "usage_usec 30\nuser_usec 20\nsystem_usec 10\n"
+            )
+            self.write(scope + "memory.current", "512\n")
+            self.write(scope + "memory.max", "max\n")
+            self.write(scope + "memory.stat", "anon 256\nfile 128\n")
+            self.write(scope + "io.stat", "8:0 rbytes=10 wbytes=20 rios=1 wios=2\n")
+
+        cgroups = Cgroups(root=self.root)
+        self.assertTrue(cgroups.register("abc", 10))
+        self.assertTrue(cgroups.register("def", 11))
+        self.assertFalse(cgroups.register("ghi", 12))
+
+        stats = cgroups.stats("abc")
+        self.assertEqual(stats["cpu_total_usage"], 30000.0)
+        self.assertEqual(stats["mem_limit"], 1024 * 1024)
+        self.assertEqual(stats["mem_anon"], 256)
+        self.assertEqual((stats["io_read"], stats["io_write"]), (10, 20))
+
+        os.remove(os.path.join(self.root, "proc/stat"))
+        self.assertEqual(cgroups.stats("def")["mem_usage"], 512)
@@ -0,0 +1,101 @@
+import asyncio
+import unittest
+import logging
+from unittest import mock
+
+from grpclib.const import Status
+from grpclib.exceptions import GRPCError
+
+from gym.common import channels
+from gym.common.channels import Channels
+
+
+logger = logging.getLogger(__name__)
+
+
+class Channel:
+    """A channel recording if it was closed"""
+
+    def __init__(self, host, port):
+        self.address = f"{host}:{port}"
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class Stub:
+    """A stub replying Ready calls with the provided outcome"""
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.calls = 0
+
+    def __call__(self, channel):
+        return self
+
+    async def Ready(self, health):
+        self.calls += 1
+        if self.outcome:
+            raise self.outcome
+        return health
+
+
+class TestChannels(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(channels, "Channel", Channel)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_discard(self):
+        async def discard():
+            pool = Channels()
+
+            async with pool.connect("127.0.0.1", 8990) as first:
+                async with pool.connect("127.0.0.1", 8990) as second:
+                    pool.discard("127.0.0.1", 8990)
+                    discarded = first.closed
+
+                async with pool.connect("127.0.0.1", 8990) as third:
+                    pass
+
+                used = first.closed
+
+            return first, second, third, discarded, used
+
+        first, second, third, discarded, used = asyncio.run(discard())
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertFalse(discarded or used)
+        self.assertTrue(first.closed)
+        self.assertFalse(third.closed)
+
+    def test_probe(self):
+        async def probe(outcome):
+            pool = Channels(probe=0)
+            stub = Stub(outcome)
+
+            async with pool.connect("127.0.0.1", 8990, stub) as first:
+                pass
+
+            async with pool.connect("127.0.0.1", 8990, stub) as second:
+                pass
+
+            return first, second, stub.calls
+
+        first, second, calls = asyncio.run(probe(None))
+        self.assertIs(first, second)
+        self.assertEqual(calls, 1)
+
+        first, second, _ = asyncio.run(probe(GRPCError(Status.UNIMPLEMENTED)))
+        self.assertIs(first, second)
+
+        first, second, _ = asyncio.run(probe(ConnectionRefusedError()))
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+        self.assertFalse(second.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+import logging
+
+from gym.infra.containernet.pool import Pool
+
+try:
+    from gym.infra.containernet.environment import Environment
+except ImportError:
+    Environment = None
+
+
+logger = logging.getLogger(__name__)
+
+
+@unittest.skipIf(Environment is None, "containernet is not installed")
+class TestEnvironment(unittest.TestCase):
+    def stop(self, pool=None):
+        env = Environment({"nodes": {}}, pool=pool)
+        cleanups = []
+        env.mn_cleanup = lambda: cleanups.append(True)
+        return env.stop(), cleanups
+
+    def test_stop(self):
+        self.assertEqual(self.stop(), ((True, {}), [True]))
+        self.assertEqual(self.stop(Pool()), ((True, {}), [True]))
+
+    def test_stop_pooled(self):
+        pool = Pool()
+        pool._hosts[("a", "vnf", ())] = {"host": None, "released": 0.0}
+        self.assertEqual(self.stop(pool), ((True, {}), []))
+
+
+if __name__ == "__main__":
+    unittest.main()
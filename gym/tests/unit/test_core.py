@@ -0,0 +1,77 @@
+import asyncio
+import unittest
+import logging
+
+from google.protobuf import json_format
+
+from gym.common.core import Core, PlayerCore
+from gym.common.protobuf.gym_pb2 import Info
+
+
+logger = logging.getLogger(__name__)
+
+
+INFO = {
+    "uuid": "player",
+    "role": "player",
+    "address": "127.0.0.1:8990",
+    "contacts": [],
+}
+
+
+class Stub:
+    """A Greet stub that replies the info of a manager,
+    or never replies if hanging"""
+
+    def __init__(self, port, hanging=False):
+        self.port = port
+        self.hanging = hanging
+
+    async def Greet(self, info):
+        if self.hanging:
+            await asyncio.Event().wait()
+
+        reply = {
+            "uuid": f"manager-{self.port}",
+            "role": "manager",
+            "address": f"127.0.0.1:{self.port}",
+        }
+        return json_format.ParseDict(reply, Info())
+
+
+class TestCore(unittest.TestCase):
+    def setUp(self):
+        self.timeout, self.retries = Core.GREET_TIMEOUT, Core.GREET_RETRIES
+        Core.GREET_TIMEOUT, Core.GREET_RETRIES = 0.1, 1
+
+    def tearDown(self):
+        Core.GREET_TIMEOUT, Core.GREET_RETRIES = self.timeout, self.retries
+
+    def test_greet_timeout(self):
+        async def greet():
+            player = PlayerCore(INFO)
+            await player.ready.wait()
+
+            async def contact(role, host, port, contacts=[]):
+                stub = Stub(port, hanging=port == "8991")
+                info = await player._reach(stub, contacts)
+                if info:
+                    player.status.add_peer(info)
+                return bool(info)
+
+            player._contact = contact
+            contacts = [f"manager/127.0.0.1:{port}" for port in (8991, 8992, 8993)]
+            summary = await player.greet({"contacts": contacts})
+            return player, summary
+
+        player, summary = asyncio.run(greet())
+
+        assert summary == {
+            "greeted": ["manager/127.0.0.1:8992", "manager/127.0.0.1:8993"],
+            "failed": ["manager/127.0.0.1:8991"],
+        }
+        assert len(player.status.peers.peers) == 2
+
+
+if __name__ == "__main__":
+    unittest.main()
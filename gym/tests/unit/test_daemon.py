@@ -0,0 +1,179 @@
+import os
+import time
+import socket
+import asyncio
+import unittest
+import logging
+
+from gym.monitor.daemon import Buffer, Coordinator, Daemon, Source
+
+
+logger = logging.getLogger(__name__)
+
+
+class Clock:
+    """A listener sampling the time of its samples"""
+
+    name = "clock"
+
+    def sampler(self, opts):
+        return lambda tm: {"time": tm}
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        self.listener = self.filepath("listener_host.py")
+
+    def filepath(self, listener):
+        return os.path.normpath(
+            os.path.join(os.path.dirname(__file__), "../../monitor/listeners", listener)
+        )
+
+    def test_buffer(self):
+        buffer = Buffer(capacity=5, retention=10)
+
+        for tm in range(8):
+            buffer.append((float(tm), {"value": tm}))
+
+        samples = buffer.window(0, 100)
+        self.assertEqual([tm for tm, _ in samples], [3.0, 4.0, 5.0, 6.0, 7.0])
+
+        buffer.append((20.0, {"value": 20}))
+        self.assertEqual([tm for tm, _ in buffer.window(0, 100)], [20.0])
+        self.assertEqual(buffer.window(21, 30), [])
+
+    def test_missed(self):
+        daemon = Daemon()
+        samples = [(tm * 0.1, {"value": tm}) for tm in range(11) if tm != 5]
+
+        self.assertEqual(daemon._missed(samples, 0.1), 1)
+        self.assertEqual(daemon._missed(samples[:4] + samples[7:], 0.1), 4)
+        self.assertEqual(daemon._missed(samples, None), 0)
+
+    def test_coordinator(self):
+        coordinator = Coordinator(workers=4)
+        sources = {}
+
+        for interval in (0.1, 0.15):
+            source = Source(Clock(), {}, interval, Buffer())
+            source.start()
+            sources[interval] = source
+            coordinator.add(interval, source)
+
+        time.sleep(1.0)
+        coordinator.close()
+
+        for interval, source in sources.items():
+            times = [tm for tm, _ in source.buffer.window(0, time.time())]
+            gaps = [after - before for before, after in zip(times, times[1:])]
+
+            self.assertGreaterEqual(len(times), int(1.0 / interval))
+            self.assertTrue(all(abs(gap - interval) < 0.02 for gap in gaps), gaps)
+
+    def test_query(self):
+        daemon = Daemon(retention=10)
+        daemon.register(self.listener)
+
+        async def query():
+            first = await daemon.call(
+                self.listener, {"interval": "0.05", "duration": "0.5"}
+            )
+            begin = time.monotonic()
+            second = await daemon.call(
+                self.listener,
+                {"interval": "0.05", "duration": "0.3", "baseline": "0.5"},
+            )
+            return first, second, time.monotonic() - begin
+
+        try:
+            first, second, elapsed = asyncio.run(query())
+        finally:
+            daemon.close()
+
+        self.assertEqual(len(daemon._sources), 0)
+        self.assertLess(elapsed, 1.0)
+
+        metrics = first.get("output").get("metrics")
+        self.assertGreaterEqual(len(metrics["cpu_percent"]["columns"]["keys"]), 9)
+
+        metrics = second.get("output").get("metrics")
+        self.assertGreaterEqual(len(metrics["cpu_percent"]["columns"]["keys"]), 12)
+
+    def test_expire(self):
+        daemon = Daemon(retention=0.3)
+        daemon.register(self.listener)
+
+        async def query():
+            await daemon.call(self.listener, {"interval": "0.05", "duration": "0.1"})
+            queried = len(daemon._sources)
+            await asyncio.sleep(1.5)
+            return queried, len(daemon._sources), len(daemon.coordinator._sources)
+
+        try:
+            sources = asyncio.run(query())
+        finally:
+            daemon.close()
+
+        self.assertEqual(sources, (1, 0, 0))
+
+    def test_shared(self):
+        daemon = Daemon(retention=10)
+        daemon.register(self.listener)
+        intervals = ["0.1", "0.2", "0.1"]
+
+        async def query():
+            calls = [
+                daemon.call(
+                    self.listener,
+                    {"interval": interval, "duration": "0.4", "instance": str(index)},
+                )
+                for index, interval in enumerate(intervals)
+            ]
+            outputs = await asyncio.gather(*calls)
+            return outputs, list(daemon._sources.values())
+
+        try:
+            outputs, sources = asyncio.run(query())
+        finally:
+            daemon.close()
+
+        self.assertEqual(sorted(source.interval for source in sources), [0.1, 0.2])
+
+        keys = [
+            len(output["output"]["metrics"]["cpu_percent"]["columns"]["keys"])
+            for output in outputs
+        ]
+        # the windows of the calls start apart, by less than an interval
+        self.assertLessEqual(abs(keys[0] - keys[2]), 1)
+        self.assertLess(keys[1], keys[0])
+
+    def test_edges(self):
+        daemon = Daemon(retention=10)
+        listener = self.filepath("listener_net.py")
+        daemon.register(listener)
+
+        async def traffic():
+            await asyncio.sleep(0.1)
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.sendto(b"gym", ("127.0.0.1", 9))
+
+        async def query():
+            output, _ = await asyncio.gather(
+                daemon.call(listener, {"interface": "lo", "duration": "0.3"}),
+                traffic(),
+            )
+            return output, list(daemon._sources.values())
+
+        try:
+            output, sources = asyncio.run(query())
+        finally:
+            daemon.close()
+
+        self.assertEqual(len(sources), 1)
+        self.assertIsNone(sources[0].interval)
+        self.assertEqual(len(sources[0].buffer.window(0, time.time())), 2)
+        self.assertIn("query_rate", output["output"]["metrics"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import os
+import json
+import logging
+
+from gym.common.diff import Diff
+from gym.common.vnfbr import VNFBR
+
+
+LOCAL_FOLDER = os.path.abspath(os.path.dirname(__file__))
+FIXTURES = "./fixtures"
+FIXTURES_FOLDER = os.path.join(LOCAL_FOLDER, FIXTURES)
+
+logger = logging.getLogger(__name__)
+
+
+def load_file(filename):
+    filepath = os.path.join(FIXTURES_FOLDER, filename)
+    with open(filepath, "+r") as fp:
+        json_dict = json.load(fp)
+    return json_dict
+
+
+class TestDiff(unittest.TestCase):
+    def instances(self):
+        vnfbr_data = load_file("vnf-br-003.json")
+
+        vnfbr = VNFBR()
+        vnfbr.parse(vnfbr_data)
+
+        instances = {}
+        for vnfbd in vnfbr.instances():
+            inputs = vnfbd.inputs()
+            key = tuple(inputs[name]["values"] for name in sorted(inputs))
+            instances[key] = vnfbd
+
+        return instances
+
+    def test_diff_scenarios(self):
+        diff = Diff()
+        instances = self.instances()
+
+        # sorted inputs: pcap, ruleset, vnf_memory, vnf_vcpu
+        base = instances[("bigFlows.pcap", "big_ruleset", "2048", "2")]
+        pcap = instances[("smallFlows.pcap", "big_ruleset", "2048", "2")]
+        vcpus = instances[("bigFlows.pcap", "big_ruleset", "2048", "4")]
+        ruleset = instances[("bigFlows.pcap", "small_ruleset", "2048", "2")]
+
+        delta = diff.compare(base.scenario(), pcap.scenario())
+        assert diff.empty(delta)
+
+        delta = diff.compare(base.scenario(), vcpus.scenario())
+        assert not diff.empty(delta)
+        assert delta["nodes"]["modified"] == {"d2": ["resources/cpu/vcpus"]}
+        assert diff.nodes_only(delta, ["resources/cpu", "resources/memory"])
+
+        delta = diff.compare(base.scenario(), ruleset.scenario())
+        assert list(delta["nodes"]["modified"]) == ["d2"]
+        assert not diff.nodes_only(delta, ["resources/cpu", "resources/memory"])
+
+        scenario = json.loads(json.dumps(base.scenario()))
+        scenario["nodes"].pop("d3")
+        delta = diff.compare(base.scenario(), scenario)
+        assert delta["nodes"]["removed"] == ["d3"]
+        assert not diff.nodes_only(delta, ["resources/cpu"])
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s %(levelname)s %(threadName)s %(name)s %(message)s",
+    )
+    unittest.main()
@@ -0,0 +1,80 @@
+import time
+import threading
+import unittest
+import logging
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
+
+import psutil
+
+from gym.monitor.listeners.listener import Listener
+from gym.monitor.listeners.listener_host import ListenerHost
+from gym.monitor.listeners.listener_net import ListenerNet
+
+
+logger = logging.getLogger(__name__)
+
+
+class TestListener(unittest.TestCase):
+    def setUp(self):
+        self.listener = Listener(id=0, name="test", parameters={}, metrics={})
+
+    def test_sample_schedule(self):
+        samples, missed = self.listener.sample(lambda tm: tm, 0.02, 0.2)
+
+        self.assertEqual(missed, 0)
+        self.assertEqual(len(samples), 11)
+
+        spacing = [after - before for before, after in zip(samples, samples[1:])]
+        self.assertAlmostEqual(sum(spacing), 0.2, delta=0.01)
+        self.assertTrue(all(0.01 < interval < 0.03 for interval in spacing))
+
+    def test_sample_missed(self):
+        def slow(tm):
+            time.sleep(0.05)
+            return tm
+
+        samples, missed = self.listener.sample(slow, 0.02, 0.2)
+
+        self.assertEqual(len(samples), 4)
+        self.assertEqual(missed, 7)
+        self.assertEqual(self.listener.missed({"missed": missed})[0]["scalar"], 7)
+
+    def test_columns(self):
+        out = [{"time": 10.0, "value": 1}, {"time": 10.25, "value": 2}]
+        metrics = {m["name"]: m for m in self.listener.columns(out)}
+
+        self.assertEqual(
+            metrics["value"]["columns"], {"keys": [10.0, 10.25], "values": [1.0, 2.0]}
+        )
+
+        metrics = self.listener.columns([{"value": 1}, {"value": 2}])
+        self.assertEqual(metrics[0]["columns"]["keys"], [0.0, 1.0])
+
+    def test_host_cpu_percent(self):
+        scputimes = type(psutil.cpu_times())
+        fields = len(scputimes._fields) - 4
+        times = [
+            scputimes(user, 0, 0, idle, *[0] * fields)
+            for user, idle in [(0, 0), (1, 1), (1, 4), (4, 4)]
+        ]
+        listener = ListenerHost()
+
+        with mock.patch.object(psutil, "cpu_times", side_effect=times):
+            call = listener.sampler({})
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                percents = [
+                    executor.submit(call, float(tm)).result()["cpu_percent"]
+                    for tm in range(1, 4)
+                ]
+
+        self.assertEqual(percents, [50.0, 0.0, 100.0])
+
+    def test_net_stopped(self):
+        listener = ListenerNet()
+        listener._stop = threading.Event()
+        listener._stats = lambda interface: listener._stop.set() or {}
+
+        results = listener.monitor({"interface": "lo", "duration": 1})
+        self.assertEqual(results["out"], {})
@@ -0,0 +1,232 @@
+import os
+import shutil
+import tempfile
+import unittest
+import logging
+
+from gym.infra.netns import environment
+from gym.infra.netns.environment import Environment
+
+
+logger = logging.getLogger(__name__)
+
+
+def topology():
+    start = {
+        "workflow": "start",
+        "implementation": ["agent --uuid {name} --ip {ip}"],
+        "parameters": {
+            "name": {"input": "name", "value": "agent"},
+            "ip": {"input": "ip", "value": "get_attrib:ip"},
+        },
+    }
+    nodes = {
+        "a": {"format": "docker"},
+        "b": {"format": "docker"},
+        "c": {"format": "docker"},
+        "agent": {
+            "format": "process",
+            "lifecycle": {"start": start},
+            "relationships": {"b": {"type": "HostedOn", "target": "b"}},
+        },
+        "manager": {
+            "format": "process",
+            "lifecycle": {"start": dict(start, parameters={})},
+            "relationships": {"host": {"type": "AttachesTo", "target": "host"}},
+        },
+    }
+    links = {
+        "ab": {
+            "type": "E-Line",
+            "src": "a",
+            "dst": "b",
+            "intf_src": "a-eth1",
+            "intf_dst": "b-eth1",
+            "params_src": {"ip": "10.0.0.1/24"},
+            "params_dst": {"ip": "10.0.0.2/24"},
+        },
+        "lan-b": {"type": "E-LAN", "src": "s1", "dst": "b", "intf_dst": "b-eth2"},
+        "lan-c": {
+            "type": "E-LAN",
+            "src": "s1",
+            "dst": "c",
+            "intf_dst": "c-eth1",
+            "params_dst": {"ip": "10.0.1.3/24"},
+        },
+    }
+    return {"nodes": nodes, "links": links}
+
+
+class TestNetns(unittest.TestCase):
+    def setUp(self):
+        self.workdir = environment.WORKDIR
+        environment.WORKDIR = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(environment.WORKDIR)
+        environment.WORKDIR = self.workdir
+
+    def env(self):
+        env = Environment(topology(), mng_network="10.10.0.0/24")
+        calls = []
+
+        def ip(commands, namespace=None, force=False):
+            calls.append((namespace, force, list(commands)))
+            return True
+
+        env._ip = ip
+        return env, calls
+
+    def test_namespace(self):
+        env, calls = self.env()
+        env._add_namespace("a", "10.10.0.2")
+        env._flush()
+
+        assert calls == [
+            (
+                None,
+                False,
+                [
+                    "netns add gym-a",
+                    "link add gv1a type veth peer name gv1b",
+                    "link set gv1a master gbr-mng",
+                    "link set gv1a up",
+                    "link set gv1b netns gym-a",
+                ],
+            ),
+            (
+                "gym-a",
+                False,
+                [
+                    "link set lo up",
+                    "link set gv1b name eth0",
+                    "addr add 10.10.0.2/24 dev eth0",
+                    "link set eth0 up",
+                ],
+            ),
+        ]
+        assert env.nodes_info["a"] == {
+            "ip": "10.10.0.2",
+            "broadcast": "10.10.0.255",
+            "mask": "255.255.255.0",
+        }
+
+    def test_links(self):
+        env, calls = self.env()
+        env.namespaces = {"a": "gym-a", "b": "gym-b", "c": "gym-c"}
+        env._add_links()
+        env._flush()
+        batches = {namespace: commands for namespace, _, commands in calls}
+
+        assert batches[None] == [
+            "link add gv1a type veth peer name gv1b",
+            "link set gv1a netns gym-a",
+            "link set gv1b netns gym-b",
+            "link add gbr0 type bridge",
+            "link set gbr0 up",
+            "link add gv2a type veth peer name gv2b",
+            "link set gv2a master gbr0",
+            "link set gv2a up",
+            "link set gv2b netns gym-b",
+            "link add gv3a type veth peer name gv3b",
+            "link set gv3a master gbr0",
+            "link set gv3a up",
+            "link set gv3b netns gym-c",
+        ]
+        assert batches["gym-a"] == [
+            "link set gv1a name a-eth1",
+            "addr add 10.0.0.1/24 dev a-eth1",
+            "link set a-eth1 up",
+        ]
+        assert batches["gym-b"] == [
+            "link set gv1b name b-eth1",
+            "addr add 10.0.0.2/24 dev b-eth1",
+            "link set b-eth1 up",
+            "link set gv2b name b-eth2",
+            "link set b-eth2 up",
+        ]
+        assert batches["gym-c"] == [
+            "link set gv3b name c-eth1",
+            "addr add 10.0.1.3/24 dev c-eth1",
+            "link set c-eth1 up",
+        ]
+        assert env.bridges == {"s1": "gbr0"}
+        assert env.links == ["gbr0", "gv2a", "gv3a"]
+
+    def test_processes(self):
+        env, _ = self.env()
+        env._add_nodes()
+        runs = []
+        env._run = lambda node_id, entrypoint, namespace=None: runs.append(
+            (node_id, entrypoint, namespace)
+        )
+        env._start_lifecycle()
+
+        assert runs == [
+            ("agent", "agent --uuid agent --ip 10.10.0.3", "gym-b"),
+            ("manager", "agent --uuid {name} --ip {ip}", None),
+        ]
+        assert env.nodes_info["agent"] == env.nodes_info["b"]
+        assert env.nodes_info["manager"] == {"ip": "10.10.0.1"}
+
+    def test_start_stop(self):
+        env, calls = self.env()
+        env._start_lifecycle = lambda: None
+        ok, info = env.start()
+
+        assert ok and sorted(info) == ["a", "b", "c"]
+        assert os.path.exists(os.path.join(environment.WORKDIR, environment.STATE))
+
+        del calls[:]
+        env._stop_processes = lambda: None
+        ok, _ = env.stop()
+
+        assert ok
+        assert calls == [
+            (
+                None,
+                True,
+                [
+                    "netns delete gym-a",
+                    "netns delete gym-b",
+                    "netns delete gym-c",
+                    "link delete gbr0",
+                    "link delete gbr-mng",
+                ],
+            )
+        ]
+        assert not os.path.exists(os.path.join(environment.WORKDIR, environment.STATE))
+
+    def test_cleanup(self):
+        env, _ = self.env()
+        env._start_lifecycle = lambda: None
+        env._ip = lambda commands, namespace=None, force=False: namespace is None
+        ok, _ = env.start()
+        assert not ok
+
+        other, calls = self.env()
+        other.cleanup()
+        other.cleanup()
+
+        assert calls == [
+            (
+                None,
+                True,
+                [
+                    "netns delete gym-a",
+                    "netns delete gym-b",
+                    "netns delete gym-c",
+                    "link delete gbr-mng",
+                    "link delete gv1a",
+                    "link delete gv2a",
+                    "link delete gv3a",
+                    "link delete gbr0",
+                    "link delete gv5a",
+                    "link delete gv6a",
+                ],
+            )
+        ]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import asyncio
+import unittest
+import logging
+from unittest import mock
+
+from gym.common.core import PlayerCore
+
+
+logger = logging.getLogger(__name__)
+
+
+INFO = {
+    "uuid": "player",
+    "role": "player",
+    "address": "127.0.0.1:8990",
+    "contacts": [],
+}
+
+
+def scenarios():
+    first = {"nodes": {"a": {"image": "vnf:1"}}}
+    second = {"nodes": {"a": {"image": "vnf:2"}}}
+    return first, second
+
+
+class Instance:
+    """A vnf-bd instance with the interface used by the Player"""
+
+    def __init__(self, scenario, tests=1):
+        self._scenario = scenario
+        self._tests = tests
+        self._peers = []
+
+    def environment(self):
+        parameters = {"address": {"value": "127.0.0.1:8986"}}
+        return {"orchestrator": {"type": "containernet", "parameters": parameters}}
+
+    def scenario(self):
+        return self._scenario
+
+    def deploy(self):
+        return True
+
+    def tests(self):
+        return self._tests
+
+    def trials(self):
+        return 1
+
+    def set_peers(self, peers):
+        self._peers = peers
+
+    def peers(self):
+        return self._peers
+
+
+class TestPlayer(unittest.TestCase):
+    async def run_tests(self, instances, acks=None):
+        player = PlayerCore(INFO)
+        calls = []
+        acks = acks if acks else {}
+
+        async def call_scenario(command, deploy_id, vnfbd):
+            calls.append((command, deploy_id, vnfbd.scenario()))
+            command_acks = acks.get(command)
+            return command_acks.pop(0) if command_acks else True
+
+        async def task(test, trials, vnfbd):
+            return {"test": test}
+
+        player.call_scenario = call_scenario
+        player.task = task
+
+        for instance in instances:
+            await player.tests(instance)
+        await player.teardown()
+
+        return player, calls
+
+    def test_jobs(self):
+        first, second = scenarios()
+        instances = [Instance(first), Instance(second)]
+
+        async def jobs():
+            vnfbr = mock.Mock(instances=lambda: instances)
+            return list(PlayerCore(INFO).jobs(vnfbr))
+
+        assert asyncio.run(jobs()) == [
+            (instances[0], "127.0.0.1:8986", 1),
+            (instances[1], "127.0.0.1:8986", 1),
+        ]
+
+    def test_deploy_ids(self):
+        first, second = scenarios()
+        instances = [Instance(first), Instance(first), Instance(second)]
+        _, calls = asyncio.run(self.run_tests(instances))
+
+        assert calls == [
+            ("start", 1, first),
+            ("update", 3, second),
+            ("stop", 3, second),
+        ]
+
+    def test_update_fallback(self):
+        first, second = scenarios()
+        instances = [Instance(first), Instance(second)]
+        player, calls = asyncio.run(self.run_tests(instances, {"update": [False]}))
+
+        assert calls == [
+            ("start", 1, first),
+            ("update", 2, second),
+            ("stop", 1, first),
+            ("start", 2, second),
+            ("stop", 2, second),
+        ]
+        assert player.deployments == {}
+
+    def test_update_failed(self):
+        first, second = scenarios()
+        instances = [Instance(first), Instance(second), Instance(second)]
+        acks = {"update": [False], "start": [True, False]}
+        player, calls = asyncio.run(self.run_tests(instances, acks))
+
+        assert calls == [
+            ("start", 1, first),
+            ("update", 2, second),
+            ("stop", 1, first),
+            ("start", 2, second),
+            ("start", 3, second),
+            ("stop", 3, second),
+        ]
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import logging
+
+from gym.infra.containernet import pool
+from gym.infra.containernet.pool import Pool, RESET_CMD
+
+
+logger = logging.getLogger(__name__)
+
+
+class Host:
+    """A docker host with the interface used by the Pool"""
+
+    def __init__(self, name, fail=False):
+        self.name = name
+        self.fail = fail
+        self.cmds = []
+        self.terminated = False
+        self.intfs = {0: "eth0"}
+        self.ports = {"eth0": 0}
+        self.nameToIntf = {"eth0": "eth0"}
+
+    def cmd(self, command):
+        if self.fail:
+            raise OSError("container exited")
+        self.cmds.append(command)
+
+    def terminate(self):
+        self.terminated = True
+
+
+class TestPool(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.monotonic = pool.time.monotonic
+        pool.time.monotonic = lambda: self.now
+
+    def tearDown(self):
+        pool.time.monotonic = self.monotonic
+
+    def release(self, hosts_pool, key, host):
+        self.now += 1
+        return hosts_pool.release(key, host)
+
+    def test_acquire_release(self):
+        hosts_pool = Pool(size=2)
+        key = hosts_pool.key("a", "vnf:1", {"mem_limit": "1g", "cpu_quota": 1})
+        host = Host("a")
+
+        assert hosts_pool.empty()
+        assert hosts_pool.acquire(key) is None
+
+        assert self.release(hosts_pool, key, host)
+        assert host.cmds == [RESET_CMD]
+        assert (host.intfs, host.ports, host.nameToIntf) == ({}, {}, {})
+        assert not hosts_pool.empty()
+
+        other = hosts_pool.key("a", "vnf:2", {"cpu_quota": 1, "mem_limit": "1g"})
+        assert hosts_pool.acquire(other) is None
+        assert hosts_pool.acquire(key) is host
+        assert hosts_pool.acquire(key) is None
+        assert hosts_pool.empty()
+
+    def test_evict(self):
+        hosts_pool = Pool(size=2, idle=10)
+        hosts = {name: Host(name) for name in ("a", "b", "c")}
+        keys = {name: hosts_pool.key(name, "vnf", {}) for name in hosts}
+
+        for name in ("a", "b", "c"):
+            assert self.release(hosts_pool, keys[name], hosts[name])
+
+        assert hosts["a"].terminated
+        assert hosts_pool.acquire(keys["a"]) is None
+
+        replaced = Host("b")
+        assert self.release(hosts_pool, keys["b"], replaced)
+        assert hosts["b"].terminated
+
+        self.now += 10
+        hosts_pool.evict()
+        assert hosts["c"].terminated and not replaced.terminated
+        assert hosts_pool.acquire(keys["b"]) is replaced
+
+        failed = Host("a", fail=True)
+        assert not self.release(hosts_pool, keys["a"], failed)
+        assert failed.terminated and hosts_pool.empty()
+
+    def test_size_zero(self):
+        hosts_pool = Pool(size=0)
+        key = hosts_pool.key("a", "vnf", {})
+        host = Host("a")
+
+        assert not self.release(hosts_pool, key, host)
+        assert host.terminated and not host.cmds
+        assert hosts_pool.empty()
+
+        hosts_pool.configure(size=1)
+        kept = Host("b")
+        assert self.release(hosts_pool, key, kept)
+
+        hosts_pool.configure(size=0)
+        assert kept.terminated and hosts_pool.empty()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+import shutil
+import tempfile
+import unittest
+import logging
+
+from gym.monitor.listeners.procfs import Procfs, PAGE_SIZE, CLK_TCK
+from gym.monitor.listeners.listener_process import ListenerProcess
+
+
+logger = logging.getLogger(__name__)
+
+
+class TestProcfs(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.write("proc/meminfo", "MemTotal:        1024 kB\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def write(self, path, content):
+        path = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "w") as f:
+            f.write(content)
+
+    def process(self, pid, ppid, name, ticks, threads, start=None):
+        start = 100 + pid if start is None else start
+        fields = ["S", ppid] + [0] * 9 + [ticks, ticks] + [0] * 4
+        fields += [len(threads), 0, start, 0, 2] + [0] * 14 + [1]
+        stat = f"{pid} ({name}) " + " ".join(str(f) for f in fields) + "\n"
+        self.write(f"proc/{pid}/stat", stat)
+        self.write(
+            f"proc/{pid}/status",
+            f"Name:\t{name}\nvoluntary_ctxt_switches:\t3\n"
+            "nonvoluntary_ctxt_switches:\t1\n",
+        )
+        self.write(f"proc/{pid}/io", "rchar: 10\nwchar: 20\nsyscr: 1\nsyscw: 2\n")
+
+        for tid in threads:
+            task = stat.replace(str(pid), str(tid), 1)
+            self.write(f"proc/{pid}/task/{tid}/stat", task)
+
+    def test_tree(self):
+        self.process(1, 0, "init", 0, [1])
+        self.process(10, 1, "vnf", 5, [10, 11])
+        self.process(20, 10, "vnf", 5, [20])
+        self.process(30, 1, "other", 5, [30])
+
+        procfs = Procfs(root=self.root)
+        self.assertEqual(procfs.find("vnf"), 10)
+        self.assertEqual(procfs.tree(10), [10, 20])
+
+        stats = procfs.read(10, start=procfs.start(10))
+        self.assertEqual(stats["pids"], [10, 20])
+        self.assertEqual(stats["utime"], 10)
+        self.assertEqual(stats["num_threads"], 3)
+        self.assertEqual(stats["rss"], 4 * PAGE_SIZE)
+        self.assertEqual(stats["ctx_switches"], 8)
+        self.assertEqual((stats["read_chars"], stats["write_count"]), (20, 4))
+        self.assertEqual(sorted(stats["threads"]), [10, 11, 20])
+
+        shutil.rmtree(os.path.join(self.root, "proc/20"))
+        self.process(21, 10, "worker", 5, [21])
+        procfs.refresh(force=True)
+        self.assertEqual(procfs.tree(10), [10, 21])
+
+        shutil.rmtree(os.path.join(self.root, "proc/10"))
+        self.assertIsNone(procfs.read(10))
+
+    def test_reused(self):
+        self.process(1, 0, "init", 0, [1])
+        self.process(10, 1, "vnf", 5, [10])
+        self.process(20, 10, "vnf", 5, [20])
+        self.process(30, 1, "other", 5, [30])
+
+        procfs = Procfs(root=self.root)
+        procfs.refresh(force=True)
+        self.assertEqual(procfs.tree(10), [10, 20])
+
+        self.process(20, 30, "other", 5, [20], start=500)
+        self.assertEqual(procfs.read(10)["pids"], [10])
+        self.assertEqual(procfs.tree(10), [10])
+
+        self.process(30, 10, "worker", 5, [30], start=600)
+        self.assertEqual(procfs.read(10)["pids"], [10])
+
+        procfs.refresh(force=True)
+        self.assertEqual(procfs.tree(10), [10, 30, 20])
+        self.assertEqual(procfs.read(10)["pids"], [10, 30, 20])
+
+        self.process(10, 1, "other", 5, [10], start=700)
+        self.assertIsNone(procfs.find("vnf"))
+
+    def test_percent(self):
+        listener = ListenerProcess()
+        total, highest = listener._percent({1: 100, 2: 50}, {1: 90}, 1.0)
+
+        self.assertAlmostEqual(total, 10 * 100.0 / CLK_TCK)
+        self.assertAlmostEqual(highest, total)
+
+
+if __name__ == "__main__":
+    unittest.main()
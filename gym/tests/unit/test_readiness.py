@@ -0,0 +1,57 @@
+import socket
+import unittest
+import asyncio
+import logging
+
+from gym.common.readiness import backoff, wait_ports, wait_ready
+
+
+logger = logging.getLogger(__name__)
+
+
+class TestReadiness(unittest.TestCase):
+    def test_backoff(self):
+        delays = backoff(initial=0.1, maximum=0.5)
+        values = [next(delays) for _ in range(5)]
+        self.assertEqual(values, [0.1, 0.2, 0.4, 0.5, 0.5])
+
+    def test_wait_ready(self):
+        probes = {}
+
+        async def probe(item):
+            probes[item] = probes.get(item, 0) + 1
+            return item == "ready" or probes[item] >= 3
+
+        pending = asyncio.run(wait_ready(probe, ["ready", "late"], timeout=5))
+        self.assertEqual(pending, [])
+        self.assertEqual(probes, {"ready": 1, "late": 3})
+
+        async def never(item):
+            return False
+
+        pending = asyncio.run(wait_ready(never, ["down"], timeout=0.3))
+        self.assertEqual(pending, ["down"])
+
+    def test_wait_ports(self):
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+
+        closed = socket.socket()
+        closed.bind(("127.0.0.1", 0))
+        closed_port = closed.getsockname()[1]
+
+        try:
+            pending = wait_ports([("127.0.0.1", port)], timeout=1)
+            self.assertEqual(pending, [])
+
+            pending = wait_ports([("127.0.0.1", closed_port)], timeout=0.3)
+            self.assertEqual(pending, [("127.0.0.1", closed_port)])
+        finally:
+            server.close()
+            closed.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
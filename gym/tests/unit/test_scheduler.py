@@ -0,0 +1,55 @@
+import unittest
+import asyncio
+import logging
+
+from gym.common.scheduler import Scheduler
+
+
+logger = logging.getLogger(__name__)
+
+
+class TestScheduler(unittest.TestCase):
+    async def run_jobs(self, jobs, concurrency):
+        running = {}
+        peaks = {"total": 0}
+        done = []
+
+        async def call(item):
+            resource = item.get("resource")
+            running[resource] = running.get(resource, 0) + 1
+            peaks[resource] = max(peaks.get(resource, 0), running[resource])
+            peaks["total"] = max(peaks["total"], sum(running.values()))
+
+            await asyncio.sleep(0.05)
+
+            running[resource] -= 1
+            done.append(item.get("id"))
+
+        scheduler = Scheduler(concurrency)
+        outcomes = await scheduler.run(jobs, call)
+        return outcomes, peaks, done
+
+    def test_scheduler_capacity(self):
+        jobs = [
+            ({"id": 1, "resource": "infra-a"}, "infra-a", 1),
+            ({"id": 2, "resource": "infra-a"}, "infra-a", 1),
+            ({"id": 3, "resource": "infra-b"}, "infra-b", 2),
+            ({"id": 4, "resource": "infra-b"}, "infra-b", 2),
+            ({"id": 5, "resource": "infra-b"}, "infra-b", 2),
+        ]
+
+        outcomes, peaks, done = asyncio.run(self.run_jobs(iter(jobs), 3))
+
+        assert outcomes == [None] * 5
+        assert sorted(done) == [1, 2, 3, 4, 5]
+        assert peaks.get("infra-a") == 1
+        assert peaks.get("infra-b") == 2
+        assert peaks.get("total") == 3
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format="%(asctime)s %(levelname)s %(threadName)s %(name)s %(message)s",
+    )
+    unittest.main()
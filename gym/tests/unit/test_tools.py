@@ -3,8 +3,10 @@ import unittest
 import asyncio
 import os
 import json
+import time
+import tempfile
 
-from gym.common.tools import Tools
+from gym.common.tools import Tools, Runtime, Catalog
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +73,148 @@ class TestTools(unittest.TestCase):
         logger.debug(len(tools_outputs))
         assert len(tools_outputs) == 4
 
+    async def load_catalog(self, folder):
+        folder_path = os.path.join(os.path.dirname(__file__), "../../agent/probers")
+        tools_cfg = {
+            "name": "probers",
+            "folder": folder_path,
+            "prefix": "prober_",
+            "suffix": "py",
+            "full_path": True,
+        }
+
+        tools = Tools(catalog=folder)
+        await tools.load(tools_cfg)
+        cached_tools = Tools(catalog=folder)
+        await cached_tools.load(tools_cfg)
+        return tools.info(), cached_tools.info()
+
+    def test_tools_catalog(self):
+        """Loads probers twice, the second time from
+        the catalog saved by the first load
+        """
+        with tempfile.TemporaryDirectory() as folder:
+            info, cached_info = asyncio.run(self.load_catalog(folder))
+            assert os.path.isfile(os.path.join(folder, "probers.json"))
+
+        assert info
+        assert info == cached_info
+
+    def test_catalog_imports(self):
+        """The catalog key of a tool changes with the
+        gym modules it imports
+        """
+        defs = os.path.normpath(
+            os.path.join(os.path.dirname(__file__), "../../common/defs.py")
+        )
+
+        with tempfile.TemporaryDirectory() as folder:
+            filepath = os.path.join(folder, "prober_fake.py")
+            with open(filepath, "w") as fp:
+                fp.write("from gym.common.defs import PROBER_PING\n")
+
+            catalog = Catalog(folder=folder)
+            key = catalog._key(filepath)
+            assert catalog._imports(filepath) == [defs]
+
+            catalog._modules[defs] = ("outdated", [])
+            assert catalog._key(filepath)["hash"] != key["hash"]
+
+    async def stream_listeners(self):
+        folder_path = os.path.join(os.path.dirname(__file__), "../../monitor/listeners")
+
+        tools = Tools()
+        tools_cfg = {
+            "folder": folder_path,
+            "prefix": "listener_",
+            "suffix": "py",
+            "full_path": True,
+        }
+
+        await tools.load(tools_cfg)
+
+        actions = [
+            {
+                "id": 2,
+                "name": "host",
+                "instance": 1,
+                "args": {"duration": "1"},
+                "sched": {"repeat": 2},
+            },
+        ]
+
+        outputs = [output async for output in tools.stream(actions)]
+        return outputs
+
+    async def deadline_listeners(self, deadline):
+        folder_path = os.path.join(os.path.dirname(__file__), "../../monitor/listeners")
+
+        tools = Tools()
+        tools_cfg = {
+            "folder": folder_path,
+            "prefix": "listener_",
+            "suffix": "py",
+            "full_path": True,
+        }
+
+        await tools.load(tools_cfg)
+
+        actions = [
+            {
+                "id": 2,
+                "name": "host",
+                "instance": 1,
+                "args": {"duration": "1"},
+                "sched": {"repeat": 2},
+            },
+        ]
+
+        outputs = await tools.handle(actions, deadline)
+        return outputs
+
+    def test_listeners_deadline(self):
+        """Starts the action at the deadline, reporting
+        its start skew only in the first repetition
+        """
+        deadline = time.time() + 1
+        tools_outputs = asyncio.run(self.deadline_listeners(deadline))
+        first, second = tools_outputs[1], tools_outputs[2]
+
+        skew = first.get("metrics").get("start_skew").get("scalar")
+        assert 0 <= skew < 0.5
+        assert "start_skew" not in second.get("metrics")
+
+    def test_listeners_stream(self):
+        """Streams the outputs of each repetition of an action"""
+        tools_outputs = asyncio.run(self.stream_listeners())
+        assert [output.get("id") for output in tools_outputs] == [1, 2]
+        assert [output.get("repeat") for output in tools_outputs] == [1, 2]
+
+    async def cancel_listener(self):
+        filepath = os.path.normpath(
+            os.path.join(
+                os.path.dirname(__file__), "../../monitor/listeners/listener_host.py"
+            )
+        )
+        runtime = Runtime(workers=1)
+        runtime.register(filepath)
+
+        try:
+            await asyncio.wait_for(runtime.call(filepath, {"duration": "30"}), 0.5)
+        except asyncio.TimeoutError:
+            pass
+
+        begin = time.monotonic()
+        await runtime.call(filepath, {"duration": "0.2"})
+        return time.monotonic() - begin
+
+    def test_runtime_cancel(self):
+        """Cancelling a resident call stops the tool,
+        releasing its worker thread to the next call
+        """
+        elapsed = asyncio.run(self.cancel_listener())
+        assert elapsed < 2
+
     async def run_listeners(self):
         folder_path = os.path.join(os.path.dirname(__file__), "../../monitor/listeners")
 
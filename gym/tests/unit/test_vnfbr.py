@@ -1,12 +1,15 @@
 import unittest
 import os
 import json
+import math
 import logging
 
-
+import numpy
+import pandas as pd
+import pytest
 from google.protobuf import json_format
 
-from gym.common.vnfbr import VNFBR
+from gym.common.vnfbr import VNFBR, Inputs, Summaries
 
 
 LOCAL_FOLDER = os.path.abspath(os.path.dirname(__file__))
@@ -60,6 +63,59 @@ class TestVNFBR(unittest.TestCase):
         print(len(all_instances))
         assert len(all_instances) == 8
 
+    def test_count(self):
+        vnfbr_data = load_file("vnf-br-003.json")
+
+        vnfbr = VNFBR()
+        vnfbr.parse(vnfbr_data)
+
+        assert vnfbr.count() == 8
+        assert len(vnfbr.preview(3)) == 3
+        assert len(vnfbr.preview(20)) == 8
+
+    def test_inputs_bound(self):
+        inputs = Inputs()
+        unique_inputs = inputs.multiplex({"a": [1, 2, 3], "b": "x"})
+        first = next(unique_inputs)
+
+        assert inputs.count({"c": [1, 2], "b": "y"}) == 2
+        list(inputs.multiplex({"c": [1, 2], "b": "y"}))
+
+        rest = list(unique_inputs)
+        assert [first] + rest == [{"a": a, "b": "x"} for a in [1, 2, 3]]
+
+    def test_instances_template(self):
+        vnfbr_data = load_file("vnf-br-003.json")
+
+        vnfbr = VNFBR()
+        vnfbr.parse(vnfbr_data)
+
+        template = vnfbr.template()
+        all_instances = list(vnfbr.instances())
+        assert len(all_instances) == 8
+        assert vnfbr.template() is template
+
+        vcpus = set()
+        for vnfbd in all_instances:
+            inputs = vnfbd.inputs()
+            vnfbd_dict = vnfbd.dictionary()
+            d2 = vnfbd_dict["scenario"]["nodes"]["d2"]
+            assert d2["resources"]["cpu"]["vcpus"] == int(
+                inputs["vnf_vcpu"]["values"]
+            )
+            vcpus.add(d2["resources"]["cpu"]["vcpus"])
+
+        assert vcpus == {2, 4}
+
+        invalid = {
+            "vnf_vcpu": {
+                "name": "vnf_vcpu",
+                "path": "/scenario/nodes[id='d2']/resources/cpu/vcpus",
+                "values": "two",
+            }
+        }
+        assert template.instance(invalid) is None
+
     def test_save(self):
         vnfbr_data = load_file("vnfbr-001.json")
 
@@ -76,6 +132,85 @@ class TestVNFBR(unittest.TestCase):
         vnfbr_df = vnfbr.dataframe(save=True)
         print(vnfbr_df.info())
 
+    def test_series_columns(self):
+        series = {
+            str(key): {"key": str(key), "value": str(value)}
+            for key, value in enumerate([1.0, 2.0, 4.0])
+        }
+        columns = {"keys": [0.0, 1.0, 2.0], "values": [1.0, 2.0, 4.0]}
+        evaluations = {
+            "1": {
+                "source": {"type": "listener", "name": "host"},
+                "instance": 1,
+                "repeat": 1,
+                "metrics": {
+                    "a": {"name": "a", "type": "float", "series": series},
+                    "b": {"name": "b", "type": "float", "columns": columns},
+                },
+            }
+        }
+
+        vnfbr = VNFBR()
+        metrics = vnfbr.extract_evaluations_metrics("monitor", "m1", evaluations)
+        summary = metrics[0]
+
+        for stat in ["count", "mean", "std", "min", "max"]:
+            assert summary["a_" + stat] == summary["b_" + stat]
+
+    def test_summaries(self):
+        series = {
+            "a": [1.0, 2.0, 4.0, 8.0, 16.0],
+            "b": [3.0],
+            "c": [1.0, float("nan"), 2.0, 5.0],
+            "d": [float("nan"), float("nan")],
+            "e": [7, 1, 3],
+        }
+
+        summaries = Summaries()
+        metrics = {}
+        for name, values in series.items():
+            dtype = int if name == "e" else float
+            summaries.add(metrics, name, numpy.asarray(values, dtype=dtype))
+        summaries.compute()
+
+        for name, values in series.items():
+            expected = pd.Series(values, dtype=float).describe()
+
+            for stat, value in expected.items():
+                computed = metrics["_".join([name, stat])]
+                if math.isnan(value):
+                    assert math.isnan(computed), (name, stat)
+                else:
+                    assert computed == pytest.approx(value), (name, stat)
+
+    def test_cross_join(self):
+        left = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+        right = pd.DataFrame({"b": [5, 6, 7], "c": [8, 9, 10]})
+
+        vnfbr = VNFBR()
+        joint = vnfbr.cross_join(left, right)
+
+        expected = left.drop(columns="b").merge(right, how="cross")
+        assert list(joint.columns) == ["a", "b", "c"]
+        pd.testing.assert_frame_equal(joint, expected[["a", "b", "c"]])
+
+    def test_frame_features(self):
+        snaps_metrics = [
+            [{"x": 1.0}, {"x": 2.0}],
+            [{"y": 3.0}, {"y": 4.0}, {"y": 5.0}],
+        ]
+        reports_metrics = [(1, {1: snaps_metrics, 2: snaps_metrics[1:]})]
+
+        vnfbr = VNFBR()
+        frame = vnfbr.frame_features({"vcpus": 2, "x": 0.0}, reports_metrics)
+
+        assert list(frame.columns) == ["vcpus", "x", "trial", "y", "test"]
+        assert list(frame["trial"]) == [1] * 6 + [2] * 3
+        assert list(frame["x"]) == [1.0] * 3 + [2.0] * 3 + [0.0] * 3
+        assert list(frame["y"]) == [3.0, 4.0, 5.0] * 3
+        assert (frame["vcpus"] == 2).all()
+        assert (frame["test"] == 1).all()
+
 
 if __name__ == "__main__":
 